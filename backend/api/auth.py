@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
-from app.database import get_db_session
+from app.database import get_async_db_session
+from core.conditional import etag_matches, make_etag, not_modified, set_etag
 from core.permissions import AuthenticatedUser, get_current_user
 from schemas.auth import (
     AuthResponse,
@@ -20,11 +21,11 @@ from schemas.auth import (
 )
 from services.auth import (
     AuthServiceError,
-    get_user_profile,
-    login_user,
-    register_user,
-    send_password_reset,
-    update_password,
+    get_user_profile_async,
+    login_user_async,
+    register_user_async,
+    send_password_reset_async,
+    update_password_async,
 )
 
 router = APIRouter(prefix="/auth", tags=["auth"])
@@ -45,40 +46,53 @@ def _default_password_reset_redirect() -> str:
     status_code=status.HTTP_201_CREATED,
     response_model=AuthResponse,
 )
-def register(
+async def register(
     payload: RegisterRequest,
-    db: Session = Depends(get_db_session),
+    db: AsyncSession = Depends(get_async_db_session),
 ) -> AuthResponse:
     try:
-        return register_user(db=db, payload=payload)
+        return await register_user_async(db=db, payload=payload)
     except AuthServiceError as exc:
         raise _to_http_exception(exc) from exc
 
 
 @router.post("/login", response_model=AuthResponse)
-def login(
+async def login(
     payload: LoginRequest,
-    db: Session = Depends(get_db_session),
+    db: AsyncSession = Depends(get_async_db_session),
 ) -> AuthResponse:
     try:
-        return login_user(db=db, payload=payload)
+        return await login_user_async(db=db, payload=payload)
     except AuthServiceError as exc:
         raise _to_http_exception(exc) from exc
 
 
 @router.get("/me", response_model=UserResponse)
-def me(
+async def me(
+    request: Request,
+    response: Response,
     current_user: AuthenticatedUser = Depends(get_current_user),
-    db: Session = Depends(get_db_session),
-) -> UserResponse:
+    db: AsyncSession = Depends(get_async_db_session),
+) -> UserResponse | Response:
+    # Clients poll this on every screen focus. The principal carries the profile's
+    # updated_at, so an unchanged profile is answered without touching the database.
+    if current_user.updated_at is not None:
+        etag = make_etag("me", current_user.id, current_user.updated_at.isoformat())
+        if etag_matches(request, etag):
+            return not_modified(etag)
+
     try:
-        return UserResponse.model_validate(get_user_profile(db=db, user_id=current_user.id))
+        user = await get_user_profile_async(db=db, user_id=current_user.id)
     except AuthServiceError as exc:
         raise _to_http_exception(exc) from exc
 
+    etag = make_etag("me", user.id, user.updated_at.isoformat())
+    set_etag(response, etag)
+    return UserResponse.model_validate(user)
+
 
 @router.post("/password-reset", response_model=MessageResponse)
-def password_reset(payload: PasswordResetRequest) -> MessageResponse:
+async def password_reset(payload: PasswordResetRequest) -> MessageResponse:
     request_payload = payload
     if payload.redirect_to is None:
         request_payload = PasswordResetRequest(
@@ -87,13 +101,13 @@ def password_reset(payload: PasswordResetRequest) -> MessageResponse:
         )
 
     try:
-        return send_password_reset(request_payload)
+        return await send_password_reset_async(request_payload)
     except AuthServiceError as exc:
         raise _to_http_exception(exc) from exc
 
 
 @router.post("/password-update", response_model=MessageResponse)
-def password_update(
+async def password_update(
     payload: PasswordUpdateRequest,
     credentials: HTTPAuthorizationCredentials | None = Depends(http_bearer),
 ) -> MessageResponse:
@@ -104,6 +118,6 @@ def password_update(
         )
 
     try:
-        return update_password(access_token=credentials.credentials, payload=payload)
+        return await update_password_async(access_token=credentials.credentials, payload=payload)
     except AuthServiceError as exc:
         raise _to_http_exception(exc) from exc
@@ -0,0 +1,21 @@
+"""Operational metrics API routes."""
+
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends
+
+from core.permissions import AuthenticatedUser, get_current_user, require_role
+from models.enums import UserRole
+from schemas.metrics import MetricsResponse
+from services.metrics import collect_metrics
+
+router = APIRouter(prefix="/metrics", tags=["metrics"])
+
+
+@router.get("", response_model=MetricsResponse)
+@require_role([UserRole.ADMIN])
+def get_metrics(
+    current_user: AuthenticatedUser = Depends(get_current_user),
+) -> MetricsResponse:
+    _ = current_user
+    return collect_metrics()
@@ -2,18 +2,27 @@
 
 from __future__ import annotations
 
+from typing import Literal
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db_session
+from app.database import get_async_db_session, get_async_read_db_session
+from core.conditional import etag_matches, make_etag, not_modified, set_etag
 from core.permissions import AuthenticatedUser, get_current_user, require_role
 from models.enums import UserRole
 from schemas.users import (
     AdminOverviewResponse,
+    AuthSyncBacklogResponse,
+    BulkCoachAssignmentRequest,
+    BulkCoachAssignmentResponse,
+    BulkUserCreateRequest,
+    BulkUserCreateResponse,
     CoachAssignmentRequest,
     CoachAssignmentResponse,
+    CoachRebalanceRequest,
+    CoachRebalanceResponse,
     PaginatedUsersResponse,
     UserCreateRequest,
     UserDetailResponse,
@@ -21,16 +30,22 @@ from schemas.users import (
     UserResponse,
     UserUpdateRequest,
 )
+from services.auth_sync import get_auth_sync_backlog_async
 from services.users import (
     UserServiceError,
-    assign_coaches_to_user,
-    create_user,
-    deactivate_user,
-    get_admin_overview,
-    get_user_detail,
-    list_users,
-    remove_coach_assignment,
-    update_user,
+    assign_coaches_to_user_async,
+    bulk_assign_coaches_async,
+    bulk_create_users_async,
+    create_user_async,
+    deactivate_user_async,
+    get_admin_overview_async,
+    get_user_detail_async,
+    get_user_detail_version_async,
+    get_user_list_version_async,
+    list_users_async,
+    rebalance_coach_assignments_async,
+    remove_coach_assignment_async,
+    update_user_async,
 )
 
 router = APIRouter(prefix="/users", tags=["users"])
@@ -40,12 +55,23 @@ def _to_http_exception(exc: UserServiceError) -> HTTPException:
     return HTTPException(status_code=exc.status_code, detail=exc.detail)
 
 
+def _user_detail_etag(user_id: UUID, version: tuple[object, ...]) -> str:
+    # Coach assignments do not touch users.updated_at, so the coaches are versioned too.
+    return make_etag("user", user_id, *version)
+
+
+def _user_page_etag(query: UserListQuery, version: tuple[object, ...]) -> str:
+    return make_etag("users", query.model_dump_json(), *version)
+
+
 def _list_query_params(
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=10, ge=1, le=100),
     role: UserRole | None = None,
     search: str | None = Query(default=None, max_length=320),
     is_active: bool | None = None,
+    cursor: str | None = Query(default=None, max_length=512),
+    count: Literal["exact", "estimated", "none"] = "exact",
 ) -> UserListQuery:
     return UserListQuery(
         page=page,
@@ -53,49 +79,80 @@ def _list_query_params(
         role=role,
         search=search,
         is_active=is_active,
+        cursor=cursor,
+        count=count,
     )
 
 
 @router.get("/overview", response_model=AdminOverviewResponse)
 @require_role([UserRole.ADMIN])
-def overview(
-    db: Session = Depends(get_db_session),
+async def overview(
+    db: AsyncSession = Depends(get_async_read_db_session),
     current_user: AuthenticatedUser = Depends(get_current_user),
 ) -> AdminOverviewResponse:
     _ = current_user
     try:
-        return get_admin_overview(db)
+        return await get_admin_overview_async(db)
     except UserServiceError as exc:
         raise _to_http_exception(exc) from exc
 
 
+@router.get("/auth-sync/backlog", response_model=AuthSyncBacklogResponse)
+@require_role([UserRole.ADMIN])
+async def auth_sync_backlog(
+    db: AsyncSession = Depends(get_async_db_session),
+    current_user: AuthenticatedUser = Depends(get_current_user),
+) -> AuthSyncBacklogResponse:
+    _ = current_user
+    return await get_auth_sync_backlog_async(db)
+
+
 @router.get("", response_model=PaginatedUsersResponse)
 @require_role([UserRole.ADMIN])
-def get_users(
+async def get_users(
+    request: Request,
+    response: Response,
     query: UserListQuery = Depends(_list_query_params),
-    db: Session = Depends(get_db_session),
+    db: AsyncSession = Depends(get_async_read_db_session),
     current_user: AuthenticatedUser = Depends(get_current_user),
-) -> PaginatedUsersResponse:
+) -> PaginatedUsersResponse | Response:
     _ = current_user
     try:
-        return list_users(db=db, query=query)
+        # Two aggregates decide a revalidation; the page itself is only built on a miss.
+        etag = _user_page_etag(query, await get_user_list_version_async(db=db, query=query))
+        if etag_matches(request, etag):
+            return not_modified(etag)
+        page = await list_users_async(db=db, query=query)
     except UserServiceError as exc:
         raise _to_http_exception(exc) from exc
 
+    set_etag(response, etag)
+    return page
+
 
 @router.get("/{user_id}", response_model=UserDetailResponse)
 @require_role([UserRole.ADMIN])
-def get_user(
+async def get_user(
     user_id: UUID,
-    db: Session = Depends(get_db_session),
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_read_db_session),
     current_user: AuthenticatedUser = Depends(get_current_user),
-) -> UserDetailResponse:
+) -> UserDetailResponse | Response:
     _ = current_user
     try:
-        return get_user_detail(db=db, user_id=user_id)
+        etag = _user_detail_etag(
+            user_id, await get_user_detail_version_async(db=db, user_id=user_id)
+        )
+        if etag_matches(request, etag):
+            return not_modified(etag)
+        detail = await get_user_detail_async(db=db, user_id=user_id)
     except UserServiceError as exc:
         raise _to_http_exception(exc) from exc
 
+    set_etag(response, etag)
+    return detail
+
 
 @router.post(
     "",
@@ -103,56 +160,104 @@ def get_user(
     response_model=UserResponse,
 )
 @require_role([UserRole.ADMIN])
-def post_user(
+async def post_user(
     payload: UserCreateRequest,
-    db: Session = Depends(get_db_session),
+    db: AsyncSession = Depends(get_async_db_session),
     current_user: AuthenticatedUser = Depends(get_current_user),
 ) -> UserResponse:
     _ = current_user
     try:
-        return create_user(db=db, payload=payload)
+        return await create_user_async(db=db, payload=payload)
+    except UserServiceError as exc:
+        raise _to_http_exception(exc) from exc
+
+
+@router.post("/bulk", response_model=BulkUserCreateResponse)
+@require_role([UserRole.ADMIN])
+async def post_users_bulk(
+    payload: BulkUserCreateRequest,
+    db: AsyncSession = Depends(get_async_db_session),
+    current_user: AuthenticatedUser = Depends(get_current_user),
+) -> BulkUserCreateResponse:
+    _ = current_user
+    try:
+        return await bulk_create_users_async(db=db, payloads=payload.users)
     except UserServiceError as exc:
         raise _to_http_exception(exc) from exc
 
 
 @router.put("/{user_id}", response_model=UserResponse)
 @require_role([UserRole.ADMIN])
-def put_user(
+async def put_user(
     user_id: UUID,
     payload: UserUpdateRequest,
-    db: Session = Depends(get_db_session),
+    db: AsyncSession = Depends(get_async_db_session),
     current_user: AuthenticatedUser = Depends(get_current_user),
 ) -> UserResponse:
     _ = current_user
     try:
-        return update_user(db=db, user_id=user_id, payload=payload)
+        return await update_user_async(db=db, user_id=user_id, payload=payload)
     except UserServiceError as exc:
         raise _to_http_exception(exc) from exc
 
 
 @router.delete("/{user_id}", response_model=UserResponse)
 @require_role([UserRole.ADMIN])
-def delete_user(
+async def delete_user(
     user_id: UUID,
-    db: Session = Depends(get_db_session),
+    db: AsyncSession = Depends(get_async_db_session),
     current_user: AuthenticatedUser = Depends(get_current_user),
 ) -> UserResponse:
     try:
-        return deactivate_user(db=db, user_id=user_id, actor_user_id=current_user.id)
+        return await deactivate_user_async(db=db, user_id=user_id, actor_user_id=current_user.id)
+    except UserServiceError as exc:
+        raise _to_http_exception(exc) from exc
+
+
+@router.post("/coaches/bulk", response_model=BulkCoachAssignmentResponse)
+@require_role([UserRole.ADMIN])
+async def post_bulk_coach_assignments(
+    payload: BulkCoachAssignmentRequest,
+    db: AsyncSession = Depends(get_async_db_session),
+    current_user: AuthenticatedUser = Depends(get_current_user),
+) -> BulkCoachAssignmentResponse:
+    try:
+        return await bulk_assign_coaches_async(
+            db=db,
+            items=payload.items,
+            assigned_by_user_id=current_user.id,
+        )
+    except UserServiceError as exc:
+        raise _to_http_exception(exc) from exc
+
+
+@router.post("/coaches/rebalance", response_model=CoachRebalanceResponse)
+@require_role([UserRole.ADMIN])
+async def post_coach_rebalance(
+    payload: CoachRebalanceRequest,
+    db: AsyncSession = Depends(get_async_db_session),
+    current_user: AuthenticatedUser = Depends(get_current_user),
+) -> CoachRebalanceResponse:
+    try:
+        return await rebalance_coach_assignments_async(
+            db=db,
+            request=payload,
+            assigned_by_user_id=current_user.id,
+        )
     except UserServiceError as exc:
         raise _to_http_exception(exc) from exc
 
 
 @router.post("/{user_id}/coaches", response_model=CoachAssignmentResponse)
 @require_role([UserRole.ADMIN])
-def post_user_coaches(
+async def post_user_coaches(
     user_id: UUID,
     payload: CoachAssignmentRequest,
-    db: Session = Depends(get_db_session),
+    db: AsyncSession = Depends(get_async_db_session),
     current_user: AuthenticatedUser = Depends(get_current_user),
 ) -> CoachAssignmentResponse:
     try:
-        return assign_coaches_to_user(
+        return await assign_coaches_to_user_async(
             db=db,
             user_id=user_id,
             coach_ids=payload.coach_ids,
@@ -164,14 +269,14 @@ def post_user_coaches(
 
 @router.delete("/{user_id}/coaches/{coach_id}", response_model=CoachAssignmentResponse)
 @require_role([UserRole.ADMIN])
-def delete_user_coach(
+async def delete_user_coach(
     user_id: UUID,
     coach_id: UUID,
-    db: Session = Depends(get_db_session),
+    db: AsyncSession = Depends(get_async_db_session),
     current_user: AuthenticatedUser = Depends(get_current_user),
 ) -> CoachAssignmentResponse:
     _ = current_user
     try:
-        return remove_coach_assignment(db=db, user_id=user_id, coach_id=coach_id)
+        return await remove_coach_assignment_async(db=db, user_id=user_id, coach_id=coach_id)
     except UserServiceError as exc:
         raise _to_http_exception(exc) from exc
@@ -1 +1,180 @@
 """Workout library API routes."""
+
+from __future__ import annotations
+
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import get_async_db_session, get_async_read_db_session
+from core.conditional import etag_matches, make_etag, not_modified, set_etag
+from core.permissions import AuthenticatedUser, get_current_user, require_role
+from models.enums import UserRole, WorkoutType
+from schemas.workouts import (
+    WorkoutAlternativesResponse,
+    WorkoutArchiveRequest,
+    WorkoutArchiveResponse,
+    WorkoutBrowseQuery,
+    WorkoutBrowseResponse,
+    WorkoutCatalogResponse,
+    WorkoutSearchQuery,
+    WorkoutSearchResponse,
+)
+from services.workout_catalog import (
+    MAX_SWAP_ALTERNATIVES,
+    browse_workouts_async,
+    find_swap_alternatives_async,
+    get_workout_catalog_async,
+    workout_catalog_cache,
+)
+from services.workouts import WorkoutServiceError, archive_workouts_async, search_workouts_async
+
+router = APIRouter(prefix="/workouts", tags=["workouts"])
+
+
+def _to_http_exception(exc: WorkoutServiceError) -> HTTPException:
+    return HTTPException(status_code=exc.status_code, detail=exc.detail)
+
+
+def _search_query_params(
+    q: str = Query(min_length=1, max_length=200),
+    page: int = Query(default=1, ge=1),
+    page_size: int = Query(default=20, ge=1, le=100),
+    type: WorkoutType | None = None,
+    cardio_type_id: UUID | None = None,
+    muscle_group_id: UUID | None = None,
+    is_archived: bool | None = False,
+) -> WorkoutSearchQuery:
+    try:
+        return WorkoutSearchQuery(
+            q=q,
+            page=page,
+            page_size=page_size,
+            type=type,
+            cardio_type_id=cardio_type_id,
+            muscle_group_id=muscle_group_id,
+            is_archived=is_archived,
+        )
+    except ValidationError as exc:
+        # Report schema-level rejections (e.g. punctuation-only `q`) as a normal 422.
+        raise RequestValidationError(
+            [
+                {**error, "loc": ("query", *error["loc"])}
+                for error in exc.errors(include_url=False, include_context=False)
+            ]
+        ) from exc
+
+
+def _browse_query_params(
+    page: int = Query(default=1, ge=1),
+    page_size: int = Query(default=20, ge=1, le=100),
+    type: WorkoutType | None = None,
+    cardio_type_id: UUID | None = None,
+    muscle_group_id: UUID | None = None,
+    is_archived: bool | None = False,
+) -> WorkoutBrowseQuery:
+    return WorkoutBrowseQuery(
+        page=page,
+        page_size=page_size,
+        type=type,
+        cardio_type_id=cardio_type_id,
+        muscle_group_id=muscle_group_id,
+        is_archived=is_archived,
+    )
+
+
+@router.get("/catalog", response_model=WorkoutCatalogResponse)
+async def get_catalog(
+    request: Request,
+    response: Response,
+    include_archived: bool = False,
+    db: AsyncSession = Depends(get_async_read_db_session),
+    current_user: AuthenticatedUser = Depends(get_current_user),
+) -> WorkoutCatalogResponse | Response:
+    _ = current_user
+    catalog = await get_workout_catalog_async(db)
+
+    # The catalog version moves on every library write, so it alone identifies the body.
+    etag = make_etag("workout-catalog", catalog.version, include_archived)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    set_etag(response, etag)
+
+    workouts = catalog.workouts if include_archived else catalog.active_workouts()
+    return WorkoutCatalogResponse.model_validate(
+        {
+            "version": catalog.version,
+            "muscle_groups": catalog.muscle_groups,
+            "cardio_types": catalog.cardio_types,
+            "workouts": workouts,
+        },
+        from_attributes=True,
+    )
+
+
+@router.get("/search", response_model=WorkoutSearchResponse)
+async def search(
+    query: WorkoutSearchQuery = Depends(_search_query_params),
+    db: AsyncSession = Depends(get_async_read_db_session),
+    current_user: AuthenticatedUser = Depends(get_current_user),
+) -> WorkoutSearchResponse:
+    _ = current_user
+    return await search_workouts_async(db, query)
+
+
+@router.get("/browse", response_model=WorkoutBrowseResponse)
+async def browse(
+    request: Request,
+    response: Response,
+    query: WorkoutBrowseQuery = Depends(_browse_query_params),
+    db: AsyncSession = Depends(get_async_read_db_session),
+    current_user: AuthenticatedUser = Depends(get_current_user),
+) -> WorkoutBrowseResponse | Response:
+    _ = current_user
+    page = await browse_workouts_async(db, query)
+
+    etag = make_etag("workout-browse", page.version, *query.model_dump().values())
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    set_etag(response, etag)
+    return page
+
+
+@router.get("/alternatives/{workout_id}", response_model=WorkoutAlternativesResponse)
+async def alternatives(
+    workout_id: UUID,
+    request: Request,
+    response: Response,
+    limit: int = Query(default=10, ge=1, le=MAX_SWAP_ALTERNATIVES),
+    db: AsyncSession = Depends(get_async_read_db_session),
+    current_user: AuthenticatedUser = Depends(get_current_user),
+) -> WorkoutAlternativesResponse | Response:
+    _ = current_user
+    try:
+        result = await find_swap_alternatives_async(db, workout_id, limit)
+    except WorkoutServiceError as exc:
+        raise _to_http_exception(exc) from exc
+
+    etag = make_etag("workout-alternatives", result.version, workout_id, limit)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    set_etag(response, etag)
+    return result
+
+
+@router.post("/archive", response_model=WorkoutArchiveResponse)
+@require_role([UserRole.ADMIN])
+async def archive(
+    payload: WorkoutArchiveRequest,
+    db: AsyncSession = Depends(get_async_db_session),
+    current_user: AuthenticatedUser = Depends(get_current_user),
+) -> WorkoutArchiveResponse:
+    _ = current_user
+    result = await archive_workouts_async(db, payload.workout_ids)
+    if result.archived_count:
+        # This worker sees its own write on the next read instead of after the probe interval.
+        workout_catalog_cache.invalidate()
+    return result
@@ -3,19 +3,75 @@
 from __future__ import annotations
 
 from functools import cached_property
+from typing import Literal
 
 from pydantic import AnyHttpUrl, Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
+from sqlalchemy.engine import make_url
 
 
 class Settings(BaseSettings):
     app_env: str = Field(default="development", alias="APP_ENV")
     app_name: str = "GamataFitness API"
     database_url: str = Field(alias="DATABASE_URL")
+    database_replica_url: str | None = Field(default=None, alias="DATABASE_REPLICA_URL")
+    database_read_your_writes_seconds: int = Field(
+        default=5, ge=0, alias="DATABASE_READ_YOUR_WRITES_SECONDS"
+    )
     supabase_url: AnyHttpUrl = Field(alias="SUPABASE_URL")
     supabase_anon_key: str = Field(alias="SUPABASE_ANON_KEY")
     supabase_service_role_key: str = Field(alias="SUPABASE_SERVICE_ROLE_KEY")
     cors_allowed_origins: str = Field(alias="CORS_ALLOWED_ORIGINS")
+    db_pool_size: int = Field(default=5, ge=1, alias="DB_POOL_SIZE")
+    db_max_overflow: int = Field(default=10, ge=0, alias="DB_MAX_OVERFLOW")
+    db_pool_timeout_seconds: float = Field(default=30, gt=0, alias="DB_POOL_TIMEOUT_SECONDS")
+    db_pool_recycle_seconds: int = Field(default=1800, ge=-1, alias="DB_POOL_RECYCLE_SECONDS")
+    db_pool_pre_ping: Literal["always", "idle", "never"] = Field(
+        default="idle", alias="DB_POOL_PRE_PING"
+    )
+    db_pool_pre_ping_idle_seconds: int = Field(
+        default=30, ge=0, alias="DB_POOL_PRE_PING_IDLE_SECONDS"
+    )
+    supabase_jwt_secret: str | None = Field(default=None, alias="SUPABASE_JWT_SECRET")
+    auth_jwt_verification: Literal["local", "remote"] = Field(
+        default="local", alias="AUTH_JWT_VERIFICATION"
+    )
+    auth_jwt_remote_fallback: bool = Field(default=True, alias="AUTH_JWT_REMOTE_FALLBACK")
+    auth_jwt_audience: str = Field(default="authenticated", alias="AUTH_JWT_AUDIENCE")
+    auth_jwt_leeway_seconds: int = Field(default=30, ge=0, alias="AUTH_JWT_LEEWAY_SECONDS")
+    auth_jwks_refresh_seconds: int = Field(default=600, ge=30, alias="AUTH_JWKS_REFRESH_SECONDS")
+    auth_verification_max_workers: int = Field(
+        default=8, ge=1, alias="AUTH_VERIFICATION_MAX_WORKERS"
+    )
+    auth_principal_cache_ttl_seconds: int = Field(
+        default=30, ge=0, alias="AUTH_PRINCIPAL_CACHE_TTL_SECONDS"
+    )
+    auth_principal_cache_max_entries: int = Field(
+        default=10_000, ge=0, alias="AUTH_PRINCIPAL_CACHE_MAX_ENTRIES"
+    )
+    auth_rejected_token_ttl_seconds: int = Field(
+        default=60, ge=0, alias="AUTH_REJECTED_TOKEN_TTL_SECONDS"
+    )
+    auth_provider_breaker_failure_threshold: int = Field(
+        default=5, ge=1, alias="AUTH_PROVIDER_BREAKER_FAILURE_THRESHOLD"
+    )
+    auth_provider_breaker_recovery_seconds: int = Field(
+        default=30, ge=1, alias="AUTH_PROVIDER_BREAKER_RECOVERY_SECONDS"
+    )
+    user_provisioning_concurrency: int = Field(
+        default=8, ge=1, alias="USER_PROVISIONING_CONCURRENCY"
+    )
+    workout_catalog_probe_seconds: float = Field(
+        default=1.0, ge=0, alias="WORKOUT_CATALOG_PROBE_SECONDS"
+    )
+    auth_sync_worker_enabled: bool = Field(default=True, alias="AUTH_SYNC_WORKER_ENABLED")
+    auth_sync_batch_size: int = Field(default=50, ge=1, alias="AUTH_SYNC_BATCH_SIZE")
+    auth_sync_poll_seconds: float = Field(default=2.0, gt=0, alias="AUTH_SYNC_POLL_SECONDS")
+    auth_sync_max_attempts: int = Field(default=10, ge=1, alias="AUTH_SYNC_MAX_ATTEMPTS")
+    auth_sync_backoff_seconds: float = Field(default=5.0, gt=0, alias="AUTH_SYNC_BACKOFF_SECONDS")
+    auth_sync_backoff_max_seconds: float = Field(
+        default=900.0, gt=0, alias="AUTH_SYNC_BACKOFF_MAX_SECONDS"
+    )
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -32,6 +88,21 @@ class Settings(BaseSettings):
             raise ValueError("Supabase secrets must be non-empty.")
         return cleaned
 
+    @field_validator("supabase_jwt_secret")
+    @classmethod
+    def normalize_optional_secret(cls, value: str | None) -> str | None:
+        if value is None:
+            return None
+        cleaned = value.strip()
+        return cleaned or None
+
+    @field_validator("database_replica_url", mode="before")
+    @classmethod
+    def normalize_optional_database_url(cls, value: str | None) -> str | None:
+        if value is None or not str(value).strip():
+            return None
+        return cls.normalize_database_url(value)
+
     @field_validator("database_url")
     @classmethod
     def normalize_database_url(cls, value: str) -> str:
@@ -44,6 +115,24 @@ class Settings(BaseSettings):
             raise ValueError("DATABASE_URL must be a PostgreSQL connection URL.")
         return cleaned
 
+    @cached_property
+    def async_database_url(self) -> str:
+        return _to_asyncpg_url(self.database_url)
+
+    @cached_property
+    def async_database_replica_url(self) -> str | None:
+        if self.database_replica_url is None:
+            return None
+        return _to_asyncpg_url(self.database_replica_url)
+
+    @cached_property
+    def supabase_auth_issuer(self) -> str:
+        return f"{str(self.supabase_url).rstrip('/')}/auth/v1"
+
+    @cached_property
+    def supabase_jwks_url(self) -> str:
+        return f"{self.supabase_auth_issuer}/.well-known/jwks.json"
+
     @cached_property
     def cors_origins(self) -> list[str]:
         origins = [
@@ -56,4 +145,16 @@ class Settings(BaseSettings):
         return origins
 
 
+def _to_asyncpg_url(database_url: str) -> str:
+    url = make_url(database_url)
+    query = dict(url.query)
+    # asyncpg spells libpq's `sslmode` as `ssl`.
+    sslmode = query.pop("sslmode", None)
+    if sslmode is not None:
+        query["ssl"] = sslmode
+    return url.set(drivername="postgresql+asyncpg", query=query).render_as_string(
+        hide_password=False
+    )
+
+
 settings = Settings()
@@ -1,12 +1,22 @@
 """Database clients and session helpers."""
 
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
 
-from sqlalchemy import create_engine
+from fastapi import Request
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 from supabase import Client, create_client
 
 from app.config import settings
+from app.pooling import configure_engine_pool, engine_pool_options
+from app.read_routing import must_read_primary, recent_writers, request_user_id
 
 
 def get_supabase_admin_client() -> Client:
@@ -23,11 +33,35 @@ supabase_anon: Client = get_supabase_anon_client()
 # Backward-compatible alias used outside auth flows.
 supabase: Client = supabase_admin
 
-engine = create_engine(settings.database_url, pool_pre_ping=True, future=True)
+# Sync engine: migrations, scripts and tests.
+engine = create_engine(
+    settings.database_url, future=True, **engine_pool_options("primary", QueuePool)
+)
+configure_engine_pool(engine)
 SessionLocal = sessionmaker(
     bind=engine, autoflush=False, autocommit=False, expire_on_commit=False
 )
 
+# Async engine: request handlers, so DB waits do not occupy threadpool workers.
+async_engine = create_async_engine(
+    settings.async_database_url, **engine_pool_options("primary_async", AsyncAdaptedQueuePool)
+)
+configure_engine_pool(async_engine.sync_engine)
+AsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
+# Optional read replica for GET handlers; falls back to the primary when unset.
+async_replica_engine: AsyncEngine | None = None
+AsyncReplicaSessionLocal = AsyncSessionLocal
+if settings.async_database_replica_url is not None:
+    async_replica_engine = create_async_engine(
+        settings.async_database_replica_url,
+        **engine_pool_options("replica_async", AsyncAdaptedQueuePool),
+    )
+    configure_engine_pool(async_replica_engine.sync_engine)
+    AsyncReplicaSessionLocal = async_sessionmaker(
+        bind=async_replica_engine, autoflush=False, expire_on_commit=False
+    )
+
 
 def get_db_session() -> Generator[Session, None, None]:
     session = SessionLocal()
@@ -35,3 +69,21 @@ def get_db_session() -> Generator[Session, None, None]:
         yield session
     finally:
         session.close()
+
+
+async def get_async_db_session(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    async with AsyncSessionLocal() as session:
+        user_id = request_user_id(request)
+        if user_id is not None:
+            event.listen(
+                session.sync_session, "after_commit", lambda _: recent_writers.mark(user_id)
+            )
+        yield session
+
+
+async def get_async_read_db_session(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """Session for read-only handlers; uses the replica unless the caller needs its own writes."""
+
+    session_factory = AsyncSessionLocal if must_read_primary(request) else AsyncReplicaSessionLocal
+    async with session_factory() as session:
+        yield session
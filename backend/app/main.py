@@ -1,15 +1,36 @@
 """FastAPI application entrypoint."""
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from api.auth import router as auth_router
+from api.metrics import router as metrics_router
 from api.users import router as users_router
+from api.workouts import router as workouts_router
 from app.config import settings
 from app.database import supabase
 from core.permissions import JWTVerificationMiddleware
+from services.auth_sync import auth_sync_worker
+from services.token_verification import jwks_cache
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    if settings.auth_jwt_verification == "local":
+        jwks_cache.start_background_refresh()
+    if settings.auth_sync_worker_enabled:
+        auth_sync_worker.start()
+    try:
+        yield
+    finally:
+        auth_sync_worker.stop()
+        jwks_cache.stop_background_refresh()
+
 
-app = FastAPI(title=settings.app_name)
+app = FastAPI(title=settings.app_name, lifespan=lifespan)
 
 app.add_middleware(JWTVerificationMiddleware)
 
@@ -23,6 +44,8 @@ app.add_middleware(
 
 app.include_router(auth_router)
 app.include_router(users_router)
+app.include_router(workouts_router)
+app.include_router(metrics_router)
 
 
 @app.get("/health")
@@ -0,0 +1,147 @@
+"""Connection pool configuration and instrumentation."""
+
+from __future__ import annotations
+
+import bisect
+import logging
+import threading
+import time
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import DisconnectionError
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import Pool, QueuePool
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds (milliseconds) of the checkout latency histogram; the last bucket is +Inf.
+CHECKOUT_LATENCY_BUCKETS_MS: tuple[float, ...] = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000)
+
+
+class PoolMetrics:
+    """Checkout timing collected by an instrumented pool."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+        self.bucket_counts = [0] * (len(CHECKOUT_LATENCY_BUCKETS_MS) + 1)
+
+    def observe_checkout(self, seconds: float, *, timed_out: bool = False) -> None:
+        bucket = bisect.bisect_left(CHECKOUT_LATENCY_BUCKETS_MS, seconds * 1000)
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.wait_seconds_total += seconds
+            self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+            self.bucket_counts[bucket] += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            buckets = [
+                {"upper_bound_ms": upper_bound, "count": count}
+                for upper_bound, count in zip(
+                    (*CHECKOUT_LATENCY_BUCKETS_MS, None), self.bucket_counts
+                )
+            ]
+            return {
+                "checkouts": self.checkouts,
+                "checkout_timeouts": self.timeouts,
+                "checkout_wait_seconds_total": self.wait_seconds_total,
+                "checkout_wait_seconds_max": self.wait_seconds_max,
+                "checkout_latency_histogram": buckets,
+            }
+
+
+pool_metrics: dict[str, PoolMetrics] = {}
+
+
+def instrumented_pool_class(base: type[QueuePool], metrics: PoolMetrics) -> type[QueuePool]:
+    """Subclass `base` so every checkout is timed, including time spent queued."""
+
+    class InstrumentedPool(base):  # type: ignore[valid-type, misc]
+        def _do_get(self) -> Any:
+            started = time.perf_counter()
+            try:
+                connection = super()._do_get()
+            except PoolTimeoutError:
+                metrics.observe_checkout(time.perf_counter() - started, timed_out=True)
+                raise
+            metrics.observe_checkout(time.perf_counter() - started)
+            return connection
+
+    InstrumentedPool.__name__ = f"Instrumented{base.__name__}"
+    InstrumentedPool.__qualname__ = InstrumentedPool.__name__
+    return InstrumentedPool
+
+
+def engine_pool_options(name: str, base: type[QueuePool]) -> dict[str, Any]:
+    """Keyword arguments for `create_engine`/`create_async_engine` from settings."""
+
+    metrics = pool_metrics.setdefault(name, PoolMetrics(name))
+    return {
+        "poolclass": instrumented_pool_class(base, metrics),
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout_seconds,
+        "pool_recycle": settings.db_pool_recycle_seconds,
+        "pool_pre_ping": settings.db_pool_pre_ping == "always",
+    }
+
+
+def install_idle_pre_ping(engine: Engine, idle_seconds: float) -> None:
+    """Ping only connections that sat idle in the pool for at least `idle_seconds`.
+
+    Connections reused in quick succession skip the extra round trip that
+    `pool_pre_ping=True` would add to every checkout.
+    """
+
+    @event.listens_for(engine, "checkin")
+    def _record_checkin(dbapi_connection: Any, connection_record: Any) -> None:
+        connection_record.info["checked_in_at"] = time.monotonic()
+
+    @event.listens_for(engine, "checkout")
+    def _ping_if_idle(dbapi_connection: Any, connection_record: Any, proxy: Any) -> None:
+        checked_in_at = connection_record.info.get("checked_in_at")
+        if checked_in_at is None or time.monotonic() - checked_in_at < idle_seconds:
+            return
+
+        try:
+            cursor = dbapi_connection.cursor()
+            try:
+                cursor.execute("SELECT 1")
+            finally:
+                cursor.close()
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Discarding stale pooled connection: %s", exc)
+            # The pool invalidates this connection and retries checkout with a fresh one.
+            raise DisconnectionError() from exc
+
+
+def configure_engine_pool(engine: Engine) -> None:
+    if settings.db_pool_pre_ping == "idle":
+        install_idle_pre_ping(engine, float(settings.db_pool_pre_ping_idle_seconds))
+
+
+def pool_stats(name: str, pool: Pool) -> dict[str, Any]:
+    metrics = pool_metrics.get(name) or PoolMetrics(name)
+    stats: dict[str, Any] = {"name": name}
+    if isinstance(pool, QueuePool):
+        stats.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=pool.overflow(),
+            max_overflow=pool._max_overflow,
+        )
+    stats.update(metrics.snapshot())
+    return stats
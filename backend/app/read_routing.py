@@ -0,0 +1,64 @@
+"""Read-your-writes bookkeeping for replica routing."""
+
+from __future__ import annotations
+
+import threading
+import time
+from uuid import UUID
+
+from fastapi import Request
+
+from app.config import settings
+
+# Clients that write through one worker and read through another can force primary reads.
+READ_CONSISTENCY_HEADER = "x-read-consistency"
+
+
+class RecentWriters:
+    """Users who committed on this worker within the last `window_seconds`.
+
+    Their reads stay on the primary until the window lapses, so replica lag never
+    hides a write from the user who just made it.
+    """
+
+    def __init__(self, *, window_seconds: float) -> None:
+        self.window_seconds = window_seconds
+        self._written_at: dict[UUID, float] = {}
+        self._lock = threading.Lock()
+
+    def mark(self, user_id: UUID) -> None:
+        if self.window_seconds <= 0:
+            return
+        now = time.monotonic()
+        with self._lock:
+            self._written_at[user_id] = now
+            if len(self._written_at) > 1024:
+                self._prune(now)
+
+    def wrote_recently(self, user_id: UUID) -> bool:
+        with self._lock:
+            written_at = self._written_at.get(user_id)
+            return written_at is not None and time.monotonic() - written_at < self.window_seconds
+
+    def clear(self) -> None:
+        with self._lock:
+            self._written_at.clear()
+
+    def _prune(self, now: float) -> None:
+        cutoff = now - self.window_seconds
+        for user_id in [key for key, value in self._written_at.items() if value <= cutoff]:
+            del self._written_at[user_id]
+
+
+recent_writers = RecentWriters(window_seconds=float(settings.database_read_your_writes_seconds))
+
+
+def request_user_id(request: Request) -> UUID | None:
+    return getattr(request.state, "auth_token_user_id", None)
+
+
+def must_read_primary(request: Request) -> bool:
+    if request.headers.get(READ_CONSISTENCY_HEADER, "").strip().lower() == "primary":
+        return True
+    user_id = request_user_id(request)
+    return user_id is not None and recent_writers.wrote_recently(user_id)
@@ -0,0 +1,50 @@
+"""Conditional GET support: weak ETags and 304 Not Modified responses."""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Iterable
+
+from fastapi import Request, Response, status
+
+# Per-user resources: browsers and proxies must revalidate, and never share them.
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts: object) -> str:
+    """Weak ETag over the values that determine a representation (ids, `updated_at`, ...)."""
+
+    digest = hashlib.blake2b(digest_size=12)
+    for part in parts:
+        digest.update(str(part).encode("utf-8"))
+        digest.update(b"\x1f")
+    return f'W/"{digest.hexdigest()}"'
+
+
+def _opaque_tags(header: str) -> Iterable[str]:
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        yield candidate[2:] if candidate.startswith("W/") else candidate
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Weak comparison against `If-None-Match`, as RFC 9110 prescribes for GET."""
+
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    return etag.removeprefix("W/") in set(_opaque_tags(header))
+
+
+def not_modified(etag: str) -> Response:
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": CACHE_CONTROL},
+    )
+
+
+def set_etag(response: Response, etag: str) -> None:
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
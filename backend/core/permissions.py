@@ -4,19 +4,21 @@ from __future__ import annotations
 
 import inspect
 from dataclasses import dataclass
+from datetime import datetime
 from functools import wraps
 from typing import Any, Callable, Sequence
 from uuid import UUID
 
 from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from sqlalchemy.orm import Session
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import JSONResponse, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
 
-from app.database import get_db_session
+from app.database import get_async_db_session
 from models.enums import UserRole
-from services.auth import AuthServiceError, get_user_profile, verify_access_token
+from services.auth import AuthServiceError, get_user_profile_async, verify_access_token_async
+from services.principal_cache import principal_cache
 
 http_bearer = HTTPBearer(auto_error=False)
 
@@ -27,30 +29,52 @@ class AuthenticatedUser:
     email: str
     name: str
     role: UserRole
+    # Profile version the principal was loaded at; lets /auth/me revalidate without a query.
+    updated_at: datetime | None = None
 
 
-class JWTVerificationMiddleware(BaseHTTPMiddleware):
-    """Verifies bearer JWTs and stores token claims on request state."""
+class JWTVerificationMiddleware:
+    """Verifies bearer JWTs and stores token claims on request state.
 
-    async def dispatch(self, request: Request, call_next: Callable[..., Any]) -> Response:
-        request.state.auth_token_user_id = None
-        request.state.auth_token_email = None
+    Implemented as plain ASGI so responses (including streamed exports) pass through
+    untouched instead of being relayed through per-request tasks and memory streams.
+    """
 
-        token = _extract_bearer_token(request.headers.get("authorization"))
-        if token is None:
-            return await call_next(request)
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        state = scope.setdefault("state", {})
+        state["auth_token_user_id"] = None
+        state["auth_token_email"] = None
+
+        token = _extract_bearer_token(_get_header(scope, b"authorization"))
+        if token is not None:
+            try:
+                verified = await verify_access_token_async(token)
+            except AuthServiceError as exc:
+                response = JSONResponse(
+                    status_code=exc.status_code,
+                    content={"detail": exc.detail},
+                )
+                await response(scope, receive, send)
+                return
 
-        try:
-            verified = verify_access_token(token)
-        except AuthServiceError as exc:
-            return JSONResponse(
-                status_code=exc.status_code,
-                content={"detail": exc.detail},
-            )
+            state["auth_token_user_id"] = verified.user_id
+            state["auth_token_email"] = verified.email
+
+        await self.app(scope, receive, send)
 
-        request.state.auth_token_user_id = verified.user_id
-        request.state.auth_token_email = verified.email
-        return await call_next(request)
+
+def _get_header(scope: Scope, name: bytes) -> str | None:
+    for key, value in scope.get("headers", ()):
+        if key.lower() == name:
+            return value.decode("latin-1")
+    return None
 
 
 def _extract_bearer_token(raw_header: str | None) -> str | None:
@@ -70,7 +94,7 @@ def _extract_bearer_token(raw_header: str | None) -> str | None:
 
 async def get_current_user(
     request: Request,
-    db: Session = Depends(get_db_session),
+    db: AsyncSession = Depends(get_async_db_session),
     credentials: HTTPAuthorizationCredentials | None = Depends(http_bearer),
 ) -> AuthenticatedUser:
     token_user_id = getattr(request.state, "auth_token_user_id", None)
@@ -84,24 +108,31 @@ async def get_current_user(
             )
 
         try:
-            verified = verify_access_token(credentials.credentials)
+            verified = await verify_access_token_async(credentials.credentials)
         except AuthServiceError as exc:
             raise HTTPException(status_code=exc.status_code, detail=exc.detail) from exc
 
         token_user_id = verified.user_id
         token_email = verified.email
 
+    cached_user = principal_cache.get(token_user_id)
+    if cached_user is not None:
+        return cached_user
+
     try:
-        user = get_user_profile(db, token_user_id)
+        user = await get_user_profile_async(db, token_user_id)
     except AuthServiceError as exc:
         raise HTTPException(status_code=exc.status_code, detail=exc.detail) from exc
 
-    return AuthenticatedUser(
+    authenticated_user = AuthenticatedUser(
         id=user.id,
         email=user.email or token_email or "",
         name=user.name,
         role=user.role,
+        updated_at=user.updated_at,
     )
+    principal_cache.set(token_user_id, authenticated_user)
+    return authenticated_user
 
 
 def _normalize_roles(allowed_roles: Sequence[str | UserRole]) -> set[UserRole]:
@@ -2,8 +2,10 @@
 
 from models.base import Base
 from models.enums import PlanAssignmentStatus, SessionType, UserRole, WorkoutType
+from models.outbox import AuthSyncOutbox
 from models.plan import PlanAssignment, PlanDay, PlanDayWorkout, WorkoutPlan
 from models.session import ExerciseLog, WorkoutSession
+from models.stats import AdminOverviewStats, WorkoutCatalogVersion
 from models.user import CoachUserAssignment, User
 from models.workout import CardioType, MuscleGroup, Workout, WorkoutMuscleGroup
 
@@ -25,4 +27,7 @@ __all__ = [
     "PlanAssignment",
     "WorkoutSession",
     "ExerciseLog",
+    "AdminOverviewStats",
+    "AuthSyncOutbox",
+    "WorkoutCatalogVersion",
 ]
@@ -14,6 +14,7 @@ from sqlalchemy import (
 from sqlalchemy import Enum as SQLEnum
 from sqlalchemy import (
     ForeignKey,
+    Index,
     SmallInteger,
     String,
 )
@@ -84,6 +85,8 @@ class PlanDay(Base):
 
 class PlanDayWorkout(Base):
     __tablename__ = "plan_day_workouts"
+    # The primary key leads with plan_day_id; workout-side lookups need their own index.
+    __table_args__ = (Index("ix_plan_day_workouts_workout_id", "workout_id", "plan_day_id"),)
 
     plan_day_id: Mapped[UUID] = mapped_column(
         PGUUID(as_uuid=True),
@@ -102,6 +105,14 @@ class PlanDayWorkout(Base):
 
 class PlanAssignment(Base):
     __tablename__ = "plan_assignments"
+    __table_args__ = (
+        Index(
+            "ix_plan_assignments_active_plan_id",
+            "plan_id",
+            postgresql_where=text("status = 'active'"),
+            sqlite_where=text("status = 'active'"),
+        ),
+    )
 
     id: Mapped[UUID] = mapped_column(
         PGUUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()")
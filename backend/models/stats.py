@@ -0,0 +1,41 @@
+"""Denormalized counters and versions maintained by database triggers."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import BigInteger, CheckConstraint, DateTime, SmallInteger
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from models.base import Base
+
+
+class AdminOverviewStats(Base):
+    """Single row (id = 1) kept current by statement-level triggers on users/workouts."""
+
+    __tablename__ = "admin_overview_stats"
+    __table_args__ = (CheckConstraint("id = 1", name="admin_overview_stats_id_check"),)
+
+    id: Mapped[int] = mapped_column(SmallInteger, primary_key=True, default=1)
+    total_users: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    total_coaches: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    total_workouts: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    active_users: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    inactive_users: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now()
+    )
+
+
+class WorkoutCatalogVersion(Base):
+    """Single row (id = 1) bumped by statement-level triggers on every catalog table write."""
+
+    __tablename__ = "workout_catalog_version"
+    __table_args__ = (CheckConstraint("id = 1", name="workout_catalog_version_id_check"),)
+
+    id: Mapped[int] = mapped_column(SmallInteger, primary_key=True, default=1)
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False, default=1)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now()
+    )
@@ -14,6 +14,8 @@ from sqlalchemy import (
 from sqlalchemy import Enum as SQLEnum
 from sqlalchemy import (
     ForeignKey,
+    Index,
+    Integer,
     String,
     UniqueConstraint,
 )
@@ -27,6 +29,12 @@ from models.enums import UserRole, enum_values
 
 class User(TimestampMixin, Base):
     __tablename__ = "users"
+    __table_args__ = (
+        Index("ix_users_created_at_id", "created_at", "id"),
+        CheckConstraint(
+            "assigned_user_count >= 0", name="ck_users_assigned_user_count_non_negative"
+        ),
+    )
 
     id: Mapped[UUID] = mapped_column(
         PGUUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()")
@@ -48,6 +56,10 @@ class User(TimestampMixin, Base):
         index=True,
     )
     deactivated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+    # Maintained by the trg_coach_assignment_count trigger; only meaningful for coaches.
+    assigned_user_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
 
     coach_assignments: Mapped[list["CoachUserAssignment"]] = relationship(
         back_populates="coach",
@@ -9,10 +9,31 @@ from schemas.auth import (
     RegisterRequest,
     UserResponse,
 )
+from schemas.metrics import (
+    CacheStatsResponse,
+    CircuitBreakerStatsResponse,
+    DatabasePoolStatsResponse,
+    HistogramBucketResponse,
+    MetricsResponse,
+    RejectedTokenStatsResponse,
+)
 from schemas.users import (
     AdminOverviewResponse,
+    AuthSyncBacklogResponse,
+    AuthSyncOutboxEntryResponse,
+    BulkCoachAssignmentItem,
+    BulkCoachAssignmentItemResult,
+    BulkCoachAssignmentRequest,
+    BulkCoachAssignmentResponse,
+    BulkUserCreateItemResult,
+    BulkUserCreateRequest,
+    BulkUserCreateResponse,
     CoachAssignmentRequest,
     CoachAssignmentResponse,
+    CoachLoadResponse,
+    CoachRebalanceMove,
+    CoachRebalanceRequest,
+    CoachRebalanceResponse,
     CoachSummaryResponse,
     PaginatedUsersResponse,
     UserCreateRequest,
@@ -21,6 +42,25 @@ from schemas.users import (
     UserListQuery,
     UserUpdateRequest,
 )
+from schemas.workouts import (
+    BlockingPlanResponse,
+    CardioTypeResponse,
+    FacetCountResponse,
+    MuscleGroupResponse,
+    WorkoutAlternativeResponse,
+    WorkoutAlternativesResponse,
+    WorkoutArchiveItemResult,
+    WorkoutArchiveRequest,
+    WorkoutArchiveResponse,
+    WorkoutBrowseQuery,
+    WorkoutBrowseResponse,
+    WorkoutCatalogResponse,
+    WorkoutResponse,
+    WorkoutSearchItemResponse,
+    WorkoutSearchQuery,
+    WorkoutSearchResponse,
+    WorkoutTypeFacetResponse,
+)
 
 __all__ = [
     "AuthResponse",
@@ -30,8 +70,17 @@ __all__ = [
     "PasswordUpdateRequest",
     "RegisterRequest",
     "UserResponse",
+    "CacheStatsResponse",
+    "CircuitBreakerStatsResponse",
+    "DatabasePoolStatsResponse",
+    "HistogramBucketResponse",
+    "RejectedTokenStatsResponse",
+    "MetricsResponse",
     "UserCreateRequest",
     "UserUpdateRequest",
+    "BulkUserCreateRequest",
+    "BulkUserCreateItemResult",
+    "BulkUserCreateResponse",
     "UserListQuery",
     "UserListItemResponse",
     "PaginatedUsersResponse",
@@ -39,5 +88,32 @@ __all__ = [
     "CoachSummaryResponse",
     "CoachAssignmentRequest",
     "CoachAssignmentResponse",
+    "BulkCoachAssignmentItem",
+    "BulkCoachAssignmentRequest",
+    "BulkCoachAssignmentItemResult",
+    "BulkCoachAssignmentResponse",
+    "CoachRebalanceRequest",
+    "CoachRebalanceMove",
+    "CoachLoadResponse",
+    "CoachRebalanceResponse",
     "AdminOverviewResponse",
+    "AuthSyncOutboxEntryResponse",
+    "AuthSyncBacklogResponse",
+    "MuscleGroupResponse",
+    "CardioTypeResponse",
+    "WorkoutResponse",
+    "WorkoutCatalogResponse",
+    "WorkoutSearchQuery",
+    "WorkoutSearchItemResponse",
+    "WorkoutSearchResponse",
+    "WorkoutBrowseQuery",
+    "FacetCountResponse",
+    "WorkoutTypeFacetResponse",
+    "WorkoutBrowseResponse",
+    "WorkoutAlternativeResponse",
+    "WorkoutAlternativesResponse",
+    "WorkoutArchiveRequest",
+    "BlockingPlanResponse",
+    "WorkoutArchiveItemResult",
+    "WorkoutArchiveResponse",
 ]
@@ -0,0 +1,61 @@
+"""Pydantic schemas for operational metrics endpoints."""
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import BaseModel
+
+
+class CacheStatsResponse(BaseModel):
+    size: int
+    max_entries: int
+    ttl_seconds: float
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+
+
+class RejectedTokenStatsResponse(BaseModel):
+    size: int
+    ttl_seconds: float
+    hits: int
+
+
+class CircuitBreakerStatsResponse(BaseModel):
+    name: str
+    state: Literal["closed", "open", "half_open"]
+    consecutive_failures: int
+    failure_threshold: int
+    recovery_timeout_seconds: float
+    total_calls: int
+    total_failures: int
+    rejected_calls: int
+    times_opened: int
+
+
+class HistogramBucketResponse(BaseModel):
+    upper_bound_ms: float | None
+    count: int
+
+
+class DatabasePoolStatsResponse(BaseModel):
+    name: str
+    size: int
+    checked_in: int
+    checked_out: int
+    overflow: int
+    max_overflow: int
+    checkouts: int
+    checkout_timeouts: int
+    checkout_wait_seconds_total: float
+    checkout_wait_seconds_max: float
+    checkout_latency_histogram: list[HistogramBucketResponse]
+
+
+class MetricsResponse(BaseModel):
+    principal_cache: CacheStatsResponse
+    rejected_tokens: RejectedTokenStatsResponse
+    auth_provider_breaker: CircuitBreakerStatsResponse
+    database_pools: list[DatabasePoolStatsResponse]
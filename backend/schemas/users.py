@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from datetime import datetime
 from re import compile as re_compile
+from typing import Literal
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
@@ -37,6 +38,10 @@ class UserCreateRequest(BaseModel):
         return cleaned
 
 
+class BulkUserCreateRequest(BaseModel):
+    users: list[UserCreateRequest] = Field(min_length=1, max_length=500)
+
+
 class UserUpdateRequest(BaseModel):
     name: str | None = Field(default=None, min_length=1, max_length=255)
     email: str | None = Field(default=None, min_length=3, max_length=320)
@@ -69,6 +74,17 @@ class UserListQuery(BaseModel):
     role: UserRole | None = None
     search: str | None = Field(default=None, max_length=320)
     is_active: bool | None = None
+    # Opaque `next_cursor` from a previous page; when set, `page` is ignored.
+    cursor: str | None = Field(default=None, max_length=512)
+    count: Literal["exact", "estimated", "none"] = "exact"
+
+    @field_validator("cursor")
+    @classmethod
+    def normalize_cursor(cls, value: str | None) -> str | None:
+        if value is None:
+            return None
+        cleaned = value.strip()
+        return cleaned or None
 
     @field_validator("search")
     @classmethod
@@ -108,8 +124,23 @@ class PaginatedUsersResponse(BaseModel):
     items: list[UserListItemResponse]
     page: int
     page_size: int
-    total: int
-    total_pages: int
+    total: int | None
+    total_pages: int | None
+    total_is_estimate: bool = False
+    next_cursor: str | None = None
+
+
+class BulkUserCreateItemResult(BaseModel):
+    email: str
+    status: Literal["created", "failed"]
+    user: UserResponse | None = None
+    detail: str | None = None
+
+
+class BulkUserCreateResponse(BaseModel):
+    results: list[BulkUserCreateItemResult]
+    created_count: int
+    failed_count: int
 
 
 class UserDetailResponse(UserResponse):
@@ -125,6 +156,70 @@ class CoachAssignmentResponse(BaseModel):
     coaches: list[CoachSummaryResponse]
 
 
+class BulkCoachAssignmentItem(BaseModel):
+    user_id: UUID
+    coach_ids: list[UUID] = Field(default_factory=list)
+
+
+class BulkCoachAssignmentRequest(BaseModel):
+    items: list[BulkCoachAssignmentItem] = Field(min_length=1, max_length=1000)
+
+
+class BulkCoachAssignmentItemResult(BaseModel):
+    user_id: UUID
+    status: Literal["assigned", "unchanged", "failed"]
+    assigned_coach_ids: list[UUID] = []
+    detail: str | None = None
+
+
+class BulkCoachAssignmentResponse(BaseModel):
+    results: list[BulkCoachAssignmentItemResult]
+    assigned_count: int
+    failed_count: int
+
+
+class CoachRebalanceRequest(BaseModel):
+    source_coach_id: UUID | None = None
+    user_ids: list[UUID] = Field(default_factory=list, max_length=1000)
+    target_coach_ids: list[UUID] = Field(min_length=1, max_length=100)
+    dry_run: bool = False
+
+
+class CoachRebalanceMove(BaseModel):
+    user_id: UUID
+    from_coach_id: UUID | None = None
+    to_coach_id: UUID | None = None
+
+
+class CoachLoadResponse(BaseModel):
+    coach_id: UUID
+    assigned_user_count: int
+
+
+class CoachRebalanceResponse(BaseModel):
+    dry_run: bool
+    moves: list[CoachRebalanceMove]
+    coach_loads: list[CoachLoadResponse]
+    unplaced_user_ids: list[UUID] = []
+
+
+class AuthSyncOutboxEntryResponse(BaseModel):
+    id: int
+    user_id: UUID
+    fields: list[str]
+    attempts: int
+    next_attempt_at: datetime
+    last_error: str | None = None
+    created_at: datetime
+
+
+class AuthSyncBacklogResponse(BaseModel):
+    pending_count: int
+    failed_count: int
+    oldest_pending_at: datetime | None = None
+    entries: list[AuthSyncOutboxEntryResponse]
+
+
 class AdminOverviewResponse(BaseModel):
     total_users: int
     total_coaches: int
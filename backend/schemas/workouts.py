@@ -0,0 +1,157 @@
+"""Pydantic schemas for workout library endpoints."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from re import compile as re_compile
+from typing import Literal
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from models.enums import WorkoutType
+
+SEARCH_TERM_PATTERN = re_compile(r"[^\W_]+")
+
+
+class MuscleGroupResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    name: str
+    icon: str
+    is_default: bool
+
+
+class CardioTypeResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    name: str
+    description: str
+
+
+class WorkoutResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    name: str
+    description: str | None
+    instructions: str | None
+    type: WorkoutType
+    cardio_type_id: UUID | None
+    is_archived: bool
+    muscle_group_ids: list[UUID]
+    created_at: datetime
+    updated_at: datetime
+
+
+class WorkoutCatalogResponse(BaseModel):
+    version: int
+    muscle_groups: list[MuscleGroupResponse]
+    cardio_types: list[CardioTypeResponse]
+    workouts: list[WorkoutResponse]
+
+
+class WorkoutSearchQuery(BaseModel):
+    q: str = Field(min_length=1, max_length=200)
+    page: int = Field(default=1, ge=1)
+    page_size: int = Field(default=20, ge=1, le=100)
+    type: WorkoutType | None = None
+    cardio_type_id: UUID | None = None
+    muscle_group_id: UUID | None = None
+    is_archived: bool | None = False
+
+    @field_validator("q")
+    @classmethod
+    def validate_q(cls, value: str) -> str:
+        cleaned = value.strip()
+        if not SEARCH_TERM_PATTERN.search(cleaned):
+            raise ValueError("Search query must contain letters or digits.")
+        return cleaned
+
+
+class WorkoutSearchItemResponse(BaseModel):
+    id: UUID
+    name: str
+    description: str | None
+    type: WorkoutType
+    cardio_type_id: UUID | None
+    is_archived: bool
+    # ts_rank_cd score; higher means a closer match.
+    rank: float
+
+
+class WorkoutSearchResponse(BaseModel):
+    items: list[WorkoutSearchItemResponse]
+    page: int
+    page_size: int
+    total: int
+
+
+class WorkoutBrowseQuery(BaseModel):
+    page: int = Field(default=1, ge=1)
+    page_size: int = Field(default=20, ge=1, le=100)
+    type: WorkoutType | None = None
+    cardio_type_id: UUID | None = None
+    muscle_group_id: UUID | None = None
+    is_archived: bool | None = False
+
+
+class FacetCountResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    name: str
+    count: int
+
+
+class WorkoutTypeFacetResponse(BaseModel):
+    type: WorkoutType
+    count: int
+
+
+class WorkoutBrowseResponse(BaseModel):
+    version: int
+    items: list[WorkoutResponse]
+    page: int
+    page_size: int
+    total: int
+    # Each facet is counted with every other active filter applied but not its own, so
+    # the counts say how many results picking that value would give.
+    muscle_groups: list[FacetCountResponse]
+    cardio_types: list[FacetCountResponse]
+    types: list[WorkoutTypeFacetResponse]
+
+
+class WorkoutAlternativeResponse(BaseModel):
+    workout: WorkoutResponse
+    shared_muscle_group_count: int
+
+
+class WorkoutAlternativesResponse(BaseModel):
+    version: int
+    workout_id: UUID
+    items: list[WorkoutAlternativeResponse]
+
+
+class WorkoutArchiveRequest(BaseModel):
+    workout_ids: list[UUID] = Field(min_length=1, max_length=500)
+
+
+class BlockingPlanResponse(BaseModel):
+    id: UUID
+    name: str
+    active_assignment_count: int
+
+
+class WorkoutArchiveItemResult(BaseModel):
+    workout_id: UUID
+    status: Literal["archived", "unchanged", "blocked", "not_found"]
+    blocking_plans: list[BlockingPlanResponse] = []
+
+
+class WorkoutArchiveResponse(BaseModel):
+    results: list[WorkoutArchiveItemResult]
+    archived_count: int
+    blocked_count: int
@@ -0,0 +1 @@
+"""Operational commands, run from backend/ as `python -m scripts.<name>`."""
@@ -0,0 +1,24 @@
+"""Recompute the admin overview counters from the users and workouts tables.
+
+Usage (from backend/): python -m scripts.reconcile_overview_stats
+"""
+
+from __future__ import annotations
+
+import logging
+
+from app.database import SessionLocal
+from services.users import reconcile_admin_overview_stats
+
+logger = logging.getLogger(__name__)
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO)
+    with SessionLocal() as db:
+        counts = reconcile_admin_overview_stats(db)
+    logger.info("Admin overview counters reconciled: %s", counts.model_dump())
+
+
+if __name__ == "__main__":
+    main()
@@ -3,39 +3,99 @@
 from services.auth import (
     AuthServiceError,
     get_user_profile,
+    get_user_profile_async,
     login_user,
+    login_user_async,
     register_user,
+    register_user_async,
     send_password_reset,
+    send_password_reset_async,
     update_password,
+    update_password_async,
     verify_access_token,
+    verify_access_token_async,
+)
+from services.auth_sync import (
+    deliver_auth_sync_batch,
+    enqueue_auth_sync,
+    get_auth_sync_backlog,
+    get_auth_sync_backlog_async,
 )
 from services.users import (
     UserServiceError,
     assign_coaches_to_user,
+    assign_coaches_to_user_async,
+    bulk_assign_coaches,
+    bulk_assign_coaches_async,
+    bulk_create_users,
+    bulk_create_users_async,
     create_user,
+    create_user_async,
     deactivate_user,
+    deactivate_user_async,
     get_admin_overview,
+    get_admin_overview_async,
     get_user_detail,
+    get_user_detail_async,
+    get_user_detail_version,
+    get_user_detail_version_async,
+    get_user_list_version,
+    get_user_list_version_async,
     list_users,
+    list_users_async,
+    rebalance_coach_assignments,
+    rebalance_coach_assignments_async,
+    reconcile_admin_overview_stats,
     remove_coach_assignment,
+    remove_coach_assignment_async,
     update_user,
+    update_user_async,
 )
 
 __all__ = [
     "AuthServiceError",
     "get_user_profile",
+    "get_user_profile_async",
     "login_user",
+    "login_user_async",
     "register_user",
+    "register_user_async",
     "send_password_reset",
+    "send_password_reset_async",
     "update_password",
+    "update_password_async",
     "verify_access_token",
+    "verify_access_token_async",
+    "enqueue_auth_sync",
+    "deliver_auth_sync_batch",
+    "get_auth_sync_backlog",
+    "get_auth_sync_backlog_async",
     "UserServiceError",
     "list_users",
+    "list_users_async",
+    "get_user_list_version",
+    "get_user_list_version_async",
     "get_user_detail",
+    "get_user_detail_async",
+    "get_user_detail_version",
+    "get_user_detail_version_async",
     "create_user",
+    "create_user_async",
+    "bulk_create_users",
+    "bulk_create_users_async",
     "update_user",
+    "update_user_async",
     "deactivate_user",
+    "deactivate_user_async",
     "assign_coaches_to_user",
+    "assign_coaches_to_user_async",
+    "bulk_assign_coaches",
+    "bulk_assign_coaches_async",
+    "rebalance_coach_assignments",
+    "rebalance_coach_assignments_async",
     "remove_coach_assignment",
+    "remove_coach_assignment_async",
     "get_admin_overview",
+    "get_admin_overview_async",
+    "reconcile_admin_overview_stats",
 ]
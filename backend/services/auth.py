@@ -2,17 +2,39 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import select
+import jwt
+from sqlalchemy import (
+    ColumnElement,
+    Executable,
+    and_,
+    case,
+    exists,
+    false,
+    func,
+    literal_column,
+    or_,
+    select,
+    true,
+    type_coerce,
+    union_all,
+)
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from app.config import settings
 from app.database import supabase_admin, supabase_anon
 from models.enums import UserRole
+from models.outbox import AuthSyncOutbox
 from models.user import User
 from schemas.auth import (
     AuthResponse,
@@ -23,9 +45,27 @@ from schemas.auth import (
     RegisterRequest,
     UserResponse,
 )
+from services.circuit_breaker import CircuitOpenError, auth_provider_breaker, is_provider_failure
+from services.principal_cache import principal_cache
+from services.token_verification import (
+    LocalVerificationUnavailable,
+    decode_access_token,
+    rejected_tokens,
+)
 
 logger = logging.getLogger(__name__)
 
+# Token checks can block on the auth provider; keep them off the event loop and cap how
+# many worker threads a slow provider can tie up.
+_token_verification_executor = ThreadPoolExecutor(
+    max_workers=settings.auth_verification_max_workers,
+    thread_name_prefix="token-verification",
+)
+
+
+INVALID_TOKEN_DETAIL = "Invalid or expired access token."
+PROVIDER_UNAVAILABLE_DETAIL = "Authentication provider is temporarily unavailable."
+
 
 @dataclass(slots=True)
 class VerifiedToken:
@@ -42,6 +82,17 @@ class AuthServiceError(Exception):
         self.status_code = status_code
 
 
+class _TokenRejected(AuthServiceError):
+    """A definitive 401: the token itself is bad, so retrying it cannot succeed."""
+
+    def __init__(self) -> None:
+        super().__init__(INVALID_TOKEN_DETAIL, 401)
+
+
+def _provider_unavailable() -> AuthServiceError:
+    return AuthServiceError(PROVIDER_UNAVAILABLE_DETAIL, 503)
+
+
 def _extract_auth_user(auth_result: Any) -> Any:
     user = getattr(auth_result, "user", None)
     if user is None:
@@ -92,6 +143,72 @@ def _extract_auth_user_name(auth_user: Any, fallback: str) -> str:
     return fallback
 
 
+def _has_pending_auth_sync(user_id: UUID, field_name: str) -> ColumnElement[bool]:
+    outbox = AuthSyncOutbox.__table__
+    return exists().where(
+        outbox.c.user_id == user_id,
+        outbox.c.delivered_at.is_(None),
+        type_coerce(outbox.c.payload, JSONB).has_key(field_name),
+    )
+
+
+def _upsert_local_user_statement(
+    auth_user_id: UUID,
+    email: str,
+    name: str,
+    sync_name: bool,
+) -> Executable:
+    """Build an upsert that writes only when the local profile actually changed.
+
+    The conflict branch is skipped for deactivated users and for rows that already
+    match, in which case the current row is returned from the statement snapshot
+    instead, so every outcome costs a single round trip. Fields with an undelivered
+    `auth_sync_outbox` row are not overwritten from the provider.
+    """
+
+    users = User.__table__
+    insert_stmt = pg_insert(users).values(
+        id=auth_user_id,
+        name=name,
+        email=email,
+        role=UserRole.USER,
+    )
+    excluded = insert_stmt.excluded
+    # A local edit still waiting in the outbox is newer than what the provider reports,
+    # so that field keeps its local value until the row is delivered.
+    email_pending = _has_pending_auth_sync(auth_user_id, "email")
+    changed = and_(~email_pending, users.c.email.is_distinct_from(excluded.email))
+    update_values: dict[str, Any] = {
+        "email": case((email_pending, users.c.email), else_=excluded.email),
+        "updated_at": func.now(),
+    }
+    if sync_name:
+        name_pending = _has_pending_auth_sync(auth_user_id, "name")
+        changed = or_(changed, and_(~name_pending, users.c.name.is_distinct_from(excluded.name)))
+        update_values["name"] = case((name_pending, users.c.name), else_=excluded.name)
+
+    upserted = (
+        insert_stmt.on_conflict_do_update(
+            index_elements=[users.c.id],
+            set_=update_values,
+            where=and_(users.c.is_active.is_(True), changed),
+        )
+        .returning(*users.c)
+        .cte("upserted")
+    )
+    unchanged = select(*users.c, false().label("written")).where(
+        users.c.id == auth_user_id,
+        ~exists(select(upserted.c.id)),
+    )
+    written = select(*upserted.c, true().label("written"))
+
+    return (
+        select(User, literal_column("written"))
+        .from_statement(union_all(written, unchanged))
+        .execution_options(populate_existing=True)
+    )
+
+
 def _get_or_create_local_user(
     db: Session,
     auth_user: Any,
@@ -103,37 +220,35 @@ def _get_or_create_local_user(
     if not auth_email:
         raise AuthServiceError("Authentication provider returned an invalid email.", 502)
 
-    user = db.scalar(select(User).where(User.id == auth_user_id))
-    if user is not None:
-        if not user.is_active:
-            raise AuthServiceError("User account is deactivated.", 403)
-
-        # Keep local profile in sync for name/email changes.
-        user.email = auth_email
-        if preferred_name:
-            user.name = preferred_name
-        db.commit()
-        db.refresh(user)
-        return user
-
     name = preferred_name or _extract_auth_user_name(auth_user, fallback=auth_email)
-
-    user = User(
-        id=auth_user_id,
-        name=name,
+    statement = _upsert_local_user_statement(
+        auth_user_id,
         email=auth_email,
-        role=UserRole.USER,
+        name=name,
+        sync_name=bool(preferred_name),
     )
 
-    db.add(user)
     try:
+        row = db.execute(statement).first()
         db.commit()
     except IntegrityError as exc:
         db.rollback()
-        logger.exception("Failed to create local user profile for auth user %s", auth_user_id)
+        logger.exception("Failed to upsert local user profile for auth user %s", auth_user_id)
         raise AuthServiceError("A local profile with this email already exists.", 409) from exc
 
-    db.refresh(user)
+    if row is None:
+        # A concurrent insert landed after this statement's snapshot was taken.
+        user = db.scalar(select(User).where(User.id == auth_user_id))
+        if user is None:
+            raise AuthServiceError("Unable to load local user profile.", 500)
+        written = False
+    else:
+        user, written = row
+
+    if not user.is_active:
+        raise AuthServiceError("User account is deactivated.", 403)
+    if written:
+        principal_cache.invalidate(user.id)
     return user
 
 
@@ -141,12 +256,16 @@ def serialize_user(user: User) -> UserResponse:
     return UserResponse.model_validate(user)
 
 
-def verify_access_token(token: str) -> VerifiedToken:
+def _verify_access_token_remote(token: str) -> VerifiedToken:
     try:
-        auth_response = supabase_anon.auth.get_user(token)
+        auth_response = auth_provider_breaker.call(supabase_anon.auth.get_user, token)
+    except CircuitOpenError as exc:
+        raise _provider_unavailable() from exc
     except Exception as exc:  # noqa: BLE001
         logger.exception("Supabase token verification failed.")
-        raise AuthServiceError("Invalid or expired access token.", 401) from exc
+        if is_provider_failure(exc):
+            raise _provider_unavailable() from exc
+        raise _TokenRejected() from exc
 
     auth_user = _extract_auth_user(auth_response)
     user_id = _to_uuid(str(getattr(auth_user, "id", "")))
@@ -156,47 +275,96 @@ def verify_access_token(token: str) -> VerifiedToken:
     return VerifiedToken(user_id=user_id, email=email_value)
 
 
-def register_user(db: Session, payload: RegisterRequest) -> AuthResponse:
+def _verify_access_token_local(token: str) -> VerifiedToken:
+    claims = decode_access_token(token)
+    try:
+        user_id = UUID(str(claims["sub"]))
+    except ValueError as exc:
+        raise _TokenRejected() from exc
+
+    email = claims.get("email")
+    email_value = email.strip().lower() if isinstance(email, str) and email.strip() else None
+
+    return VerifiedToken(user_id=user_id, email=email_value)
+
+
+def _verify_access_token_uncached(token: str) -> VerifiedToken:
+    if settings.auth_jwt_verification == "remote":
+        return _verify_access_token_remote(token)
+
+    try:
+        return _verify_access_token_local(token)
+    except LocalVerificationUnavailable as exc:
+        if not settings.auth_jwt_remote_fallback:
+            logger.warning("Local token verification unavailable: %s", exc)
+            raise AuthServiceError(INVALID_TOKEN_DETAIL, 401) from exc
+    except jwt.InvalidTokenError as exc:
+        raise _TokenRejected() from exc
+
+    return _verify_access_token_remote(token)
+
+
+def verify_access_token(token: str) -> VerifiedToken:
+    # Clients tend to retry a rejected token; answer from memory instead of re-checking.
+    if rejected_tokens.contains(token):
+        raise AuthServiceError(INVALID_TOKEN_DETAIL, 401)
+
+    try:
+        return _verify_access_token_uncached(token)
+    except _TokenRejected:
+        # Only bad tokens are remembered; a missing secret or an unknown key id can be
+        # fixed by configuration or a later JWKS refresh, after which the token is valid.
+        rejected_tokens.add(token)
+        raise
+
+
+async def verify_access_token_async(token: str) -> VerifiedToken:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_token_verification_executor, verify_access_token, token)
+
+
+def _sign_up(payload: RegisterRequest) -> Any:
     try:
-        auth_result = supabase_anon.auth.sign_up(
+        return auth_provider_breaker.call(
+            supabase_anon.auth.sign_up,
             {
                 "email": payload.email,
                 "password": payload.password,
                 "options": {"data": {"name": payload.name, "role": payload.role.value}},
-            }
+            },
         )
+    except CircuitOpenError as exc:
+        raise _provider_unavailable() from exc
     except Exception as exc:  # noqa: BLE001
         logger.exception("Supabase sign-up failed for %s", payload.email)
         raise AuthServiceError("Unable to complete registration.", 400) from exc
 
-    auth_user = _extract_auth_user(auth_result)
-    created_auth_user_id = _to_uuid(str(getattr(auth_user, "id", "")))
 
+def _create_registered_profile(db: Session, auth_user: Any, payload: RegisterRequest) -> User:
     try:
-        user = _get_or_create_local_user(db, auth_user=auth_user, preferred_name=payload.name)
-    except AuthServiceError as exc:
-        # Keep Supabase auth clean when local profile write fails.
-        try:
-            supabase_admin.auth.admin.delete_user(str(created_auth_user_id))
-        except Exception:  # noqa: BLE001
-            logger.exception(
-                "Failed to rollback auth user %s after local profile failure.", created_auth_user_id
-            )
-        raise exc
+        return _get_or_create_local_user(db, auth_user=auth_user, preferred_name=payload.name)
+    except AuthServiceError:
+        raise
     except Exception as exc:  # noqa: BLE001
         db.rollback()
         logger.exception(
-            "Unexpected local profile creation error for auth user %s", created_auth_user_id
+            "Unexpected local profile creation error for auth user %s",
+            getattr(auth_user, "id", None),
         )
-        try:
-            supabase_admin.auth.admin.delete_user(str(created_auth_user_id))
-        except Exception:  # noqa: BLE001
-            logger.exception(
-                "Failed to rollback auth user %s after unexpected local profile error.",
-                created_auth_user_id,
-            )
         raise AuthServiceError("Unable to create local user profile.", 500) from exc
 
+
+def _rollback_auth_user(auth_user_id: UUID) -> None:
+    # Keep Supabase auth clean when local profile write fails.
+    try:
+        supabase_admin.auth.admin.delete_user(str(auth_user_id))
+    except Exception:  # noqa: BLE001
+        logger.exception(
+            "Failed to rollback auth user %s after local profile failure.", auth_user_id
+        )
+
+
+def _registration_response(user: User, auth_result: Any) -> AuthResponse:
     tokens = _extract_session_tokens(auth_result)
     return AuthResponse(
         user=serialize_user(user),
@@ -208,15 +376,34 @@ def register_user(db: Session, payload: RegisterRequest) -> AuthResponse:
     )
 
 
-def login_user(db: Session, payload: LoginRequest) -> AuthResponse:
+def register_user(db: Session, payload: RegisterRequest) -> AuthResponse:
+    auth_result = _sign_up(payload)
+    auth_user = _extract_auth_user(auth_result)
+    created_auth_user_id = _to_uuid(str(getattr(auth_user, "id", "")))
+
     try:
-        auth_result = supabase_anon.auth.sign_in_with_password(
-            {"email": payload.email, "password": payload.password}
+        user = _create_registered_profile(db, auth_user, payload)
+    except AuthServiceError:
+        _rollback_auth_user(created_auth_user_id)
+        raise
+
+    return _registration_response(user, auth_result)
+
+
+def _sign_in(payload: LoginRequest) -> Any:
+    try:
+        return auth_provider_breaker.call(
+            supabase_anon.auth.sign_in_with_password,
+            {"email": payload.email, "password": payload.password},
         )
+    except CircuitOpenError as exc:
+        raise _provider_unavailable() from exc
     except Exception as exc:  # noqa: BLE001
         logger.exception("Supabase sign-in failed for %s", payload.email)
         raise AuthServiceError("Invalid email or password.", 401) from exc
 
+
+def _complete_login(db: Session, auth_result: Any) -> AuthResponse:
     auth_user = _extract_auth_user(auth_result)
     try:
         user = _get_or_create_local_user(db, auth_user=auth_user)
@@ -242,6 +429,10 @@ def login_user(db: Session, payload: LoginRequest) -> AuthResponse:
     )
 
 
+def login_user(db: Session, payload: LoginRequest) -> AuthResponse:
+    return _complete_login(db, _sign_in(payload))
+
+
 def get_user_profile(db: Session, user_id: UUID) -> User:
     user = db.scalar(select(User).where(User.id == user_id))
     if user is None:
@@ -257,7 +448,11 @@ def send_password_reset(payload: PasswordResetRequest) -> MessageResponse:
         options["redirect_to"] = payload.redirect_to
 
     try:
-        supabase_anon.auth.reset_password_for_email(payload.email, options or None)
+        auth_provider_breaker.call(
+            supabase_anon.auth.reset_password_for_email, payload.email, options or None
+        )
+    except CircuitOpenError as exc:
+        raise _provider_unavailable() from exc
     except Exception as exc:  # noqa: BLE001
         logger.exception("Password reset request failed for %s", payload.email)
         raise AuthServiceError("Unable to send password reset email.", 400) from exc
@@ -268,13 +463,54 @@ def send_password_reset(payload: PasswordResetRequest) -> MessageResponse:
 def update_password(access_token: str, payload: PasswordUpdateRequest) -> MessageResponse:
     try:
         verified = verify_access_token(access_token)
-        supabase_admin.auth.admin.update_user_by_id(
-            str(verified.user_id), {"password": payload.password}
+        auth_provider_breaker.call(
+            supabase_admin.auth.admin.update_user_by_id,
+            str(verified.user_id),
+            {"password": payload.password},
         )
     except AuthServiceError:
         raise
+    except CircuitOpenError as exc:
+        raise _provider_unavailable() from exc
     except Exception as exc:  # noqa: BLE001
         logger.exception("Password update failed.")
         raise AuthServiceError("Unable to update password with the provided token.", 400) from exc
 
     return MessageResponse(message="Password updated successfully.")
+
+
+# Async variants for request handlers. Database work runs on the AsyncSession's
+# connection via `run_sync`; blocking auth-provider calls are moved to threads.
+
+
+async def register_user_async(db: AsyncSession, payload: RegisterRequest) -> AuthResponse:
+    auth_result = await asyncio.to_thread(_sign_up, payload)
+    auth_user = _extract_auth_user(auth_result)
+    created_auth_user_id = _to_uuid(str(getattr(auth_user, "id", "")))
+
+    try:
+        user = await db.run_sync(_create_registered_profile, auth_user, payload)
+    except AuthServiceError:
+        await asyncio.to_thread(_rollback_auth_user, created_auth_user_id)
+        raise
+
+    return _registration_response(user, auth_result)
+
+
+async def login_user_async(db: AsyncSession, payload: LoginRequest) -> AuthResponse:
+    auth_result = await asyncio.to_thread(_sign_in, payload)
+    return await db.run_sync(_complete_login, auth_result)
+
+
+async def get_user_profile_async(db: AsyncSession, user_id: UUID) -> User:
+    return await db.run_sync(get_user_profile, user_id)
+
+
+async def send_password_reset_async(payload: PasswordResetRequest) -> MessageResponse:
+    return await asyncio.to_thread(send_password_reset, payload)
+
+
+async def update_password_async(
+    access_token: str, payload: PasswordUpdateRequest
+) -> MessageResponse:
+    return await asyncio.to_thread(update_password, access_token, payload)
@@ -0,0 +1,261 @@
+"""Transactional outbox delivering local profile changes to the auth provider.
+
+User edits record the fields the provider must learn about in `auth_sync_outbox`,
+inside the same transaction as the edit itself. `AuthSyncWorker` later claims due
+rows in batches, pushes them to Supabase Auth and retries outages with
+exponential backoff until `AUTH_SYNC_MAX_ATTEMPTS` is reached. Changes the provider
+rejects outright (4xx) are marked failed without retrying.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import and_, exists, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, aliased, sessionmaker
+
+from app.config import settings
+from app.database import SessionLocal
+from models.enums import UserRole
+from models.outbox import AuthSyncOutbox
+from schemas.users import AuthSyncBacklogResponse, AuthSyncOutboxEntryResponse
+from services.circuit_breaker import is_provider_failure
+from services.user_support import sync_supabase_user
+
+logger = logging.getLogger(__name__)
+
+# Claimed rows are hidden from other workers for this long; a worker that dies mid-batch
+# hands its rows back once the lease lapses.
+CLAIM_LEASE_SECONDS = 60.0
+MAX_ERROR_LENGTH = 500
+BACKLOG_ENTRY_LIMIT = 100
+
+SyncFunction = Callable[..., None]
+
+
+def enqueue_auth_sync(
+    db: Session,
+    user_id: UUID,
+    *,
+    email: str | None = None,
+    name: str | None = None,
+    role: UserRole | None = None,
+) -> AuthSyncOutbox | None:
+    """Stage an outbox row on `db`; the caller's commit makes it visible to the worker."""
+
+    payload: dict[str, Any] = {}
+    if email is not None:
+        payload["email"] = email
+    if name is not None:
+        payload["name"] = name
+    if role is not None:
+        payload["role"] = role.value
+    if not payload:
+        return None
+
+    entry = AuthSyncOutbox(user_id=user_id, payload=payload)
+    db.add(entry)
+    return entry
+
+
+def retry_delay_seconds(attempts: int) -> float:
+    delay = settings.auth_sync_backoff_seconds * 2 ** max(attempts - 1, 0)
+    return min(delay, settings.auth_sync_backoff_max_seconds)
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _claim_batch(db: Session, batch_size: int) -> list[AuthSyncOutbox]:
+    now = _utcnow()
+    earlier = aliased(AuthSyncOutbox)
+    # A user's rows are delivered in id order: skip a row while an earlier one for the
+    # same user is still waiting out its backoff or is leased to another worker.
+    waiting_earlier_row = exists().where(
+        and_(
+            earlier.user_id == AuthSyncOutbox.user_id,
+            earlier.id < AuthSyncOutbox.id,
+            earlier.delivered_at.is_(None),
+            earlier.attempts < settings.auth_sync_max_attempts,
+            earlier.next_attempt_at > now,
+        )
+    )
+    rows = db.scalars(
+        select(AuthSyncOutbox)
+        .where(
+            AuthSyncOutbox.delivered_at.is_(None),
+            AuthSyncOutbox.attempts < settings.auth_sync_max_attempts,
+            AuthSyncOutbox.next_attempt_at <= now,
+            ~waiting_earlier_row,
+        )
+        .order_by(AuthSyncOutbox.id)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    ).all()
+
+    lease_expires_at = now + timedelta(seconds=CLAIM_LEASE_SECONDS)
+    for row in rows:
+        row.next_attempt_at = lease_expires_at
+    # Commit the lease so no transaction stays open across provider calls.
+    db.commit()
+    return list(rows)
+
+
+def _deliver_user_rows(user_id: UUID, rows: list[AuthSyncOutbox], sync: SyncFunction) -> None:
+    payload: dict[str, Any] = {}
+    for row in rows:
+        payload.update(row.payload)
+
+    try:
+        sync(
+            user_id,
+            email=payload.get("email"),
+            name=payload.get("name"),
+            role=UserRole(payload["role"]) if "role" in payload else None,
+        )
+    except Exception as exc:  # noqa: BLE001
+        # Sync functions wrap provider errors; classify and report the original one.
+        cause = exc.__cause__ or exc
+        retryable = is_provider_failure(cause)
+        logger.warning("Auth sync for user %s failed: %s", user_id, cause)
+        failed_at = _utcnow()
+        source = exc if retryable else cause
+        error = getattr(source, "detail", None) or str(source) or type(source).__name__
+        for row in rows:
+            row.last_error = error[:MAX_ERROR_LENGTH]
+            if not retryable:
+                # The provider rejected the change itself (e.g. the email is taken); retrying
+                # cannot succeed, so mark the row failed for the backlog right away.
+                row.attempts = max(row.attempts + 1, settings.auth_sync_max_attempts)
+                continue
+            row.attempts += 1
+            row.next_attempt_at = failed_at + timedelta(seconds=retry_delay_seconds(row.attempts))
+        return
+
+    delivered_at = _utcnow()
+    for row in rows:
+        row.delivered_at = delivered_at
+        row.last_error = None
+
+
+def deliver_auth_sync_batch(
+    db: Session,
+    *,
+    batch_size: int | None = None,
+    sync: SyncFunction = sync_supabase_user,
+) -> int:
+    """Deliver up to `batch_size` due outbox rows; returns how many were claimed.
+
+    Rows for the same user are merged into a single provider call.
+    """
+
+    rows = _claim_batch(db, batch_size or settings.auth_sync_batch_size)
+    rows_by_user: dict[UUID, list[AuthSyncOutbox]] = {}
+    for row in rows:
+        rows_by_user.setdefault(row.user_id, []).append(row)
+
+    for user_id, user_rows in rows_by_user.items():
+        _deliver_user_rows(user_id, user_rows, sync)
+    db.commit()
+    return len(rows)
+
+
+def get_auth_sync_backlog(db: Session, limit: int = BACKLOG_ENTRY_LIMIT) -> AuthSyncBacklogResponse:
+    """Summarize undelivered outbox rows; `failed_count` rows have exhausted their retries."""
+
+    undelivered = AuthSyncOutbox.delivered_at.is_(None)
+    exhausted = AuthSyncOutbox.attempts >= settings.auth_sync_max_attempts
+    counts = db.execute(
+        select(
+            func.count().filter(~exhausted),
+            func.count().filter(exhausted),
+            func.min(AuthSyncOutbox.created_at),
+        ).where(undelivered)
+    ).one()
+    entries = db.scalars(
+        select(AuthSyncOutbox).where(undelivered).order_by(AuthSyncOutbox.id).limit(limit)
+    ).all()
+
+    return AuthSyncBacklogResponse(
+        pending_count=counts[0],
+        failed_count=counts[1],
+        oldest_pending_at=counts[2],
+        entries=[
+            AuthSyncOutboxEntryResponse(
+                id=entry.id,
+                user_id=entry.user_id,
+                fields=sorted(entry.payload),
+                attempts=entry.attempts,
+                next_attempt_at=entry.next_attempt_at,
+                last_error=entry.last_error,
+                created_at=entry.created_at,
+            )
+            for entry in entries
+        ],
+    )
+
+
+async def get_auth_sync_backlog_async(db: AsyncSession) -> AuthSyncBacklogResponse:
+    return await db.run_sync(get_auth_sync_backlog)
+
+
+class AuthSyncWorker:
+    """Background thread draining the outbox, one batch at a time."""
+
+    def __init__(
+        self,
+        session_factory: sessionmaker[Session],
+        *,
+        poll_interval: float,
+        batch_size: int,
+        sync: SyncFunction = sync_supabase_user,
+    ) -> None:
+        self.session_factory = session_factory
+        self.poll_interval = poll_interval
+        self.batch_size = batch_size
+        self.sync = sync
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def run_once(self) -> int:
+        with self.session_factory() as db:
+            return deliver_auth_sync_batch(db, batch_size=self.batch_size, sync=self.sync)
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run_loop, name="auth-sync", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+
+    def _run_loop(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                claimed = self.run_once()
+            except Exception:  # noqa: BLE001
+                logger.exception("Auth sync batch failed")
+                claimed = 0
+            # A full batch suggests more rows are due; go again without sleeping.
+            if claimed < self.batch_size:
+                self._stop_event.wait(self.poll_interval)
+
+
+auth_sync_worker = AuthSyncWorker(
+    SessionLocal,
+    poll_interval=settings.auth_sync_poll_seconds,
+    batch_size=settings.auth_sync_batch_size,
+)
@@ -0,0 +1,157 @@
+"""Circuit breaker guarding calls to the external auth provider."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Literal, TypeVar
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+ResultType = TypeVar("ResultType")
+BreakerState = Literal["closed", "open", "half_open"]
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected without reaching the provider."""
+
+
+def is_provider_failure(exc: BaseException) -> bool:
+    """Only transport errors and 5xx responses count against the provider.
+
+    4xx responses (bad credentials, expired tokens) mean the provider is healthy.
+    """
+
+    status = getattr(exc, "status", None)
+    if isinstance(status, int) and 400 <= status < 500:
+        return False
+    return True
+
+
+class CircuitBreaker:
+    """Closed -> open after consecutive failures; open -> half-open after a cooldown.
+
+    While half-open a limited number of probe calls go through; a successful probe
+    closes the breaker and a failed one re-opens it for another cooldown.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        failure_threshold: int,
+        recovery_timeout: float,
+        half_open_max_calls: int = 1,
+        is_failure: Callable[[BaseException], bool] = is_provider_failure,
+    ) -> None:
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.is_failure = is_failure
+        self._state: BreakerState = "closed"
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._half_open_in_flight = 0
+        self._lock = threading.Lock()
+        self.total_calls = 0
+        self.total_failures = 0
+        self.rejected_calls = 0
+        self.times_opened = 0
+
+    @property
+    def state(self) -> BreakerState:
+        with self._lock:
+            self._advance_state()
+            return self._state
+
+    def call(self, func: Callable[..., ResultType], *args: Any, **kwargs: Any) -> ResultType:
+        probing = self._acquire()
+        try:
+            result = func(*args, **kwargs)
+        except Exception as exc:
+            self._record(success=not self.is_failure(exc), probing=probing)
+            raise
+        self._record(success=True, probing=probing)
+        return result
+
+    def reset(self) -> None:
+        with self._lock:
+            self._state = "closed"
+            self._consecutive_failures = 0
+            self._half_open_in_flight = 0
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            self._advance_state()
+            return {
+                "name": self.name,
+                "state": self._state,
+                "consecutive_failures": self._consecutive_failures,
+                "failure_threshold": self.failure_threshold,
+                "recovery_timeout_seconds": self.recovery_timeout,
+                "total_calls": self.total_calls,
+                "total_failures": self.total_failures,
+                "rejected_calls": self.rejected_calls,
+                "times_opened": self.times_opened,
+            }
+
+    def _advance_state(self) -> None:
+        if self._state == "open" and time.monotonic() - self._opened_at >= self.recovery_timeout:
+            self._state = "half_open"
+            self._half_open_in_flight = 0
+
+    def _acquire(self) -> bool:
+        with self._lock:
+            self._advance_state()
+            if self._state == "open" or (
+                self._state == "half_open" and self._half_open_in_flight >= self.half_open_max_calls
+            ):
+                self.rejected_calls += 1
+                raise CircuitOpenError(f"{self.name} circuit is open.")
+
+            self.total_calls += 1
+            if self._state == "half_open":
+                self._half_open_in_flight += 1
+                return True
+            return False
+
+    def _record(self, *, success: bool, probing: bool) -> None:
+        with self._lock:
+            if probing:
+                self._half_open_in_flight = max(0, self._half_open_in_flight - 1)
+
+            if success:
+                if self._state != "closed":
+                    logger.info("%s circuit closed after successful probe.", self.name)
+                self._state = "closed"
+                self._consecutive_failures = 0
+                return
+
+            self.total_failures += 1
+            self._consecutive_failures += 1
+            if self._state == "half_open" or (
+                self._state == "closed" and self._consecutive_failures >= self.failure_threshold
+            ):
+                self._open()
+
+    def _open(self) -> None:
+        if self._state != "open":
+            self.times_opened += 1
+            logger.warning(
+                "%s circuit opened after %s consecutive failures.",
+                self.name,
+                self._consecutive_failures,
+            )
+        self._state = "open"
+        self._opened_at = time.monotonic()
+
+
+auth_provider_breaker = CircuitBreaker(
+    "supabase_auth",
+    failure_threshold=settings.auth_provider_breaker_failure_threshold,
+    recovery_timeout=float(settings.auth_provider_breaker_recovery_seconds),
+)
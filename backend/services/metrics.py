@@ -0,0 +1,34 @@
+"""Collects per-worker operational metrics."""
+
+from __future__ import annotations
+
+from app.database import async_engine, async_replica_engine, engine
+from app.pooling import pool_stats
+from schemas.metrics import (
+    CacheStatsResponse,
+    CircuitBreakerStatsResponse,
+    DatabasePoolStatsResponse,
+    MetricsResponse,
+    RejectedTokenStatsResponse,
+)
+from services.circuit_breaker import auth_provider_breaker
+from services.principal_cache import principal_cache
+from services.token_verification import rejected_tokens
+
+
+def collect_metrics() -> MetricsResponse:
+    database_pools = [
+        DatabasePoolStatsResponse(**pool_stats("primary", engine.pool)),
+        DatabasePoolStatsResponse(**pool_stats("primary_async", async_engine.pool)),
+    ]
+    if async_replica_engine is not None:
+        database_pools.append(
+            DatabasePoolStatsResponse(**pool_stats("replica_async", async_replica_engine.pool))
+        )
+
+    return MetricsResponse(
+        principal_cache=CacheStatsResponse(**principal_cache.stats()),
+        rejected_tokens=RejectedTokenStatsResponse(**rejected_tokens.stats()),
+        auth_provider_breaker=CircuitBreakerStatsResponse(**auth_provider_breaker.stats()),
+        database_pools=database_pools,
+    )
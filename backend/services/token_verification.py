@@ -0,0 +1,233 @@
+"""Local verification of Supabase-issued access tokens."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+import time
+from typing import Any
+
+import httpx
+import jwt
+from jwt import PyJWK
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+SYMMETRIC_ALGORITHMS = frozenset({"HS256"})
+ASYMMETRIC_ALGORITHMS = frozenset({"RS256", "ES256", "EdDSA"})
+REQUIRED_CLAIMS = ["exp", "sub", "aud", "iss"]
+
+# Unknown `kid` values trigger an on-demand refresh, but never more often than this.
+MIN_ON_DEMAND_REFRESH_SECONDS = 30.0
+JWKS_FETCH_TIMEOUT_SECONDS = 5.0
+MAX_REJECTED_TOKENS = 10_000
+
+
+class LocalVerificationUnavailable(Exception):
+    """Raised when no local key material can verify a token."""
+
+
+class JWKSCache:
+    """Thread-safe cache of signing keys published by the auth provider."""
+
+    def __init__(
+        self,
+        jwks_url: str,
+        *,
+        refresh_interval: float,
+        min_refresh_interval: float = MIN_ON_DEMAND_REFRESH_SECONDS,
+        fetch_timeout: float = JWKS_FETCH_TIMEOUT_SECONDS,
+    ) -> None:
+        self.jwks_url = jwks_url
+        self.refresh_interval = refresh_interval
+        self.min_refresh_interval = min_refresh_interval
+        self.fetch_timeout = fetch_timeout
+        self._keys: dict[str, PyJWK] = {}
+        self._last_refresh_at: float | None = None
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._refresher: threading.Thread | None = None
+
+    def get_key(self, kid: str | None) -> PyJWK | None:
+        if kid is None:
+            return None
+
+        key = self._keys.get(kid)
+        if key is not None:
+            return key
+
+        with self._lock:
+            # Another caller may have refreshed while this one waited for the lock.
+            if kid not in self._keys and self._refresh_allowed():
+                self._fetch_keys()
+        return self._keys.get(kid)
+
+    def refresh(self) -> None:
+        with self._lock:
+            self._fetch_keys()
+
+    def _fetch_keys(self) -> None:
+        self._last_refresh_at = time.monotonic()
+        try:
+            response = httpx.get(self.jwks_url, timeout=self.fetch_timeout)
+            response.raise_for_status()
+            keys = self._parse_keys(response.json())
+        except Exception:  # noqa: BLE001
+            logger.exception("Failed refreshing JWKS from %s", self.jwks_url)
+            return
+
+        # Swap the whole mapping so readers never observe a partial key set.
+        self._keys = keys
+
+    def start_background_refresh(self) -> None:
+        if self._refresher is not None and self._refresher.is_alive():
+            return
+
+        self._stop_event.clear()
+        self._refresher = threading.Thread(
+            target=self._refresh_loop,
+            name="jwks-refresher",
+            daemon=True,
+        )
+        self._refresher.start()
+
+    def stop_background_refresh(self) -> None:
+        self._stop_event.set()
+        if self._refresher is not None:
+            self._refresher.join(timeout=self.fetch_timeout)
+            self._refresher = None
+
+    def _refresh_loop(self) -> None:
+        while not self._stop_event.is_set():
+            self.refresh()
+            self._stop_event.wait(self.refresh_interval)
+
+    def _refresh_allowed(self) -> bool:
+        last_refresh_at = self._last_refresh_at
+        if last_refresh_at is None:
+            return True
+        return time.monotonic() - last_refresh_at >= self.min_refresh_interval
+
+    @staticmethod
+    def _parse_keys(payload: Any) -> dict[str, PyJWK]:
+        raw_keys = payload.get("keys", []) if isinstance(payload, dict) else []
+        keys: dict[str, PyJWK] = {}
+        for raw_key in raw_keys:
+            kid = raw_key.get("kid") if isinstance(raw_key, dict) else None
+            if not kid:
+                continue
+            try:
+                keys[kid] = PyJWK(raw_key)
+            except jwt.PyJWKError:
+                logger.warning("Skipping unsupported JWKS key %s", kid)
+        return keys
+
+
+class RejectedTokenCache:
+    """Short-lived memory of tokens that already failed verification.
+
+    Stores SHA-256 digests only, so raw bearer tokens never sit in process memory
+    longer than the request that carried them.
+    """
+
+    def __init__(self, *, ttl_seconds: float, max_entries: int = MAX_REJECTED_TOKENS) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: dict[bytes, float] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+
+    def contains(self, token: str) -> bool:
+        if self.ttl_seconds <= 0:
+            return False
+
+        digest = _token_digest(token)
+        now = time.monotonic()
+        with self._lock:
+            expires_at = self._entries.get(digest)
+            if expires_at is None:
+                return False
+            if expires_at <= now:
+                del self._entries[digest]
+                return False
+            self.hits += 1
+            return True
+
+    def add(self, token: str) -> None:
+        if self.ttl_seconds <= 0:
+            return
+
+        now = time.monotonic()
+        with self._lock:
+            if len(self._entries) >= self.max_entries:
+                self._entries = {
+                    digest: expires_at
+                    for digest, expires_at in self._entries.items()
+                    if expires_at > now
+                }
+                if len(self._entries) >= self.max_entries:
+                    self._entries.pop(next(iter(self._entries)))
+            self._entries[_token_digest(token)] = now + self.ttl_seconds
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int | float]:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+            }
+
+
+def _token_digest(token: str) -> bytes:
+    return hashlib.sha256(token.encode("utf-8")).digest()
+
+
+jwks_cache = JWKSCache(
+    settings.supabase_jwks_url,
+    refresh_interval=float(settings.auth_jwks_refresh_seconds),
+)
+rejected_tokens = RejectedTokenCache(ttl_seconds=float(settings.auth_rejected_token_ttl_seconds))
+
+
+def _resolve_signing_key(header: dict[str, Any]) -> Any:
+    algorithm = header.get("alg")
+    if algorithm in SYMMETRIC_ALGORITHMS:
+        if settings.supabase_jwt_secret is None:
+            raise LocalVerificationUnavailable("SUPABASE_JWT_SECRET is not configured.")
+        return settings.supabase_jwt_secret
+
+    if algorithm in ASYMMETRIC_ALGORITHMS:
+        key = jwks_cache.get_key(header.get("kid"))
+        if key is None:
+            raise LocalVerificationUnavailable("No published signing key matches the token.")
+        return key.key
+
+    raise jwt.InvalidAlgorithmError(f"Unsupported token algorithm: {algorithm!r}")
+
+
+def decode_access_token(token: str) -> dict[str, Any]:
+    """Validate signature, expiry, audience and issuer without a network call.
+
+    Raises `jwt.InvalidTokenError` for bad tokens and `LocalVerificationUnavailable`
+    when the key needed to check the signature is not known locally.
+    """
+
+    header = jwt.get_unverified_header(token)
+    signing_key = _resolve_signing_key(header)
+
+    return jwt.decode(
+        token,
+        signing_key,
+        algorithms=[str(header["alg"])],
+        audience=settings.auth_jwt_audience,
+        issuer=settings.supabase_auth_issuer,
+        leeway=settings.auth_jwt_leeway_seconds,
+        options={"require": REQUIRED_CLAIMS},
+    )
@@ -3,13 +3,14 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
+from typing import Any, Protocol
 from uuid import UUID
 
 from app.database import supabase_admin
 from models.enums import UserRole
 from models.user import User
 from schemas.users import CoachSummaryResponse, UserResponse
+from services.circuit_breaker import CircuitOpenError, auth_provider_breaker
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +24,18 @@ class UserServiceError(Exception):
         self.status_code = status_code
 
 
+class AuthAdminAPI(Protocol):
+    """The part of the Supabase auth admin API that user provisioning calls."""
+
+    def create_user(self, attributes: dict[str, Any]) -> Any: ...
+
+    def delete_user(self, id: str) -> Any: ...
+
+
+def provider_unavailable() -> UserServiceError:
+    return UserServiceError("Authentication provider is temporarily unavailable.", 503)
+
+
 def to_uuid(value: str) -> UUID:
     try:
         return UUID(value)
@@ -68,7 +81,11 @@ def sync_supabase_user(
         return
 
     try:
-        supabase_admin.auth.admin.update_user_by_id(str(user_id), update_payload)
+        auth_provider_breaker.call(
+            supabase_admin.auth.admin.update_user_by_id, str(user_id), update_payload
+        )
+    except CircuitOpenError as exc:
+        raise provider_unavailable() from exc
     except Exception as exc:  # noqa: BLE001
         logger.exception("Failed syncing Supabase user %s", user_id)
         raise UserServiceError("Unable to sync user with authentication provider.", 502) from exc
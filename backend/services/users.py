@@ -2,34 +2,67 @@
 
 from __future__ import annotations
 
+import asyncio
+import base64
+import json
 import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from uuid import UUID
+from uuid import UUID, uuid4
 
-from sqlalchemy import func, or_, select
-from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session
+from sqlalchemy import (
+    ColumnElement,
+    Double,
+    Select,
+    cast,
+    delete,
+    func,
+    insert,
+    null,
+    or_,
+    select,
+    tuple_,
+)
+from sqlalchemy.exc import DBAPIError, IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, aliased
 
+from app.config import settings
 from app.database import supabase_admin
 from models.enums import UserRole
+from models.stats import AdminOverviewStats
 from models.user import CoachUserAssignment, User
 from models.workout import Workout
 from schemas.users import (
     AdminOverviewResponse,
+    BulkCoachAssignmentItem,
+    BulkCoachAssignmentItemResult,
+    BulkCoachAssignmentResponse,
+    BulkUserCreateItemResult,
+    BulkUserCreateResponse,
     CoachAssignmentResponse,
+    CoachLoadResponse,
+    CoachRebalanceMove,
+    CoachRebalanceRequest,
+    CoachRebalanceResponse,
     CoachSummaryResponse,
     PaginatedUsersResponse,
     UserCreateRequest,
     UserDetailResponse,
-    UserListItemResponse,
     UserListQuery,
     UserResponse,
     UserUpdateRequest,
 )
+from services.auth_sync import enqueue_auth_sync
+from services.circuit_breaker import CircuitOpenError, auth_provider_breaker
+from services.principal_cache import principal_cache
 from services.user_support import (
+    AuthAdminAPI,
     UserServiceError,
     extract_auth_user_id,
-    sync_supabase_user,
+    provider_unavailable,
     to_coach_summary,
     to_user_response,
 )
@@ -84,38 +117,152 @@ def _assert_role_transition_allowed(db: Session, user: User, next_role: UserRole
         )
 
 
-def list_users(db: Session, query: UserListQuery) -> PaginatedUsersResponse:
+_USER_LIST_COLUMNS = (
+    User.id,
+    User.name,
+    User.email,
+    User.role,
+    User.is_active,
+    User.deactivated_at,
+    User.created_at,
+    User.updated_at,
+)
+
+
+def _encode_user_cursor(created_at: datetime, user_id: UUID, rank: float | None) -> str:
+    payload: dict[str, object] = {"created_at": created_at.isoformat(), "id": str(user_id)}
+    if rank is not None:
+        payload["rank"] = rank
+    encoded = json.dumps(payload).encode("utf-8")
+    return base64.urlsafe_b64encode(encoded).decode("ascii").rstrip("=")
+
+
+def _decode_user_cursor(cursor: str, *, ranked: bool) -> tuple[float | None, datetime, UUID]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        rank = float(payload["rank"]) if ranked else None
+        return rank, datetime.fromisoformat(payload["created_at"]), UUID(payload["id"])
+    except (ValueError, KeyError, TypeError, UnicodeError) as exc:
+        raise UserServiceError("Invalid cursor.", 400) from exc
+
+
+def _search_criteria(
+    dialect_name: str, search: str
+) -> tuple[ColumnElement[bool], ColumnElement[float] | None]:
+    """Search predicate and, on PostgreSQL, a similarity rank to order by.
+
+    The trigram GIN indexes on lower(name)/lower(email) serve both the substring
+    LIKE and the `%>` word-similarity operator, so typeahead never scans `users`.
+    """
+
+    term = search.lower()
+    name = func.lower(User.name)
+    email = func.lower(User.email)
+    pattern = f"%{term}%"
+    if dialect_name != "postgresql":
+        return or_(name.like(pattern), email.like(pattern)), None
+
+    search_filter = or_(
+        name.like(pattern),
+        email.like(pattern),
+        name.op("%>")(term),
+        email.op("%>")(term),
+    )
+    # float8 so the rank survives a round trip through the cursor unchanged.
+    rank = cast(
+        func.greatest(func.word_similarity(term, name), func.word_similarity(term, email)),
+        Double,
+    )
+    return search_filter, rank
+
+
+def _estimate_row_count(db: Session, statement: Select) -> int:
+    """Planner row estimate for `statement`; exact count on non-PostgreSQL backends."""
+
+    dialect = db.get_bind().dialect
+    if dialect.name != "postgresql":
+        return db.scalar(select(func.count()).select_from(statement.subquery())) or 0
+
+    compiled = statement.compile(dialect=dialect, compile_kwargs={"literal_binds": True})
+    plan = db.connection().exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}").scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def _user_list_filters(
+    db: Session, query: UserListQuery
+) -> tuple[list[ColumnElement[bool]], ColumnElement[float] | None]:
     filters = []
     if query.role is not None:
         filters.append(User.role == query.role)
     if query.is_active is not None:
         filters.append(User.is_active.is_(query.is_active))
+    rank: ColumnElement[float] | None = None
     if query.search:
-        search_value = f"%{query.search.lower()}%"
-        filters.append(
-            or_(
-                func.lower(User.name).like(search_value),
-                func.lower(User.email).like(search_value),
-            )
-        )
+        search_filter, rank = _search_criteria(db.get_bind().dialect.name, query.search)
+        filters.append(search_filter)
+    return filters, rank
 
-    total = db.scalar(select(func.count(User.id)).where(*filters)) or 0
-    offset = (query.page - 1) * query.page_size
 
-    users = (
-        db.scalars(
-            select(User)
-            .where(*filters)
-            .order_by(User.created_at.desc())
-            .offset(offset)
-            .limit(query.page_size)
+def get_user_list_version(db: Session, query: UserListQuery) -> tuple[object, ...]:
+    """Values that change whenever any page of `query` could: two aggregates, no rows.
+
+    Users contribute their count and latest `updated_at`; their coach assignments, which
+    do not touch `users`, contribute theirs too (rebalancing deletes and re-inserts).
+    """
+
+    filters, _ = _user_list_filters(db, query)
+    user_count, users_updated_at = db.execute(
+        select(func.count(User.id), func.max(User.updated_at)).where(*filters)
+    ).one()
+    assignment_count, assigned_at = db.execute(
+        select(func.count(CoachUserAssignment.id), func.max(CoachUserAssignment.assigned_at)).where(
+            CoachUserAssignment.user_id.in_(select(User.id).where(*filters))
         )
-        .unique()
-        .all()
+    ).one()
+    return user_count, users_updated_at, assignment_count, assigned_at
+
+
+def list_users(db: Session, query: UserListQuery) -> PaginatedUsersResponse:
+    filters, rank = _user_list_filters(db, query)
+
+    total: int | None = None
+    if query.count == "exact":
+        total = db.scalar(select(func.count(User.id)).where(*filters)) or 0
+    elif query.count == "estimated":
+        total = _estimate_row_count(db, select(User.id).where(*filters))
+
+    # Ranked searches order by similarity first; (created_at, id) keeps the order total,
+    # so keyset pages never skip or repeat rows.
+    sort_keys: list[ColumnElement] = [User.created_at, User.id]
+    if rank is not None:
+        sort_keys.insert(0, rank)
+    statement = (
+        select(*_USER_LIST_COLUMNS, (rank if rank is not None else null()).label("rank"))
+        .where(*filters)
+        .order_by(*(key.desc() for key in sort_keys))
+        .limit(query.page_size + 1)
     )
+    if query.cursor is not None:
+        cursor_rank, cursor_created_at, cursor_id = _decode_user_cursor(
+            query.cursor, ranked=rank is not None
+        )
+        cursor_values = [cursor_created_at, cursor_id]
+        if rank is not None:
+            cursor_values.insert(0, cursor_rank)
+        statement = statement.where(tuple_(*sort_keys) < tuple_(*cursor_values))
+    else:
+        statement = statement.offset((query.page - 1) * query.page_size)
+
+    # Plain column tuples: no ORM instances or identity map for a read-only page.
+    rows = db.execute(statement).all()
+    has_more = len(rows) > query.page_size
+    rows = rows[: query.page_size]
 
     coach_count_by_user_id: dict[UUID, int] = {}
-    user_ids = [user.id for user in users]
+    user_ids = [row.id for row in rows]
     if user_ids:
         coach_counts = db.execute(
             select(
@@ -127,37 +274,64 @@ def list_users(db: Session, query: UserListQuery) -> PaginatedUsersResponse:
         ).all()
         coach_count_by_user_id = {row[0]: int(row[1]) for row in coach_counts}
 
-    items = [
-        UserListItemResponse(
-            **to_user_response(user).model_dump(),
-            coach_count=coach_count_by_user_id.get(user.id, 0),
-        )
-        for user in users
-    ]
-
-    total_pages = (total + query.page_size - 1) // query.page_size if total else 0
-    return PaginatedUsersResponse(
-        items=items,
-        page=query.page,
-        page_size=query.page_size,
-        total=total,
-        total_pages=total_pages,
+    total_pages: int | None = None
+    if total is not None:
+        total_pages = (total + query.page_size - 1) // query.page_size if total else 0
+    # Validate the whole page from plain dicts in one pydantic-core call; the route
+    # returns the model as-is, so FastAPI only serializes it (straight to JSON bytes).
+    return PaginatedUsersResponse.model_validate(
+        {
+            "items": [
+                {**row._mapping, "coach_count": coach_count_by_user_id.get(row.id, 0)}
+                for row in rows
+            ],
+            "page": query.page,
+            "page_size": query.page_size,
+            "total": total,
+            "total_pages": total_pages,
+            "total_is_estimate": query.count == "estimated",
+            "next_cursor": (
+                _encode_user_cursor(rows[-1].created_at, rows[-1].id, rows[-1].rank)
+                if has_more
+                else None
+            ),
+        }
     )
 
 
+def get_user_detail_version(db: Session, user_id: UUID) -> tuple[object, ...]:
+    """The user's `updated_at` plus each assigned coach's id and `updated_at`, in one query."""
+
+    coach = aliased(User)
+    rows = db.execute(
+        select(User.updated_at, coach.id, coach.updated_at)
+        .outerjoin(CoachUserAssignment, CoachUserAssignment.user_id == User.id)
+        .outerjoin(coach, coach.id == CoachUserAssignment.coach_id)
+        .where(User.id == user_id)
+        .order_by(coach.id)
+    ).all()
+    if not rows:
+        raise UserServiceError("User not found.", 404)
+    return rows[0][0], *(f"{row[1]}:{row[2]}" for row in rows if row[1] is not None)
+
+
 def get_user_detail(db: Session, user_id: UUID) -> UserDetailResponse:
     user = _get_user_or_404(db, user_id)
     coaches = _get_assigned_coaches(db, user.id)
     return UserDetailResponse(**to_user_response(user).model_dump(), coaches=coaches)
 
 
-def create_user(db: Session, payload: UserCreateRequest) -> UserResponse:
-    existing_user = db.scalar(select(User).where(User.email == payload.email))
+def _assert_email_available(db: Session, email: str) -> None:
+    existing_user = db.scalar(select(User).where(User.email == email))
     if existing_user is not None:
         raise UserServiceError("A user with this email already exists.", 409)
 
+
+def _create_auth_user(payload: UserCreateRequest, auth_admin: AuthAdminAPI | None = None) -> UUID:
+    auth_admin = auth_admin or supabase_admin.auth.admin
     try:
-        auth_result = supabase_admin.auth.admin.create_user(
+        auth_result = auth_provider_breaker.call(
+            auth_admin.create_user,
             {
                 "email": payload.email,
                 "password": payload.password,
@@ -166,14 +340,26 @@ def create_user(db: Session, payload: UserCreateRequest) -> UserResponse:
                     "name": payload.name,
                     "role": payload.role.value,
                 },
-            }
+            },
         )
+    except CircuitOpenError as exc:
+        raise provider_unavailable() from exc
     except Exception as exc:  # noqa: BLE001
         logger.exception("Failed creating auth user for %s", payload.email)
         raise UserServiceError("Unable to create user in authentication provider.", 400) from exc
 
-    auth_user_id = extract_auth_user_id(auth_result)
+    return extract_auth_user_id(auth_result)
+
+
+def _cleanup_auth_user(auth_user_id: UUID, auth_admin: AuthAdminAPI | None = None) -> None:
+    auth_admin = auth_admin or supabase_admin.auth.admin
+    try:
+        auth_admin.delete_user(str(auth_user_id))
+    except Exception:  # noqa: BLE001
+        logger.exception("Failed cleanup of auth user %s after local insert failure", auth_user_id)
+
 
+def _insert_local_user(db: Session, auth_user_id: UUID, payload: UserCreateRequest) -> UserResponse:
     user = User(
         id=auth_user_id,
         name=payload.name,
@@ -187,19 +373,209 @@ def create_user(db: Session, payload: UserCreateRequest) -> UserResponse:
     except IntegrityError as exc:
         db.rollback()
         logger.exception("Failed creating local user %s", auth_user_id)
-        try:
-            supabase_admin.auth.admin.delete_user(str(auth_user_id))
-        except Exception:  # noqa: BLE001
-            logger.exception(
-                "Failed cleanup of auth user %s after local insert failure", auth_user_id
-            )
         raise UserServiceError("Unable to create local user profile.", 500) from exc
 
     db.refresh(user)
     return to_user_response(user)
 
 
-def update_user(db: Session, user_id: UUID, payload: UserUpdateRequest) -> UserResponse:
+def create_user(db: Session, payload: UserCreateRequest) -> UserResponse:
+    _assert_email_available(db, payload.email)
+    auth_user_id = _create_auth_user(payload)
+    try:
+        return _insert_local_user(db, auth_user_id, payload)
+    except UserServiceError:
+        _cleanup_auth_user(auth_user_id)
+        raise
+
+
+def _screen_bulk_emails(
+    db: Session, payloads: list[UserCreateRequest]
+) -> dict[int, UserServiceError]:
+    existing_emails = set(
+        db.scalars(
+            select(User.email).where(User.email.in_({payload.email for payload in payloads}))
+        ).all()
+    )
+    errors: dict[int, UserServiceError] = {}
+    seen_emails: set[str] = set()
+    for index, payload in enumerate(payloads):
+        if payload.email in existing_emails:
+            errors[index] = UserServiceError("A user with this email already exists.", 409)
+        elif payload.email in seen_emails:
+            errors[index] = UserServiceError("Email appears more than once in the request.", 400)
+        seen_emails.add(payload.email)
+    return errors
+
+
+def _try_create_auth_user(
+    payload: UserCreateRequest, auth_admin: AuthAdminAPI | None
+) -> UUID | UserServiceError:
+    try:
+        return _create_auth_user(payload, auth_admin)
+    except UserServiceError as exc:
+        return exc
+
+
+def _create_auth_users(
+    payloads: list[UserCreateRequest],
+    outcomes: dict[int, UUID | UserServiceError],
+    auth_admin: AuthAdminAPI | None,
+) -> None:
+    pending = [index for index in range(len(payloads)) if index not in outcomes]
+    with ThreadPoolExecutor(
+        max_workers=settings.user_provisioning_concurrency,
+        thread_name_prefix="user-provisioning",
+    ) as executor:
+        created = executor.map(
+            lambda index: _try_create_auth_user(payloads[index], auth_admin), pending
+        )
+        outcomes.update(zip(pending, created))
+
+
+def _cleanup_auth_users(auth_user_ids: list[UUID], auth_admin: AuthAdminAPI | None) -> None:
+    if not auth_user_ids:
+        return
+    with ThreadPoolExecutor(
+        max_workers=settings.user_provisioning_concurrency,
+        thread_name_prefix="user-provisioning",
+    ) as executor:
+        list(
+            executor.map(
+                lambda auth_user_id: _cleanup_auth_user(auth_user_id, auth_admin), auth_user_ids
+            )
+        )
+
+
+def _local_user_row(auth_user_id: UUID, payload: UserCreateRequest) -> dict[str, object]:
+    return {
+        "id": auth_user_id,
+        "name": payload.name,
+        "email": payload.email,
+        "role": payload.role,
+        "is_active": True,
+    }
+
+
+def _insert_local_users(
+    db: Session,
+    payloads: list[UserCreateRequest],
+    outcomes: dict[int, UUID | UserServiceError],
+) -> tuple[list[UserResponse], list[UUID]]:
+    """Insert a profile per created auth user; return the users and the auth ids left over.
+
+    The batch goes in as one INSERT. If it hits a constraint, the rows are retried one
+    savepoint each so only the offending items fail; their outcomes are replaced with
+    the error and their auth ids are returned for cleanup.
+    """
+
+    created = [
+        (index, outcome)
+        for index, outcome in sorted(outcomes.items())
+        if not isinstance(outcome, UserServiceError)
+    ]
+    if not created:
+        return [], []
+    try:
+        users = db.scalars(
+            insert(User).returning(User, sort_by_parameter_order=True),
+            [_local_user_row(auth_user_id, payloads[index]) for index, auth_user_id in created],
+        ).all()
+        db.commit()
+        return [to_user_response(user) for user in users], []
+    except IntegrityError:
+        db.rollback()
+
+    users = []
+    failed_auth_user_ids: list[UUID] = []
+    for index, auth_user_id in created:
+        try:
+            with db.begin_nested():
+                user = db.scalars(
+                    insert(User).returning(User),
+                    [_local_user_row(auth_user_id, payloads[index])],
+                ).one()
+        except IntegrityError:
+            logger.exception("Failed creating local user %s", auth_user_id)
+            outcomes[index] = UserServiceError("Unable to create local user profile.", 500)
+            failed_auth_user_ids.append(auth_user_id)
+        else:
+            users.append(user)
+    db.commit()
+    return [to_user_response(user) for user in users], failed_auth_user_ids
+
+
+def _bulk_create_report(
+    payloads: list[UserCreateRequest],
+    outcomes: dict[int, UUID | UserServiceError],
+    users: list[UserResponse],
+) -> BulkUserCreateResponse:
+    users_by_id = {user.id: user for user in users}
+    results = []
+    for index, payload in enumerate(payloads):
+        outcome = outcomes[index]
+        if isinstance(outcome, UserServiceError):
+            results.append(
+                BulkUserCreateItemResult(
+                    email=payload.email, status="failed", detail=outcome.detail
+                )
+            )
+        else:
+            results.append(
+                BulkUserCreateItemResult(
+                    email=payload.email, status="created", user=users_by_id[outcome]
+                )
+            )
+    return BulkUserCreateResponse(
+        results=results,
+        created_count=len(users),
+        failed_count=len(payloads) - len(users),
+    )
+
+
+def bulk_create_users(
+    db: Session,
+    payloads: list[UserCreateRequest],
+    auth_admin: AuthAdminAPI | None = None,
+) -> BulkUserCreateResponse:
+    """Provision many users: one conflict query, concurrent auth calls, one batch insert.
+
+    At most `USER_PROVISIONING_CONCURRENCY` auth provider calls run at once. Items
+    whose local insert fails are reported as failed and their auth users deleted
+    again; the rest of the batch is still committed.
+    """
+
+    outcomes: dict[int, UUID | UserServiceError] = dict(_screen_bulk_emails(db, payloads))
+    # Release the read transaction before the slow provider calls.
+    db.rollback()
+    _create_auth_users(payloads, outcomes, auth_admin)
+    users, failed_auth_user_ids = _insert_local_users(db, payloads, outcomes)
+    _cleanup_auth_users(failed_auth_user_ids, auth_admin)
+    return _bulk_create_report(payloads, outcomes, users)
+
+
+@dataclass(slots=True)
+class _PendingUserUpdate:
+    user: User
+    name: str
+    email: str
+    role: UserRole
+    previous_name: str
+    previous_email: str
+    previous_role: UserRole
+
+    @property
+    def has_changes(self) -> bool:
+        return (
+            self.previous_email != self.email
+            or self.previous_name != self.name
+            or self.previous_role != self.role
+        )
+
+
+def _prepare_user_update(
+    db: Session, user_id: UUID, payload: UserUpdateRequest
+) -> _PendingUserUpdate:
     user = _get_user_or_404(db, user_id)
 
     next_name = payload.name if payload.name is not None else user.name
@@ -213,42 +589,48 @@ def update_user(db: Session, user_id: UUID, payload: UserUpdateRequest) -> UserR
 
     _assert_role_transition_allowed(db, user, next_role)
 
-    previous_name = user.name
-    previous_email = user.email
-    previous_role = user.role
+    return _PendingUserUpdate(
+        user=user,
+        name=next_name,
+        email=next_email,
+        role=next_role,
+        previous_name=user.name,
+        previous_email=user.email,
+        previous_role=user.role,
+    )
+
 
-    if previous_email != next_email or previous_name != next_name or previous_role != next_role:
-        sync_supabase_user(
+def _commit_user_update(db: Session, pending: _PendingUserUpdate) -> UserResponse:
+    user = pending.user
+    user.name = pending.name
+    user.email = pending.email
+    user.role = pending.role
+    if pending.has_changes:
+        enqueue_auth_sync(
+            db,
             user.id,
-            email=next_email if previous_email != next_email else None,
-            name=next_name if previous_name != next_name else None,
-            role=next_role if previous_role != next_role else None,
+            email=pending.email if pending.previous_email != pending.email else None,
+            name=pending.name if pending.previous_name != pending.name else None,
+            role=pending.role if pending.previous_role != pending.role else None,
         )
 
-    user.name = next_name
-    user.email = next_email
-    user.role = next_role
-
     try:
         db.commit()
     except IntegrityError as exc:
         db.rollback()
-        logger.exception("Failed updating local user %s", user_id)
-        try:
-            sync_supabase_user(
-                user.id,
-                email=previous_email,
-                name=previous_name,
-                role=previous_role,
-            )
-        except UserServiceError:
-            logger.exception("Failed rolling back auth user sync for %s", user_id)
+        logger.exception("Failed updating local user %s", user.id)
         raise UserServiceError("Unable to update user.", 500) from exc
 
+    principal_cache.invalidate(user.id)
     db.refresh(user)
     return to_user_response(user)
 
 
+def update_user(db: Session, user_id: UUID, payload: UserUpdateRequest) -> UserResponse:
+    pending = _prepare_user_update(db, user_id, payload)
+    return _commit_user_update(db, pending)
+
+
 def deactivate_user(db: Session, user_id: UUID, actor_user_id: UUID) -> UserResponse:
     user = _get_user_or_404(db, user_id)
     if user.id == actor_user_id:
@@ -266,10 +648,65 @@ def deactivate_user(db: Session, user_id: UUID, actor_user_id: UUID) -> UserResp
         logger.exception("Failed deactivating user %s", user_id)
         raise UserServiceError("Unable to deactivate user.", 500) from exc
 
+    principal_cache.invalidate(user.id)
     db.refresh(user)
     return to_user_response(user)
 
 
+def _target_user_error(user: User) -> UserServiceError | None:
+    if user.role != UserRole.USER:
+        return UserServiceError("Coaches can only be assigned to users with role 'user'.", 400)
+    if not user.is_active:
+        return UserServiceError("Cannot assign coaches to a deactivated user.", 400)
+    return None
+
+
+def _coach_error(coach: User) -> UserServiceError | None:
+    if coach.role != UserRole.COACH:
+        return UserServiceError(f"{coach.name} is not a coach.", 400)
+    if not coach.is_active:
+        return UserServiceError(f"{coach.name} is deactivated and cannot be assigned.", 400)
+    return None
+
+
+def _coach_capacity_error(coach: User) -> UserServiceError:
+    return UserServiceError(f"{coach.name} already has {MAX_USERS_PER_COACH} assigned users.", 400)
+
+
+# The coach assignment triggers re-check the cap on write and fail with RAISE EXCEPTION
+# (SQLSTATE P0001), which drivers surface as a generic DBAPIError, not IntegrityError.
+_COACH_CAP_TRIGGER_ERROR = re.compile(r"Coach ([0-9a-f-]{36}) cannot exceed \d+ assigned users")
+
+
+def _coach_cap_violation(exc: DBAPIError, coach_map: dict[UUID, User]) -> UserServiceError | None:
+    match = _COACH_CAP_TRIGGER_ERROR.search(str(exc.orig))
+    if match is None:
+        return None
+    coach = coach_map.get(UUID(match.group(1)))
+    if coach is None:
+        return UserServiceError(
+            f"A selected coach already has {MAX_USERS_PER_COACH} assigned users.", 400
+        )
+    return _coach_capacity_error(coach)
+
+
+def _lock_coaches(db: Session, coach_ids: list[UUID]) -> dict[UUID, User]:
+    # Lock the coach rows (in id order, so concurrent requests cannot deadlock) to make
+    # capacity checks exact; the database trigger re-checks on insert.
+    coaches = (
+        db.scalars(
+            select(User)
+            .where(User.id.in_(coach_ids))
+            .order_by(User.id)
+            .with_for_update()
+            .execution_options(populate_existing=True)
+        )
+        .unique()
+        .all()
+    )
+    return {coach.id: coach for coach in coaches}
+
+
 def assign_coaches_to_user(
     db: Session,
     user_id: UUID,
@@ -277,26 +714,23 @@ def assign_coaches_to_user(
     assigned_by_user_id: UUID,
 ) -> CoachAssignmentResponse:
     target_user = _get_user_or_404(db, user_id)
-    if target_user.role != UserRole.USER:
-        raise UserServiceError("Coaches can only be assigned to users with role 'user'.", 400)
-    if not target_user.is_active:
-        raise UserServiceError("Cannot assign coaches to a deactivated user.", 400)
+    target_error = _target_user_error(target_user)
+    if target_error is not None:
+        raise target_error
 
     unique_coach_ids = list(dict.fromkeys(coach_ids))
     if not unique_coach_ids:
         return CoachAssignmentResponse(user_id=user_id, coaches=_get_assigned_coaches(db, user_id))
 
-    coaches = db.scalars(select(User).where(User.id.in_(unique_coach_ids))).unique().all()
-    coach_map = {coach.id: coach for coach in coaches}
+    coach_map = _lock_coaches(db, unique_coach_ids)
     missing_coach_ids = [coach_id for coach_id in unique_coach_ids if coach_id not in coach_map]
     if missing_coach_ids:
         raise UserServiceError("One or more selected coaches were not found.", 404)
 
-    for coach in coaches:
-        if coach.role != UserRole.COACH:
-            raise UserServiceError(f"{coach.name} is not a coach.", 400)
-        if not coach.is_active:
-            raise UserServiceError(f"{coach.name} is deactivated and cannot be assigned.", 400)
+    for coach in coach_map.values():
+        coach_error = _coach_error(coach)
+        if coach_error is not None:
+            raise coach_error
 
     existing_assignment_ids = set(
         db.scalars(
@@ -311,17 +745,8 @@ def assign_coaches_to_user(
     ]
 
     for coach_id in pending_insert_ids:
-        assigned_count = db.scalar(
-            select(func.count(CoachUserAssignment.id)).where(
-                CoachUserAssignment.coach_id == coach_id
-            )
-        )
-        if assigned_count and int(assigned_count) >= MAX_USERS_PER_COACH:
-            coach_name = coach_map[coach_id].name
-            raise UserServiceError(
-                f"{coach_name} already has {MAX_USERS_PER_COACH} assigned users.",
-                400,
-            )
+        if coach_map[coach_id].assigned_user_count >= MAX_USERS_PER_COACH:
+            raise _coach_capacity_error(coach_map[coach_id])
 
     for coach_id in pending_insert_ids:
         db.add(
@@ -341,10 +766,300 @@ def assign_coaches_to_user(
             "Unable to assign coaches. Verify coach limits and assignments.",
             400,
         ) from exc
+    except DBAPIError as exc:
+        db.rollback()
+        capacity_error = _coach_cap_violation(exc, coach_map)
+        if capacity_error is None:
+            raise
+        raise capacity_error from exc
 
     return CoachAssignmentResponse(user_id=user_id, coaches=_get_assigned_coaches(db, user_id))
 
 
+def bulk_assign_coaches(
+    db: Session,
+    items: list[BulkCoachAssignmentItem],
+    assigned_by_user_id: UUID,
+) -> BulkCoachAssignmentResponse:
+    """Assign coaches to many users with set-based validation and one multi-row insert.
+
+    Each item succeeds or fails as a unit, in request order; a failed item never
+    blocks the others. Capacity is reserved as items are accepted, so later items
+    see the slots taken by earlier ones.
+    """
+
+    user_ids = list(dict.fromkeys(item.user_id for item in items))
+    coach_ids = list(dict.fromkeys(coach_id for item in items for coach_id in item.coach_ids))
+
+    target_users = {
+        user.id: user
+        for user in db.scalars(select(User).where(User.id.in_(user_ids))).unique().all()
+    }
+    coach_map = _lock_coaches(db, coach_ids) if coach_ids else {}
+    existing_pairs: set[tuple[UUID, UUID]] = set()
+    if coach_ids:
+        existing_pairs = {
+            (row.user_id, row.coach_id)
+            for row in db.execute(
+                select(CoachUserAssignment.user_id, CoachUserAssignment.coach_id).where(
+                    CoachUserAssignment.user_id.in_(user_ids),
+                    CoachUserAssignment.coach_id.in_(coach_ids),
+                )
+            )
+        }
+    assigned_counts = {coach_id: coach.assigned_user_count for coach_id, coach in coach_map.items()}
+
+    results: list[BulkCoachAssignmentItemResult] = []
+    pending_rows: list[dict[str, UUID]] = []
+    seen_user_ids: set[UUID] = set()
+
+    def fail(user_id: UUID, error: UserServiceError) -> None:
+        results.append(
+            BulkCoachAssignmentItemResult(user_id=user_id, status="failed", detail=error.detail)
+        )
+
+    for item in items:
+        if item.user_id in seen_user_ids:
+            fail(item.user_id, UserServiceError("User appears more than once in the request.", 400))
+            continue
+        seen_user_ids.add(item.user_id)
+
+        target_user = target_users.get(item.user_id)
+        item_error = (
+            UserServiceError("User not found.", 404)
+            if target_user is None
+            else _target_user_error(target_user)
+        )
+        item_coach_ids = list(dict.fromkeys(item.coach_ids))
+        if item_error is None and any(coach_id not in coach_map for coach_id in item_coach_ids):
+            item_error = UserServiceError("One or more selected coaches were not found.", 404)
+        for coach_id in item_coach_ids:
+            if item_error is not None:
+                break
+            item_error = _coach_error(coach_map[coach_id])
+
+        pending_coach_ids = [
+            coach_id
+            for coach_id in item_coach_ids
+            if (item.user_id, coach_id) not in existing_pairs
+        ]
+        for coach_id in pending_coach_ids:
+            if item_error is not None:
+                break
+            if assigned_counts[coach_id] >= MAX_USERS_PER_COACH:
+                item_error = _coach_capacity_error(coach_map[coach_id])
+
+        if item_error is not None:
+            fail(item.user_id, item_error)
+            continue
+
+        for coach_id in pending_coach_ids:
+            assigned_counts[coach_id] += 1
+            pending_rows.append(
+                {
+                    "id": uuid4(),
+                    "coach_id": coach_id,
+                    "user_id": item.user_id,
+                    "assigned_by": assigned_by_user_id,
+                }
+            )
+        results.append(
+            BulkCoachAssignmentItemResult(
+                user_id=item.user_id,
+                status="assigned" if pending_coach_ids else "unchanged",
+                assigned_coach_ids=pending_coach_ids,
+            )
+        )
+
+    if pending_rows:
+        try:
+            db.execute(insert(CoachUserAssignment).values(pending_rows))
+            db.commit()
+        except IntegrityError as exc:
+            db.rollback()
+            logger.exception("Failed bulk coach assignment of %s rows", len(pending_rows))
+            raise UserServiceError(
+                "Unable to assign coaches. Verify coach limits and assignments.",
+                400,
+            ) from exc
+        except DBAPIError as exc:
+            db.rollback()
+            capacity_error = _coach_cap_violation(exc, coach_map)
+            if capacity_error is None:
+                raise
+            raise capacity_error from exc
+    else:
+        db.rollback()
+
+    return BulkCoachAssignmentResponse(
+        results=results,
+        assigned_count=len(pending_rows),
+        failed_count=sum(1 for result in results if result.status == "failed"),
+    )
+
+
+def rebalance_coach_assignments(
+    db: Session,
+    request: CoachRebalanceRequest,
+    assigned_by_user_id: UUID,
+) -> CoachRebalanceResponse:
+    """Spread users across target coaches, least-loaded first, within the coach cap.
+
+    With a source coach, that coach's users (optionally narrowed to `user_ids`, which
+    must all be assigned to it) are moved off it; otherwise each listed user without a
+    target coach gains one. The plan is applied with one DELETE and one multi-row
+    INSERT in a single transaction, or only returned when `dry_run` is set.
+    """
+
+    source_coach_id = request.source_coach_id
+    target_coach_ids = list(dict.fromkeys(request.target_coach_ids))
+    if source_coach_id is None and not request.user_ids:
+        raise UserServiceError("Provide a source coach or the users to rebalance.", 400)
+    if source_coach_id in target_coach_ids:
+        raise UserServiceError("The source coach cannot also be a target coach.", 400)
+
+    locked_coach_ids = [*target_coach_ids, *([source_coach_id] if source_coach_id else [])]
+    coach_map = _lock_coaches(db, locked_coach_ids)
+    if any(coach_id not in coach_map for coach_id in locked_coach_ids):
+        raise UserServiceError("One or more selected coaches were not found.", 404)
+    if source_coach_id is not None and coach_map[source_coach_id].role != UserRole.COACH:
+        raise UserServiceError(f"{coach_map[source_coach_id].name} is not a coach.", 400)
+    for coach_id in target_coach_ids:
+        coach_error = _coach_error(coach_map[coach_id])
+        if coach_error is not None:
+            raise coach_error
+
+    if source_coach_id is not None:
+        source_statement = select(CoachUserAssignment.user_id).where(
+            CoachUserAssignment.coach_id == source_coach_id
+        )
+        if request.user_ids:
+            source_statement = source_statement.where(
+                CoachUserAssignment.user_id.in_(request.user_ids)
+            )
+        user_ids = sorted(db.scalars(source_statement).all())
+        unassigned_count = len(set(request.user_ids) - set(user_ids))
+        if unassigned_count:
+            raise UserServiceError(
+                f"{unassigned_count} selected users are not assigned to "
+                f"{coach_map[source_coach_id].name}.",
+                400,
+            )
+    else:
+        user_ids = sorted(set(request.user_ids))
+        users = {
+            user.id: user
+            for user in db.scalars(select(User).where(User.id.in_(user_ids))).unique().all()
+        }
+        for user_id in user_ids:
+            user = users.get(user_id)
+            if user is None:
+                raise UserServiceError("User not found.", 404)
+            target_error = _target_user_error(user)
+            if target_error is not None:
+                raise target_error
+
+    covered_user_ids: dict[UUID, set[UUID]] = {}
+    if user_ids:
+        for row in db.execute(
+            select(CoachUserAssignment.user_id, CoachUserAssignment.coach_id).where(
+                CoachUserAssignment.user_id.in_(user_ids),
+                CoachUserAssignment.coach_id.in_(target_coach_ids),
+            )
+        ):
+            covered_user_ids.setdefault(row.user_id, set()).add(row.coach_id)
+
+    loads = {coach_id: coach_map[coach_id].assigned_user_count for coach_id in target_coach_ids}
+    moves: list[CoachRebalanceMove] = []
+    unplaced_user_ids: list[UUID] = []
+    for user_id in user_ids:
+        if user_id in covered_user_ids:
+            # Already coached by a target; only the source assignment (if any) goes away.
+            if source_coach_id is not None:
+                moves.append(CoachRebalanceMove(user_id=user_id, from_coach_id=source_coach_id))
+            continue
+        open_coach_ids = [
+            coach_id for coach_id in target_coach_ids if loads[coach_id] < MAX_USERS_PER_COACH
+        ]
+        if not open_coach_ids:
+            unplaced_user_ids.append(user_id)
+            continue
+        to_coach_id = min(open_coach_ids, key=lambda coach_id: (loads[coach_id], coach_id))
+        loads[to_coach_id] += 1
+        moves.append(
+            CoachRebalanceMove(
+                user_id=user_id, from_coach_id=source_coach_id, to_coach_id=to_coach_id
+            )
+        )
+
+    coach_loads = [
+        CoachLoadResponse(coach_id=coach_id, assigned_user_count=loads[coach_id])
+        for coach_id in target_coach_ids
+    ]
+    if source_coach_id is not None:
+        coach_loads.insert(
+            0,
+            CoachLoadResponse(
+                coach_id=source_coach_id,
+                assigned_user_count=coach_map[source_coach_id].assigned_user_count - len(moves),
+            ),
+        )
+    response = CoachRebalanceResponse(
+        dry_run=request.dry_run,
+        moves=moves,
+        coach_loads=coach_loads,
+        unplaced_user_ids=unplaced_user_ids,
+    )
+
+    if unplaced_user_ids and not request.dry_run:
+        db.rollback()
+        raise UserServiceError(
+            f"Target coaches lack capacity for {len(unplaced_user_ids)} users.",
+            400,
+        )
+    if request.dry_run or not moves:
+        # Releases the coach row locks; nothing was written.
+        db.rollback()
+        return response
+
+    try:
+        if source_coach_id is not None:
+            db.execute(
+                delete(CoachUserAssignment).where(
+                    CoachUserAssignment.coach_id == source_coach_id,
+                    CoachUserAssignment.user_id.in_([move.user_id for move in moves]),
+                )
+            )
+        new_rows = [
+            {
+                "id": uuid4(),
+                "coach_id": move.to_coach_id,
+                "user_id": move.user_id,
+                "assigned_by": assigned_by_user_id,
+            }
+            for move in moves
+            if move.to_coach_id is not None
+        ]
+        if new_rows:
+            db.execute(insert(CoachUserAssignment).values(new_rows))
+        db.commit()
+    except IntegrityError as exc:
+        db.rollback()
+        logger.exception("Failed rebalancing %s coach assignments", len(moves))
+        raise UserServiceError(
+            "Unable to rebalance coach assignments. Verify coach limits and assignments.",
+            400,
+        ) from exc
+    except DBAPIError as exc:
+        db.rollback()
+        capacity_error = _coach_cap_violation(exc, coach_map)
+        if capacity_error is None:
+            raise
+        raise capacity_error from exc
+
+    return response
+
+
 def remove_coach_assignment(db: Session, user_id: UUID, coach_id: UUID) -> CoachAssignmentResponse:
     _ = _get_user_or_404(db, user_id)
     assignment = db.scalar(
@@ -367,7 +1082,7 @@ def remove_coach_assignment(db: Session, user_id: UUID, coach_id: UUID) -> Coach
     return CoachAssignmentResponse(user_id=user_id, coaches=_get_assigned_coaches(db, user_id))
 
 
-def get_admin_overview(db: Session) -> AdminOverviewResponse:
+def _count_admin_overview(db: Session) -> AdminOverviewResponse:
     total_users = db.scalar(select(func.count(User.id)).where(User.role == UserRole.USER)) or 0
     total_coaches = db.scalar(select(func.count(User.id)).where(User.role == UserRole.COACH)) or 0
     total_workouts = db.scalar(select(func.count(Workout.id))) or 0
@@ -381,3 +1096,141 @@ def get_admin_overview(db: Session) -> AdminOverviewResponse:
         active_users=int(active_users),
         inactive_users=int(inactive_users),
     )
+
+
+def _to_admin_overview_response(stats: AdminOverviewStats) -> AdminOverviewResponse:
+    return AdminOverviewResponse(
+        total_users=stats.total_users,
+        total_coaches=stats.total_coaches,
+        total_workouts=stats.total_workouts,
+        active_users=stats.active_users,
+        inactive_users=stats.inactive_users,
+    )
+
+
+def get_admin_overview(db: Session) -> AdminOverviewResponse:
+    stats = db.get(AdminOverviewStats, 1)
+    if stats is None:
+        # Counters not provisioned (e.g. a database without the stats migration).
+        return _count_admin_overview(db)
+    return _to_admin_overview_response(stats)
+
+
+def reconcile_admin_overview_stats(db: Session) -> AdminOverviewResponse:
+    """Recompute the overview counters from scratch and overwrite the stats row.
+
+    The row lock is taken before counting: writers that commit earlier are in the
+    counts, and writers still in flight block on the row and apply their delta after.
+    """
+
+    stats = db.get(AdminOverviewStats, 1, with_for_update=True, populate_existing=True)
+    counts = _count_admin_overview(db)
+    if stats is None:
+        stats = AdminOverviewStats(id=1)
+        db.add(stats)
+    for field_name, value in counts.model_dump().items():
+        setattr(stats, field_name, value)
+    db.commit()
+    return counts
+
+
+# Async variants for request handlers. Database work runs on the AsyncSession's
+# connection via `run_sync`; blocking auth-provider calls are moved to threads.
+
+
+async def list_users_async(db: AsyncSession, query: UserListQuery) -> PaginatedUsersResponse:
+    return await db.run_sync(list_users, query)
+
+
+async def get_user_list_version_async(db: AsyncSession, query: UserListQuery) -> tuple[object, ...]:
+    return await db.run_sync(get_user_list_version, query)
+
+
+async def get_user_detail_async(db: AsyncSession, user_id: UUID) -> UserDetailResponse:
+    return await db.run_sync(get_user_detail, user_id)
+
+
+async def get_user_detail_version_async(db: AsyncSession, user_id: UUID) -> tuple[object, ...]:
+    return await db.run_sync(get_user_detail_version, user_id)
+
+
+async def create_user_async(db: AsyncSession, payload: UserCreateRequest) -> UserResponse:
+    await db.run_sync(_assert_email_available, payload.email)
+    auth_user_id = await asyncio.to_thread(_create_auth_user, payload)
+    try:
+        return await db.run_sync(_insert_local_user, auth_user_id, payload)
+    except UserServiceError:
+        await asyncio.to_thread(_cleanup_auth_user, auth_user_id)
+        raise
+
+
+async def bulk_create_users_async(
+    db: AsyncSession,
+    payloads: list[UserCreateRequest],
+    auth_admin: AuthAdminAPI | None = None,
+) -> BulkUserCreateResponse:
+    outcomes: dict[int, UUID | UserServiceError] = dict(
+        await db.run_sync(_screen_bulk_emails, payloads)
+    )
+    await db.rollback()
+    await asyncio.to_thread(_create_auth_users, payloads, outcomes, auth_admin)
+    users, failed_auth_user_ids = await db.run_sync(_insert_local_users, payloads, outcomes)
+    await asyncio.to_thread(_cleanup_auth_users, failed_auth_user_ids, auth_admin)
+    return _bulk_create_report(payloads, outcomes, users)
+
+
+async def update_user_async(
+    db: AsyncSession, user_id: UUID, payload: UserUpdateRequest
+) -> UserResponse:
+    pending = await db.run_sync(_prepare_user_update, user_id, payload)
+    return await db.run_sync(_commit_user_update, pending)
+
+
+async def deactivate_user_async(
+    db: AsyncSession, user_id: UUID, actor_user_id: UUID
+) -> UserResponse:
+    return await db.run_sync(deactivate_user, user_id, actor_user_id)
+
+
+async def assign_coaches_to_user_async(
+    db: AsyncSession,
+    user_id: UUID,
+    coach_ids: list[UUID],
+    assigned_by_user_id: UUID,
+) -> CoachAssignmentResponse:
+    return await db.run_sync(
+        assign_coaches_to_user,
+        user_id=user_id,
+        coach_ids=coach_ids,
+        assigned_by_user_id=assigned_by_user_id,
+    )
+
+
+async def bulk_assign_coaches_async(
+    db: AsyncSession,
+    items: list[BulkCoachAssignmentItem],
+    assigned_by_user_id: UUID,
+) -> BulkCoachAssignmentResponse:
+    return await db.run_sync(
+        bulk_assign_coaches, items=items, assigned_by_user_id=assigned_by_user_id
+    )
+
+
+async def rebalance_coach_assignments_async(
+    db: AsyncSession,
+    request: CoachRebalanceRequest,
+    assigned_by_user_id: UUID,
+) -> CoachRebalanceResponse:
+    return await db.run_sync(
+        rebalance_coach_assignments, request=request, assigned_by_user_id=assigned_by_user_id
+    )
+
+
+async def remove_coach_assignment_async(
+    db: AsyncSession, user_id: UUID, coach_id: UUID
+) -> CoachAssignmentResponse:
+    return await db.run_sync(remove_coach_assignment, user_id, coach_id)
+
+
+async def get_admin_overview_async(db: AsyncSession) -> AdminOverviewResponse:
+    return await db.run_sync(get_admin_overview)
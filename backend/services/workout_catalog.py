@@ -0,0 +1,468 @@
+"""Per-worker cache of the workout library, versioned by `workout_catalog_version`.
+
+The whole catalog (muscle groups, cardio types, workouts and their muscle-group
+links) is small, read on almost every screen and written only by admins. Each
+worker keeps one immutable snapshot and reloads it when the database version moves
+past the snapshot's; between probes, reads are plain memory lookups. Snapshots also
+carry facet bitmaps, so filtered browsing with counts never queries the database.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import threading
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from datetime import datetime
+from types import MappingProxyType
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from models.enums import WorkoutType
+from models.stats import WorkoutCatalogVersion
+from models.workout import CardioType, MuscleGroup, Workout, WorkoutMuscleGroup
+from schemas.workouts import (
+    WorkoutAlternativesResponse,
+    WorkoutBrowseQuery,
+    WorkoutBrowseResponse,
+)
+from services.workouts import WorkoutServiceError
+
+# Largest `limit` the alternatives endpoint accepts; rankings keep no more than this.
+MAX_SWAP_ALTERNATIVES = 50
+
+
+@dataclass(frozen=True, slots=True)
+class CatalogMuscleGroup:
+    id: UUID
+    name: str
+    icon: str
+    is_default: bool
+
+
+@dataclass(frozen=True, slots=True)
+class CatalogCardioType:
+    id: UUID
+    name: str
+    description: str
+
+
+@dataclass(frozen=True, slots=True)
+class CatalogWorkout:
+    id: UUID
+    name: str
+    description: str | None
+    instructions: str | None
+    type: WorkoutType
+    cardio_type_id: UUID | None
+    is_archived: bool
+    muscle_group_ids: tuple[UUID, ...]
+    created_at: datetime
+    updated_at: datetime
+
+
+@dataclass(frozen=True, slots=True)
+class WorkoutFacetIndex:
+    """Bitmaps over catalog positions: bit `i` stands for `WorkoutCatalog.workouts[i]`.
+
+    Python ints serve as bitsets, so filtering is `&` and counting is `int.bit_count`.
+    """
+
+    all_mask: int
+    archived_mask: int
+    type_masks: Mapping[WorkoutType, int]
+    cardio_type_masks: Mapping[UUID, int]
+    muscle_group_masks: Mapping[UUID, int]
+
+
+@dataclass(frozen=True, slots=True)
+class WorkoutCatalog:
+    """Immutable catalog snapshot; every sequence is ordered by name."""
+
+    version: int
+    muscle_groups: tuple[CatalogMuscleGroup, ...]
+    cardio_types: tuple[CatalogCardioType, ...]
+    workouts: tuple[CatalogWorkout, ...]
+    muscle_groups_by_id: Mapping[UUID, CatalogMuscleGroup]
+    cardio_types_by_id: Mapping[UUID, CatalogCardioType]
+    workouts_by_id: Mapping[UUID, CatalogWorkout]
+    workout_ids_by_muscle_group: Mapping[UUID, tuple[UUID, ...]]
+    workout_positions: Mapping[UUID, int]
+    facets: WorkoutFacetIndex
+    # Top swap candidates per workout, filled on first request and dropped together with
+    # the snapshot. Keys are catalog workouts and each value holds at most
+    # MAX_SWAP_ALTERNATIVES entries, so the memo never outgrows the catalog itself.
+    swap_rankings: dict[UUID, tuple[tuple[int, int], ...]] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+
+    def active_workouts(self) -> tuple[CatalogWorkout, ...]:
+        return tuple(workout for workout in self.workouts if not workout.is_archived)
+
+
+def read_catalog_version(db: Session) -> int:
+    """The cheap staleness probe: one primary-key lookup."""
+
+    version = db.scalar(select(WorkoutCatalogVersion.version).where(WorkoutCatalogVersion.id == 1))
+    return int(version or 0)
+
+
+def _build_facet_index(workouts: tuple[CatalogWorkout, ...]) -> WorkoutFacetIndex:
+    archived_mask = 0
+    type_masks: dict[WorkoutType, int] = dict.fromkeys(WorkoutType, 0)
+    cardio_type_masks: dict[UUID, int] = {}
+    muscle_group_masks: dict[UUID, int] = {}
+    for position, workout in enumerate(workouts):
+        bit = 1 << position
+        if workout.is_archived:
+            archived_mask |= bit
+        type_masks[workout.type] |= bit
+        if workout.cardio_type_id is not None:
+            cardio_type_masks[workout.cardio_type_id] = (
+                cardio_type_masks.get(workout.cardio_type_id, 0) | bit
+            )
+        for muscle_group_id in workout.muscle_group_ids:
+            muscle_group_masks[muscle_group_id] = muscle_group_masks.get(muscle_group_id, 0) | bit
+
+    return WorkoutFacetIndex(
+        all_mask=(1 << len(workouts)) - 1,
+        archived_mask=archived_mask,
+        type_masks=MappingProxyType(type_masks),
+        cardio_type_masks=MappingProxyType(cardio_type_masks),
+        muscle_group_masks=MappingProxyType(muscle_group_masks),
+    )
+
+
+def load_workout_catalog(db: Session) -> WorkoutCatalog:
+    # Read the version first: a write landing mid-load then yields newer data under an
+    # older version, which the next probe reloads, never the reverse.
+    version = read_catalog_version(db)
+
+    muscle_groups = tuple(
+        CatalogMuscleGroup(id=row.id, name=row.name, icon=row.icon, is_default=row.is_default)
+        for row in db.execute(
+            select(
+                MuscleGroup.id, MuscleGroup.name, MuscleGroup.icon, MuscleGroup.is_default
+            ).order_by(MuscleGroup.name)
+        )
+    )
+    cardio_types = tuple(
+        CatalogCardioType(id=row.id, name=row.name, description=row.description)
+        for row in db.execute(
+            select(CardioType.id, CardioType.name, CardioType.description).order_by(CardioType.name)
+        )
+    )
+
+    muscle_group_ids_by_workout: dict[UUID, list[UUID]] = {}
+    workout_ids_by_muscle_group: dict[UUID, list[UUID]] = {}
+    for workout_id, muscle_group_id in db.execute(
+        select(WorkoutMuscleGroup.workout_id, WorkoutMuscleGroup.muscle_group_id)
+    ):
+        muscle_group_ids_by_workout.setdefault(workout_id, []).append(muscle_group_id)
+        workout_ids_by_muscle_group.setdefault(muscle_group_id, []).append(workout_id)
+
+    workouts = tuple(
+        CatalogWorkout(
+            id=row.id,
+            name=row.name,
+            description=row.description,
+            instructions=row.instructions,
+            type=row.type,
+            cardio_type_id=row.cardio_type_id,
+            is_archived=row.is_archived,
+            muscle_group_ids=tuple(muscle_group_ids_by_workout.get(row.id, ())),
+            created_at=row.created_at,
+            updated_at=row.updated_at,
+        )
+        for row in db.execute(
+            select(
+                Workout.id,
+                Workout.name,
+                Workout.description,
+                Workout.instructions,
+                Workout.type,
+                Workout.cardio_type_id,
+                Workout.is_archived,
+                Workout.created_at,
+                Workout.updated_at,
+            ).order_by(Workout.name)
+        )
+    )
+    workout_order = {workout.id: index for index, workout in enumerate(workouts)}
+
+    return WorkoutCatalog(
+        version=version,
+        muscle_groups=muscle_groups,
+        cardio_types=cardio_types,
+        workouts=workouts,
+        muscle_groups_by_id=MappingProxyType({group.id: group for group in muscle_groups}),
+        cardio_types_by_id=MappingProxyType({cardio.id: cardio for cardio in cardio_types}),
+        workouts_by_id=MappingProxyType({workout.id: workout for workout in workouts}),
+        workout_ids_by_muscle_group=MappingProxyType(
+            {
+                # Links and workouts are read by separate statements, so a workout deleted
+                # in between can leave dangling links. Its delete bumped the version, so the
+                # next probe reloads; until then those links are simply skipped.
+                muscle_group_id: tuple(
+                    sorted(
+                        (workout_id for workout_id in workout_ids if workout_id in workout_order),
+                        key=workout_order.__getitem__,
+                    )
+                )
+                for muscle_group_id, workout_ids in workout_ids_by_muscle_group.items()
+            }
+        ),
+        workout_positions=MappingProxyType(workout_order),
+        facets=_build_facet_index(workouts),
+    )
+
+
+class WorkoutCatalogCache:
+    """Holds the current catalog snapshot for this worker.
+
+    `get` probes the database version at most once per `probe_interval` seconds and
+    reloads only when it changed. No lock is held across database IO: sync sessions run
+    on the event loop thread under `run_sync`, where blocking on a lock held by a
+    suspended request would stall the loop. Async callers share one in-flight refresh.
+    """
+
+    def __init__(self, *, probe_interval: float) -> None:
+        self.probe_interval = probe_interval
+        self._catalog: WorkoutCatalog | None = None
+        self._probed_at = float("-inf")
+        self._lock = threading.Lock()
+        self._refreshing: asyncio.Future[WorkoutCatalog] | None = None
+        self.hits = 0
+        self.probes = 0
+        self.reloads = 0
+
+    def _fresh(self) -> WorkoutCatalog | None:
+        catalog = self._catalog
+        if catalog is not None and time.monotonic() - self._probed_at < self.probe_interval:
+            self.hits += 1
+            return catalog
+        return None
+
+    def _refresh(self, db: Session) -> WorkoutCatalog:
+        self.probes += 1
+        catalog = self._catalog
+        # Versions only grow; a lagging replica reporting an older one keeps the snapshot.
+        if catalog is None or read_catalog_version(db) > catalog.version:
+            catalog = load_workout_catalog(db)
+            self.reloads += 1
+        with self._lock:
+            current = self._catalog
+            if current is None or catalog.version >= current.version:
+                self._catalog = current = catalog
+            self._probed_at = time.monotonic()
+        return current
+
+    def get(self, db: Session) -> WorkoutCatalog:
+        return self._fresh() or self._refresh(db)
+
+    async def get_async(self, db: AsyncSession) -> WorkoutCatalog:
+        catalog = self._fresh()
+        if catalog is not None:
+            return catalog
+
+        loop = asyncio.get_running_loop()
+        refreshing = self._refreshing
+        if refreshing is not None and refreshing.get_loop() is loop:
+            return await asyncio.shield(refreshing)
+
+        refreshing = self._refreshing = loop.create_future()
+        try:
+            catalog = await db.run_sync(self._refresh)
+        except BaseException as exc:
+            refreshing.set_exception(exc)
+            # Mark retrieved: waiters re-raise it, and with none it is not an orphan.
+            refreshing.exception()
+            raise
+        else:
+            refreshing.set_result(catalog)
+            return catalog
+        finally:
+            self._refreshing = None
+
+    def invalidate(self) -> None:
+        """Force a probe on the next read, e.g. right after this worker wrote the catalog."""
+
+        with self._lock:
+            self._probed_at = float("-inf")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._catalog = None
+            self._probed_at = float("-inf")
+
+
+workout_catalog_cache = WorkoutCatalogCache(probe_interval=settings.workout_catalog_probe_seconds)
+
+
+def get_workout_catalog(db: Session) -> WorkoutCatalog:
+    return workout_catalog_cache.get(db)
+
+
+async def get_workout_catalog_async(db: AsyncSession) -> WorkoutCatalog:
+    return await workout_catalog_cache.get_async(db)
+
+
+def _mask_positions(mask: int, skip: int, limit: int) -> list[int]:
+    # Scan the little-endian bit string with str.find: C-speed even for 10k+ workouts.
+    bits = bin(mask)[:1:-1]
+    positions: list[int] = []
+    position = -1
+    seen = 0
+    while len(positions) < limit:
+        position = bits.find("1", position + 1)
+        if position < 0:
+            break
+        if seen >= skip:
+            positions.append(position)
+        seen += 1
+    return positions
+
+
+def browse_workout_catalog(
+    catalog: WorkoutCatalog, query: WorkoutBrowseQuery
+) -> WorkoutBrowseResponse:
+    """One page of catalog workouts plus every facet count, computed from the bitmaps."""
+
+    facets = catalog.facets
+    if query.is_archived is None:
+        archived_mask = facets.all_mask
+    elif query.is_archived:
+        archived_mask = facets.archived_mask
+    else:
+        archived_mask = facets.all_mask & ~facets.archived_mask
+    type_mask = facets.all_mask if query.type is None else facets.type_masks[query.type]
+    cardio_type_mask = (
+        facets.all_mask
+        if query.cardio_type_id is None
+        else facets.cardio_type_masks.get(query.cardio_type_id, 0)
+    )
+    muscle_group_mask = (
+        facets.all_mask
+        if query.muscle_group_id is None
+        else facets.muscle_group_masks.get(query.muscle_group_id, 0)
+    )
+
+    result_mask = archived_mask & type_mask & cardio_type_mask & muscle_group_mask
+    without_muscle_group = archived_mask & type_mask & cardio_type_mask
+    without_cardio_type = archived_mask & type_mask & muscle_group_mask
+    without_type = archived_mask & cardio_type_mask & muscle_group_mask
+
+    positions = _mask_positions(
+        result_mask, skip=(query.page - 1) * query.page_size, limit=query.page_size
+    )
+    return WorkoutBrowseResponse.model_validate(
+        {
+            "version": catalog.version,
+            "items": [catalog.workouts[position] for position in positions],
+            "page": query.page,
+            "page_size": query.page_size,
+            "total": result_mask.bit_count(),
+            "muscle_groups": [
+                {
+                    "id": group.id,
+                    "name": group.name,
+                    "count": (
+                        without_muscle_group & facets.muscle_group_masks.get(group.id, 0)
+                    ).bit_count(),
+                }
+                for group in catalog.muscle_groups
+            ],
+            "cardio_types": [
+                {
+                    "id": cardio.id,
+                    "name": cardio.name,
+                    "count": (
+                        without_cardio_type & facets.cardio_type_masks.get(cardio.id, 0)
+                    ).bit_count(),
+                }
+                for cardio in catalog.cardio_types
+            ],
+            "types": [
+                {"type": workout_type, "count": (without_type & mask).bit_count()}
+                for workout_type, mask in facets.type_masks.items()
+            ],
+        },
+        from_attributes=True,
+    )
+
+
+async def browse_workouts_async(
+    db: AsyncSession, query: WorkoutBrowseQuery
+) -> WorkoutBrowseResponse:
+    return browse_workout_catalog(await get_workout_catalog_async(db), query)
+
+
+def _rank_swap_candidates(
+    catalog: WorkoutCatalog, workout: CatalogWorkout
+) -> tuple[tuple[int, int], ...]:
+    """(position, shared muscle groups) of the best active workouts sharing a muscle group.
+
+    Most shared muscle groups first, then same type, then same cardio type, then name;
+    only the first MAX_SWAP_ALTERNATIVES are kept.
+    """
+
+    facets = catalog.facets
+    candidate_mask = 0
+    for muscle_group_id in workout.muscle_group_ids:
+        candidate_mask |= facets.muscle_group_masks.get(muscle_group_id, 0)
+    candidate_mask &= ~facets.archived_mask & ~(1 << catalog.workout_positions[workout.id])
+
+    muscle_group_ids = frozenset(workout.muscle_group_ids)
+    ranked = []
+    for position in _mask_positions(candidate_mask, skip=0, limit=candidate_mask.bit_count()):
+        candidate = catalog.workouts[position]
+        shared = len(muscle_group_ids.intersection(candidate.muscle_group_ids))
+        ranked.append(
+            (
+                -shared,
+                candidate.type is not workout.type,
+                candidate.cardio_type_id != workout.cardio_type_id,
+                position,
+                shared,
+            )
+        )
+    best = heapq.nsmallest(MAX_SWAP_ALTERNATIVES, ranked)
+    return tuple((position, shared) for *_, position, shared in best)
+
+
+def find_swap_alternatives(
+    catalog: WorkoutCatalog, workout_id: UUID, limit: int
+) -> WorkoutAlternativesResponse:
+    workout = catalog.workouts_by_id.get(workout_id)
+    if workout is None:
+        raise WorkoutServiceError("Workout not found.", 404)
+
+    ranking = catalog.swap_rankings.get(workout_id)
+    if ranking is None:
+        # Concurrent first requests may both rank; either result is identical.
+        ranking = _rank_swap_candidates(catalog, workout)
+        catalog.swap_rankings[workout_id] = ranking
+
+    return WorkoutAlternativesResponse.model_validate(
+        {
+            "version": catalog.version,
+            "workout_id": workout_id,
+            "items": [
+                {"workout": catalog.workouts[position], "shared_muscle_group_count": shared}
+                for position, shared in ranking[:limit]
+            ],
+        },
+        from_attributes=True,
+    )
+
+
+async def find_swap_alternatives_async(
+    db: AsyncSession, workout_id: UUID, limit: int
+) -> WorkoutAlternativesResponse:
+    return find_swap_alternatives(await get_workout_catalog_async(db), workout_id, limit)
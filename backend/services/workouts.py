@@ -0,0 +1,261 @@
+"""Workout library services."""
+
+from __future__ import annotations
+
+from uuid import UUID
+
+from sqlalchemy import ColumnElement, Exists, and_, exists, func, literal_column, select, update
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from models.enums import PlanAssignmentStatus
+from models.plan import PlanAssignment, PlanDay, PlanDayWorkout, WorkoutPlan
+from models.workout import Workout, WorkoutMuscleGroup
+from schemas.workouts import (
+    SEARCH_TERM_PATTERN,
+    BlockingPlanResponse,
+    WorkoutArchiveItemResult,
+    WorkoutArchiveResponse,
+    WorkoutSearchQuery,
+    WorkoutSearchResponse,
+)
+
+
+class WorkoutServiceError(Exception):
+    """Raised for client-safe workout library failures."""
+
+    def __init__(self, detail: str, status_code: int) -> None:
+        super().__init__(detail)
+        self.detail = detail
+        self.status_code = status_code
+
+
+SEARCH_CONFIG = "english"
+MAX_SEARCH_TERMS = 8
+
+# Generated and GIN-indexed by migration 202602090012. It is left unmapped on `Workout`
+# because SQLite test schemas have no tsvector type.
+_SEARCH_VECTOR = literal_column("workouts.search_vector", type_=TSVECTOR)
+
+_SEARCH_COLUMNS = (
+    Workout.id,
+    Workout.name,
+    Workout.description,
+    Workout.type,
+    Workout.cardio_type_id,
+    Workout.is_archived,
+)
+
+
+def _search_terms(text: str) -> list[str]:
+    return SEARCH_TERM_PATTERN.findall(text.lower())[:MAX_SEARCH_TERMS]
+
+
+def _full_text_criteria(text: str) -> tuple[ColumnElement[bool], ColumnElement[float]]:
+    """Match predicate and the `ts_rank_cd` score to order by.
+
+    Every term must match and the last-typed forms are prefixes (`bench pre` finds
+    "Bench Press"), so the query stays answerable from `ix_workouts_search_vector`.
+    """
+
+    # Terms are letters and digits only, so they cannot inject tsquery operators.
+    ts_query = func.to_tsquery(
+        SEARCH_CONFIG, " & ".join(f"{term}:*" for term in _search_terms(text))
+    )
+    return _SEARCH_VECTOR.op("@@")(ts_query), func.ts_rank_cd(_SEARCH_VECTOR, ts_query)
+
+
+def search_workouts(db: Session, query: WorkoutSearchQuery) -> WorkoutSearchResponse:
+    search_filter, rank = _full_text_criteria(query.q)
+    filters = [search_filter]
+    if query.type is not None:
+        filters.append(Workout.type == query.type)
+    if query.cardio_type_id is not None:
+        filters.append(Workout.cardio_type_id == query.cardio_type_id)
+    if query.is_archived is not None:
+        filters.append(Workout.is_archived.is_(query.is_archived))
+    if query.muscle_group_id is not None:
+        filters.append(
+            exists().where(
+                WorkoutMuscleGroup.workout_id == Workout.id,
+                WorkoutMuscleGroup.muscle_group_id == query.muscle_group_id,
+            )
+        )
+
+    # The window count rides along with the page, so matches are found in one index scan.
+    rows = db.execute(
+        select(
+            *_SEARCH_COLUMNS,
+            rank.label("rank"),
+            func.count().over().label("total"),
+        )
+        .where(*filters)
+        .order_by(rank.desc(), Workout.name, Workout.id)
+        .limit(query.page_size)
+        .offset((query.page - 1) * query.page_size)
+    ).all()
+
+    if rows:
+        total = int(rows[0].total)
+    elif query.page > 1:
+        total = db.scalar(select(func.count(Workout.id)).where(*filters)) or 0
+    else:
+        total = 0
+
+    return WorkoutSearchResponse.model_validate(
+        {
+            "items": [row._mapping for row in rows],
+            "page": query.page,
+            "page_size": query.page_size,
+            "total": total,
+        }
+    )
+
+
+def _blocking_plans(db: Session, workout_ids: list[UUID]) -> dict[UUID, list[BlockingPlanResponse]]:
+    """Plans with active assignments that use any of `workout_ids`, in one grouped query.
+
+    Walks plan_day_workouts -> plan_days -> plan_assignments from the workout side, which
+    `ix_plan_day_workouts_workout_id` and the partial `ix_plan_assignments_active_plan_id`
+    serve without scanning either table.
+    """
+
+    rows = db.execute(
+        select(
+            PlanDayWorkout.workout_id,
+            WorkoutPlan.id,
+            WorkoutPlan.name,
+            func.count(func.distinct(PlanAssignment.id)).label("active_assignment_count"),
+        )
+        .join(PlanDay, PlanDay.id == PlanDayWorkout.plan_day_id)
+        .join(WorkoutPlan, WorkoutPlan.id == PlanDay.plan_id)
+        .join(
+            PlanAssignment,
+            and_(
+                PlanAssignment.plan_id == WorkoutPlan.id,
+                PlanAssignment.status == PlanAssignmentStatus.ACTIVE,
+            ),
+        )
+        .where(PlanDayWorkout.workout_id.in_(workout_ids))
+        .group_by(PlanDayWorkout.workout_id, WorkoutPlan.id, WorkoutPlan.name)
+        .order_by(PlanDayWorkout.workout_id, WorkoutPlan.name, WorkoutPlan.id)
+    ).all()
+
+    blocking: dict[UUID, list[BlockingPlanResponse]] = {}
+    for row in rows:
+        blocking.setdefault(row.workout_id, []).append(
+            BlockingPlanResponse(
+                id=row.id, name=row.name, active_assignment_count=row.active_assignment_count
+            )
+        )
+    return blocking
+
+
+def _used_by_active_plan(workout_id: ColumnElement[UUID]) -> Exists:
+    return exists().where(
+        PlanDayWorkout.workout_id == workout_id,
+        PlanDay.id == PlanDayWorkout.plan_day_id,
+        PlanAssignment.plan_id == PlanDay.plan_id,
+        PlanAssignment.status == PlanAssignmentStatus.ACTIVE,
+    )
+
+
+def _lock_plans_using(db: Session, workout_ids: list[UUID]) -> None:
+    """Lock every plan that uses `workout_ids` until the archiving transaction ends.
+
+    Inserting a plan assignment takes FOR KEY SHARE on its plan to check the foreign
+    key, which waits on FOR UPDATE, so none of these plans can gain an assignment while
+    the dependency check and the archive UPDATE run.
+    """
+
+    plan_ids = (
+        select(PlanDay.plan_id)
+        .join(PlanDayWorkout, PlanDayWorkout.plan_day_id == PlanDay.id)
+        .where(PlanDayWorkout.workout_id.in_(workout_ids))
+    )
+    db.execute(
+        select(WorkoutPlan.id)
+        .where(WorkoutPlan.id.in_(plan_ids))
+        .order_by(WorkoutPlan.id)
+        .with_for_update()
+    ).all()
+
+
+def archive_workouts(db: Session, workout_ids: list[UUID]) -> WorkoutArchiveResponse:
+    """Archive many workouts at once; those used by an active plan are reported, not archived.
+
+    Four statements whatever the batch size: lock the workouts and the plans using them,
+    check dependencies, and archive the unblocked ones with a single UPDATE.
+    """
+
+    workout_ids = list(dict.fromkeys(workout_ids))
+    # Lock in id order so overlapping batches cannot deadlock.
+    archived_by_id = dict(
+        db.execute(
+            select(Workout.id, Workout.is_archived)
+            .where(Workout.id.in_(workout_ids))
+            .order_by(Workout.id)
+            .with_for_update()
+        ).all()
+    )
+    active_ids = [
+        workout_id for workout_id, is_archived in archived_by_id.items() if not is_archived
+    ]
+    blocking: dict[UUID, list[BlockingPlanResponse]] = {}
+    if active_ids:
+        _lock_plans_using(db, active_ids)
+        blocking = _blocking_plans(db, active_ids)
+
+    to_archive = [workout_id for workout_id in active_ids if workout_id not in blocking]
+    archived_ids: set[UUID] = set()
+    if to_archive:
+        # Re-check inside the UPDATE: an existing assignment switched to active after the
+        # dependency check is not held back by the plan lock.
+        archived_ids = set(
+            db.scalars(
+                update(Workout)
+                .where(Workout.id.in_(to_archive), ~_used_by_active_plan(Workout.id))
+                .values(is_archived=True)
+                .returning(Workout.id)
+            )
+        )
+        late_blocked = [workout_id for workout_id in to_archive if workout_id not in archived_ids]
+        if late_blocked:
+            blocking.update(_blocking_plans(db, late_blocked))
+    db.commit()
+
+    results: list[WorkoutArchiveItemResult] = []
+    for workout_id in workout_ids:
+        if workout_id not in archived_by_id:
+            results.append(WorkoutArchiveItemResult(workout_id=workout_id, status="not_found"))
+        elif archived_by_id[workout_id]:
+            results.append(WorkoutArchiveItemResult(workout_id=workout_id, status="unchanged"))
+        elif workout_id in archived_ids:
+            results.append(WorkoutArchiveItemResult(workout_id=workout_id, status="archived"))
+        else:
+            results.append(
+                WorkoutArchiveItemResult(
+                    workout_id=workout_id,
+                    status="blocked",
+                    blocking_plans=blocking.get(workout_id, []),
+                )
+            )
+
+    return WorkoutArchiveResponse(
+        results=results,
+        archived_count=len(archived_ids),
+        blocked_count=sum(result.status == "blocked" for result in results),
+    )
+
+
+async def search_workouts_async(
+    db: AsyncSession, query: WorkoutSearchQuery
+) -> WorkoutSearchResponse:
+    return await db.run_sync(search_workouts, query)
+
+
+async def archive_workouts_async(
+    db: AsyncSession, workout_ids: list[UUID]
+) -> WorkoutArchiveResponse:
+    return await db.run_sync(archive_workouts, workout_ids)
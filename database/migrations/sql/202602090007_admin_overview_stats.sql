@@ -0,0 +1,131 @@
+CREATE TABLE public.admin_overview_stats (
+    id smallint PRIMARY KEY DEFAULT 1 CHECK (id = 1),
+    total_users bigint NOT NULL DEFAULT 0,
+    total_coaches bigint NOT NULL DEFAULT 0,
+    total_workouts bigint NOT NULL DEFAULT 0,
+    active_users bigint NOT NULL DEFAULT 0,
+    inactive_users bigint NOT NULL DEFAULT 0,
+    updated_at timestamptz NOT NULL DEFAULT now()
+);
+
+ALTER TABLE public.admin_overview_stats ENABLE ROW LEVEL SECURITY;
+
+INSERT INTO public.admin_overview_stats (
+    id, total_users, total_coaches, total_workouts, active_users, inactive_users
+)
+SELECT
+    1,
+    (SELECT COUNT(*) FROM public.users WHERE role = 'user'::user_role),
+    (SELECT COUNT(*) FROM public.users WHERE role = 'coach'::user_role),
+    (SELECT COUNT(*) FROM public.workouts),
+    (SELECT COUNT(*) FROM public.users WHERE is_active),
+    (SELECT COUNT(*) FROM public.users WHERE NOT is_active);
+
+-- Statement-level triggers: one counter update per statement regardless of row count.
+-- Transition tables cannot be shared across events, so each event gets its own trigger.
+CREATE OR REPLACE FUNCTION public.apply_user_overview_delta()
+RETURNS trigger
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+    delta_users bigint := 0;
+    delta_coaches bigint := 0;
+    delta_active bigint := 0;
+    delta_inactive bigint := 0;
+BEGIN
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        SELECT
+            COUNT(*) FILTER (WHERE role = 'user'::user_role),
+            COUNT(*) FILTER (WHERE role = 'coach'::user_role),
+            COUNT(*) FILTER (WHERE is_active),
+            COUNT(*) FILTER (WHERE NOT is_active)
+        INTO delta_users, delta_coaches, delta_active, delta_inactive
+        FROM new_rows;
+    END IF;
+
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        SELECT
+            delta_users - COUNT(*) FILTER (WHERE role = 'user'::user_role),
+            delta_coaches - COUNT(*) FILTER (WHERE role = 'coach'::user_role),
+            delta_active - COUNT(*) FILTER (WHERE is_active),
+            delta_inactive - COUNT(*) FILTER (WHERE NOT is_active)
+        INTO delta_users, delta_coaches, delta_active, delta_inactive
+        FROM old_rows;
+    END IF;
+
+    -- Name/email edits leave every counter unchanged; skip the row lock entirely.
+    IF delta_users = 0 AND delta_coaches = 0 AND delta_active = 0 AND delta_inactive = 0 THEN
+        RETURN NULL;
+    END IF;
+
+    UPDATE public.admin_overview_stats
+    SET total_users = total_users + delta_users,
+        total_coaches = total_coaches + delta_coaches,
+        active_users = active_users + delta_active,
+        inactive_users = inactive_users + delta_inactive,
+        updated_at = now()
+    WHERE id = 1;
+
+    RETURN NULL;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION public.apply_workout_overview_delta()
+RETURNS trigger
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+    delta_workouts bigint;
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        SELECT COUNT(*) INTO delta_workouts FROM new_rows;
+    ELSE
+        SELECT -COUNT(*) INTO delta_workouts FROM old_rows;
+    END IF;
+
+    IF delta_workouts = 0 THEN
+        RETURN NULL;
+    END IF;
+
+    UPDATE public.admin_overview_stats
+    SET total_workouts = total_workouts + delta_workouts,
+        updated_at = now()
+    WHERE id = 1;
+
+    RETURN NULL;
+END;
+$$;
+
+CREATE TRIGGER trg_users_overview_insert
+AFTER INSERT ON public.users
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT
+EXECUTE FUNCTION public.apply_user_overview_delta();
+
+CREATE TRIGGER trg_users_overview_update
+AFTER UPDATE ON public.users
+REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+FOR EACH STATEMENT
+EXECUTE FUNCTION public.apply_user_overview_delta();
+
+CREATE TRIGGER trg_users_overview_delete
+AFTER DELETE ON public.users
+REFERENCING OLD TABLE AS old_rows
+FOR EACH STATEMENT
+EXECUTE FUNCTION public.apply_user_overview_delta();
+
+CREATE TRIGGER trg_workouts_overview_insert
+AFTER INSERT ON public.workouts
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT
+EXECUTE FUNCTION public.apply_workout_overview_delta();
+
+CREATE TRIGGER trg_workouts_overview_delete
+AFTER DELETE ON public.workouts
+REFERENCING OLD TABLE AS old_rows
+FOR EACH STATEMENT
+EXECUTE FUNCTION public.apply_workout_overview_delta();
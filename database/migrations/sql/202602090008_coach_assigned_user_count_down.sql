@@ -0,0 +1,60 @@
+DROP TRIGGER IF EXISTS trg_coach_assignment_count ON public.coach_user_assignments;
+DROP FUNCTION IF EXISTS public.maintain_coach_assigned_user_count();
+
+CREATE OR REPLACE FUNCTION public.enforce_coach_assignment_rules()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    coach_role user_role;
+    user_role_value user_role;
+    assigned_by_role user_role;
+    assignment_count integer;
+BEGIN
+    IF TG_OP = 'UPDATE' AND OLD.coach_id = NEW.coach_id THEN
+        assignment_count := (
+            SELECT COUNT(*)
+            FROM coach_user_assignments
+            WHERE coach_id = NEW.coach_id
+              AND id <> NEW.id
+        );
+    ELSE
+        assignment_count := (
+            SELECT COUNT(*)
+            FROM coach_user_assignments
+            WHERE coach_id = NEW.coach_id
+        );
+    END IF;
+
+    IF assignment_count >= 50 THEN
+        RAISE EXCEPTION 'Coach % cannot exceed 50 assigned users', NEW.coach_id;
+    END IF;
+
+    SELECT role INTO coach_role FROM users WHERE id = NEW.coach_id;
+    IF coach_role IS DISTINCT FROM 'coach'::user_role THEN
+        RAISE EXCEPTION 'coach_id % must reference a user with coach role', NEW.coach_id;
+    END IF;
+
+    SELECT role INTO user_role_value FROM users WHERE id = NEW.user_id;
+    IF user_role_value IS DISTINCT FROM 'user'::user_role THEN
+        RAISE EXCEPTION 'user_id % must reference a user with user role', NEW.user_id;
+    END IF;
+
+    SELECT role INTO assigned_by_role FROM users WHERE id = NEW.assigned_by;
+    IF assigned_by_role IS DISTINCT FROM 'admin'::user_role THEN
+        RAISE EXCEPTION 'assigned_by % must reference a user with admin role', NEW.assigned_by;
+    END IF;
+
+    RETURN NEW;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS trg_users_set_updated_at ON public.users;
+CREATE TRIGGER trg_users_set_updated_at
+BEFORE UPDATE ON public.users
+FOR EACH ROW
+EXECUTE FUNCTION public.set_updated_at();
+
+ALTER TABLE public.users
+    DROP CONSTRAINT IF EXISTS ck_users_assigned_user_count_non_negative,
+    DROP COLUMN IF EXISTS assigned_user_count;
@@ -0,0 +1,86 @@
+ALTER TABLE public.users
+    ADD COLUMN assigned_user_count integer NOT NULL DEFAULT 0,
+    ADD CONSTRAINT ck_users_assigned_user_count_non_negative CHECK (assigned_user_count >= 0);
+
+-- Counter changes are bookkeeping, not profile edits; keep updated_at untouched for them.
+DROP TRIGGER IF EXISTS trg_users_set_updated_at ON public.users;
+CREATE TRIGGER trg_users_set_updated_at
+BEFORE UPDATE ON public.users
+FOR EACH ROW
+WHEN (OLD.assigned_user_count IS NOT DISTINCT FROM NEW.assigned_user_count)
+EXECUTE FUNCTION public.set_updated_at();
+
+UPDATE public.users AS u
+SET assigned_user_count = counts.assignment_count
+FROM (
+    SELECT coach_id, COUNT(*) AS assignment_count
+    FROM public.coach_user_assignments
+    GROUP BY coach_id
+) AS counts
+WHERE u.id = counts.coach_id;
+
+-- Role checks stay BEFORE the write; capacity moves to the counter below.
+CREATE OR REPLACE FUNCTION public.enforce_coach_assignment_rules()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    coach_role user_role;
+    user_role_value user_role;
+    assigned_by_role user_role;
+BEGIN
+    SELECT role INTO coach_role FROM users WHERE id = NEW.coach_id;
+    IF coach_role IS DISTINCT FROM 'coach'::user_role THEN
+        RAISE EXCEPTION 'coach_id % must reference a user with coach role', NEW.coach_id;
+    END IF;
+
+    SELECT role INTO user_role_value FROM users WHERE id = NEW.user_id;
+    IF user_role_value IS DISTINCT FROM 'user'::user_role THEN
+        RAISE EXCEPTION 'user_id % must reference a user with user role', NEW.user_id;
+    END IF;
+
+    SELECT role INTO assigned_by_role FROM users WHERE id = NEW.assigned_by;
+    IF assigned_by_role IS DISTINCT FROM 'admin'::user_role THEN
+        RAISE EXCEPTION 'assigned_by % must reference a user with admin role', NEW.assigned_by;
+    END IF;
+
+    RETURN NEW;
+END;
+$$;
+
+-- AFTER row trigger: only rows that were actually written (not ON CONFLICT skips) count.
+-- The guarded UPDATE takes the coach row lock, so concurrent assignments serialize on the
+-- coach and can never push the counter past the cap.
+CREATE OR REPLACE FUNCTION public.maintain_coach_assigned_user_count()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    IF TG_OP = 'UPDATE' AND OLD.coach_id = NEW.coach_id THEN
+        RETURN NULL;
+    END IF;
+
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        UPDATE users
+        SET assigned_user_count = assigned_user_count - 1
+        WHERE id = OLD.coach_id;
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        UPDATE users
+        SET assigned_user_count = assigned_user_count + 1
+        WHERE id = NEW.coach_id
+          AND assigned_user_count < 50;
+        IF NOT FOUND THEN
+            RAISE EXCEPTION 'Coach % cannot exceed 50 assigned users', NEW.coach_id;
+        END IF;
+    END IF;
+
+    RETURN NULL;
+END;
+$$;
+
+CREATE TRIGGER trg_coach_assignment_count
+AFTER INSERT OR UPDATE OF coach_id OR DELETE ON public.coach_user_assignments
+FOR EACH ROW
+EXECUTE FUNCTION public.maintain_coach_assigned_user_count();
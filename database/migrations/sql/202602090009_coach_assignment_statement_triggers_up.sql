@@ -0,0 +1,140 @@
+-- Replace the per-row coach assignment triggers with statement-level ones. Each statement
+-- validates its whole batch with a handful of set-based queries over the transition
+-- tables, whatever the row count. Error messages match the per-row versions.
+DROP TRIGGER IF EXISTS trg_coach_assignment_rules ON public.coach_user_assignments;
+DROP TRIGGER IF EXISTS trg_coach_assignment_count ON public.coach_user_assignments;
+DROP FUNCTION IF EXISTS public.maintain_coach_assigned_user_count();
+DROP FUNCTION IF EXISTS public.enforce_coach_assignment_rules();
+
+CREATE OR REPLACE FUNCTION public.apply_coach_assignment_deltas(
+    delta_coach_ids uuid[],
+    delta_counts bigint[]
+)
+RETURNS void
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    over_capacity_coach uuid;
+BEGIN
+    -- Lock in id order so concurrent batches touching the same coaches cannot deadlock.
+    PERFORM 1
+    FROM users
+    WHERE id = ANY(delta_coach_ids)
+    ORDER BY id
+    FOR UPDATE;
+
+    SELECT deltas.coach_id INTO over_capacity_coach
+    FROM unnest(delta_coach_ids, delta_counts) AS deltas(coach_id, assignment_delta)
+    JOIN users ON users.id = deltas.coach_id
+    WHERE deltas.assignment_delta > 0
+      AND users.assigned_user_count + deltas.assignment_delta > 50
+    ORDER BY deltas.coach_id
+    LIMIT 1;
+
+    IF over_capacity_coach IS NOT NULL THEN
+        RAISE EXCEPTION 'Coach % cannot exceed 50 assigned users', over_capacity_coach;
+    END IF;
+
+    UPDATE users
+    SET assigned_user_count = users.assigned_user_count + deltas.assignment_delta
+    FROM unnest(delta_coach_ids, delta_counts) AS deltas(coach_id, assignment_delta)
+    WHERE users.id = deltas.coach_id
+      AND deltas.assignment_delta <> 0;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION public.enforce_coach_assignment_batch()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    invalid_id uuid;
+    delta_coach_ids uuid[];
+    delta_counts bigint[];
+BEGIN
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        SELECT new_rows.coach_id INTO invalid_id
+        FROM new_rows
+        LEFT JOIN users ON users.id = new_rows.coach_id
+        WHERE users.role IS DISTINCT FROM 'coach'::user_role
+        LIMIT 1;
+        IF FOUND THEN
+            RAISE EXCEPTION 'coach_id % must reference a user with coach role', invalid_id;
+        END IF;
+
+        SELECT new_rows.user_id INTO invalid_id
+        FROM new_rows
+        LEFT JOIN users ON users.id = new_rows.user_id
+        WHERE users.role IS DISTINCT FROM 'user'::user_role
+        LIMIT 1;
+        IF FOUND THEN
+            RAISE EXCEPTION 'user_id % must reference a user with user role', invalid_id;
+        END IF;
+
+        SELECT new_rows.assigned_by INTO invalid_id
+        FROM new_rows
+        LEFT JOIN users ON users.id = new_rows.assigned_by
+        WHERE users.role IS DISTINCT FROM 'admin'::user_role
+        LIMIT 1;
+        IF FOUND THEN
+            RAISE EXCEPTION 'assigned_by % must reference a user with admin role', invalid_id;
+        END IF;
+    END IF;
+
+    IF TG_OP = 'INSERT' THEN
+        SELECT array_agg(coach_id), array_agg(assignment_delta)
+        INTO delta_coach_ids, delta_counts
+        FROM (
+            SELECT coach_id, COUNT(*) AS assignment_delta
+            FROM new_rows
+            GROUP BY coach_id
+        ) AS deltas;
+    ELSIF TG_OP = 'DELETE' THEN
+        SELECT array_agg(coach_id), array_agg(assignment_delta)
+        INTO delta_coach_ids, delta_counts
+        FROM (
+            SELECT coach_id, -COUNT(*) AS assignment_delta
+            FROM old_rows
+            GROUP BY coach_id
+        ) AS deltas;
+    ELSE
+        SELECT array_agg(coach_id), array_agg(assignment_delta)
+        INTO delta_coach_ids, delta_counts
+        FROM (
+            SELECT coach_id, SUM(change) AS assignment_delta
+            FROM (
+                SELECT coach_id, 1 AS change FROM new_rows
+                UNION ALL
+                SELECT coach_id, -1 AS change FROM old_rows
+            ) AS changes
+            GROUP BY coach_id
+            HAVING SUM(change) <> 0
+        ) AS deltas;
+    END IF;
+
+    IF delta_coach_ids IS NOT NULL THEN
+        PERFORM public.apply_coach_assignment_deltas(delta_coach_ids, delta_counts);
+    END IF;
+
+    RETURN NULL;
+END;
+$$;
+
+-- Transition tables cannot be shared across events, so each event has its own trigger.
+CREATE TRIGGER trg_coach_assignment_batch_insert
+AFTER INSERT ON public.coach_user_assignments
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT
+EXECUTE FUNCTION public.enforce_coach_assignment_batch();
+
+CREATE TRIGGER trg_coach_assignment_batch_update
+AFTER UPDATE ON public.coach_user_assignments
+REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+FOR EACH STATEMENT
+EXECUTE FUNCTION public.enforce_coach_assignment_batch();
+
+CREATE TRIGGER trg_coach_assignment_batch_delete
+AFTER DELETE ON public.coach_user_assignments
+REFERENCING OLD TABLE AS old_rows
+FOR EACH STATEMENT
+EXECUTE FUNCTION public.enforce_coach_assignment_batch();
@@ -0,0 +1,46 @@
+CREATE TABLE public.workout_catalog_version (
+    id smallint PRIMARY KEY DEFAULT 1 CHECK (id = 1),
+    version bigint NOT NULL DEFAULT 1,
+    updated_at timestamptz NOT NULL DEFAULT now()
+);
+
+ALTER TABLE public.workout_catalog_version ENABLE ROW LEVEL SECURITY;
+
+INSERT INTO public.workout_catalog_version (id, version) VALUES (1, 1);
+
+-- One bump per statement on any catalog table, so API workers can detect a stale
+-- in-process catalog with a single primary-key read.
+CREATE OR REPLACE FUNCTION public.bump_workout_catalog_version()
+RETURNS trigger
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+    UPDATE public.workout_catalog_version
+    SET version = version + 1,
+        updated_at = now()
+    WHERE id = 1;
+    RETURN NULL;
+END;
+$$;
+
+CREATE TRIGGER trg_muscle_groups_catalog_version
+AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON public.muscle_groups
+FOR EACH STATEMENT
+EXECUTE FUNCTION public.bump_workout_catalog_version();
+
+CREATE TRIGGER trg_cardio_types_catalog_version
+AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON public.cardio_types
+FOR EACH STATEMENT
+EXECUTE FUNCTION public.bump_workout_catalog_version();
+
+CREATE TRIGGER trg_workouts_catalog_version
+AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON public.workouts
+FOR EACH STATEMENT
+EXECUTE FUNCTION public.bump_workout_catalog_version();
+
+CREATE TRIGGER trg_workout_muscle_groups_catalog_version
+AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON public.workout_muscle_groups
+FOR EACH STATEMENT
+EXECUTE FUNCTION public.bump_workout_catalog_version();
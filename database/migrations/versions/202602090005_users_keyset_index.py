@@ -0,0 +1,19 @@
+"""Add a composite (created_at, id) index for keyset pagination of users."""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "202602090005"
+down_revision = "202602090004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_users_created_at_id", "users", ["created_at", "id"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_users_created_at_id", table_name="users")
@@ -0,0 +1,29 @@
+"""Add pg_trgm GIN indexes for ranked user search."""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "202602090006"
+down_revision = "202602090005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # Expressions must match services.users search predicates for the planner to use them.
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_users_name_trgm "
+        "ON public.users USING gin (lower(name) gin_trgm_ops)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_users_email_trgm "
+        "ON public.users USING gin (lower(email) gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS public.ix_users_email_trgm")
+    op.execute("DROP INDEX IF EXISTS public.ix_users_name_trgm")
@@ -0,0 +1,38 @@
+"""Maintain admin overview counters in a single-row stats table."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "202602090007"
+down_revision = "202602090006"
+branch_labels = None
+depends_on = None
+
+OVERVIEW_TRIGGERS: tuple[tuple[str, str], ...] = (
+    ("users", "trg_users_overview_insert"),
+    ("users", "trg_users_overview_update"),
+    ("users", "trg_users_overview_delete"),
+    ("workouts", "trg_workouts_overview_insert"),
+    ("workouts", "trg_workouts_overview_delete"),
+)
+
+
+def _up_sql() -> str:
+    sql_file = Path(__file__).resolve().parents[1] / "sql" / "202602090007_admin_overview_stats.sql"
+    return sql_file.read_text(encoding="utf-8")
+
+
+def upgrade() -> None:
+    op.execute(_up_sql())
+
+
+def downgrade() -> None:
+    for table_name, trigger_name in OVERVIEW_TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS {trigger_name} ON public.{table_name}")
+    op.execute("DROP FUNCTION IF EXISTS public.apply_workout_overview_delta()")
+    op.execute("DROP FUNCTION IF EXISTS public.apply_user_overview_delta()")
+    op.execute("DROP TABLE IF EXISTS public.admin_overview_stats")
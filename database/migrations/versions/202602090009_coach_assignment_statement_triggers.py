@@ -0,0 +1,26 @@
+"""Validate coach assignments with statement-level triggers over transition tables."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "202602090009"
+down_revision = "202602090008"
+branch_labels = None
+depends_on = None
+
+
+def _read_sql(file_name: str) -> str:
+    sql_file = Path(__file__).resolve().parents[1] / "sql" / file_name
+    return sql_file.read_text(encoding="utf-8")
+
+
+def upgrade() -> None:
+    op.execute(_read_sql("202602090009_coach_assignment_statement_triggers_up.sql"))
+
+
+def downgrade() -> None:
+    op.execute(_read_sql("202602090009_coach_assignment_statement_triggers_down.sql"))
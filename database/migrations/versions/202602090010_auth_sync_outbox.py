@@ -0,0 +1,57 @@
+"""Add the auth_sync_outbox table for asynchronous Supabase Auth profile sync."""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "202602090010"
+down_revision = "202602090009"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "auth_sync_outbox",
+        sa.Column("id", sa.BigInteger(), sa.Identity(), primary_key=True),
+        sa.Column(
+            "user_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("users.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("payload", postgresql.JSONB(), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column(
+            "next_attempt_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("now()"),
+        ),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("now()"),
+        ),
+        sa.Column("delivered_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_index(
+        "ix_auth_sync_outbox_pending",
+        "auth_sync_outbox",
+        ["next_attempt_at", "id"],
+        unique=False,
+        postgresql_where=sa.text("delivered_at IS NULL"),
+    )
+    op.create_index("ix_auth_sync_outbox_user_id", "auth_sync_outbox", ["user_id"], unique=False)
+    op.execute("ALTER TABLE public.auth_sync_outbox ENABLE ROW LEVEL SECURITY")
+
+
+def downgrade() -> None:
+    op.drop_index("ix_auth_sync_outbox_user_id", table_name="auth_sync_outbox")
+    op.drop_index("ix_auth_sync_outbox_pending", table_name="auth_sync_outbox")
+    op.drop_table("auth_sync_outbox")
@@ -0,0 +1,38 @@
+"""Track a workout catalog version bumped by statement-level triggers."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "202602090011"
+down_revision = "202602090010"
+branch_labels = None
+depends_on = None
+
+CATALOG_TRIGGERS: tuple[tuple[str, str], ...] = (
+    ("muscle_groups", "trg_muscle_groups_catalog_version"),
+    ("cardio_types", "trg_cardio_types_catalog_version"),
+    ("workouts", "trg_workouts_catalog_version"),
+    ("workout_muscle_groups", "trg_workout_muscle_groups_catalog_version"),
+)
+
+
+def _up_sql() -> str:
+    sql_file = (
+        Path(__file__).resolve().parents[1] / "sql" / "202602090011_workout_catalog_version.sql"
+    )
+    return sql_file.read_text(encoding="utf-8")
+
+
+def upgrade() -> None:
+    op.execute(_up_sql())
+
+
+def downgrade() -> None:
+    for table_name, trigger_name in CATALOG_TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS {trigger_name} ON public.{table_name}")
+    op.execute("DROP FUNCTION IF EXISTS public.bump_workout_catalog_version()")
+    op.execute("DROP TABLE IF EXISTS public.workout_catalog_version")
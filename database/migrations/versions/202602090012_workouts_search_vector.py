@@ -0,0 +1,34 @@
+"""Add a generated tsvector column and GIN index for workout full-text search."""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "202602090012"
+down_revision = "202602090011"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Config and weights must match services.workouts search queries.
+    op.execute(
+        """
+        ALTER TABLE public.workouts
+        ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+            setweight(to_tsvector('english', coalesce(name, '')), 'A')
+            || setweight(to_tsvector('english', coalesce(description, '')), 'B')
+            || setweight(to_tsvector('english', coalesce(instructions, '')), 'C')
+        ) STORED
+        """
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_workouts_search_vector "
+        "ON public.workouts USING gin (search_vector)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS public.ix_workouts_search_vector")
+    op.execute("ALTER TABLE public.workouts DROP COLUMN IF EXISTS search_vector")
@@ -0,0 +1,29 @@
+"""Index the workout -> active plan dependency path used by workout archiving."""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "202602090013"
+down_revision = "202602090012"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # The (plan_day_id, workout_id) primary key cannot serve lookups by workout.
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_plan_day_workouts_workout_id "
+        "ON public.plan_day_workouts (workout_id, plan_day_id)"
+    )
+    # Only active assignments block archiving; the partial index skips the rest.
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_plan_assignments_active_plan_id "
+        "ON public.plan_assignments (plan_id) WHERE status = 'active'"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS public.ix_plan_assignments_active_plan_id")
+    op.execute("DROP INDEX IF EXISTS public.ix_plan_day_workouts_workout_id")
@@ -0,0 +1,88 @@
+"""Async service layer tests."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+from uuid import uuid4
+
+import pytest
+from models import Base
+from models.enums import UserRole
+from models.user import User
+from schemas.users import UserListQuery
+from services.auth import AuthServiceError, get_user_profile_async
+from services.users import UserServiceError, deactivate_user_async, list_users_async
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+pytest.importorskip("aiosqlite")
+
+ResultType = TypeVar("ResultType")
+
+
+def _run_with_session(scenario: Callable[[AsyncSession], Awaitable[ResultType]]) -> ResultType:
+    async def run() -> ResultType:
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+        session_local = async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+        try:
+            async with session_local() as session:
+                return await scenario(session)
+        finally:
+            await engine.dispose()
+
+    return asyncio.run(run())
+
+
+async def _create_user(
+    session: AsyncSession,
+    *,
+    email: str,
+    role: UserRole,
+    is_active: bool = True,
+) -> User:
+    user = User(id=uuid4(), name=email.split("@")[0], email=email, role=role, is_active=is_active)
+    session.add(user)
+    await session.commit()
+    return user
+
+
+def test_list_users_async_filters_by_role() -> None:
+    async def scenario(session: AsyncSession) -> None:
+        await _create_user(session, email="coach@gamata.test", role=UserRole.COACH)
+        await _create_user(session, email="athlete@gamata.test", role=UserRole.USER)
+
+        response = await list_users_async(session, UserListQuery(role=UserRole.COACH))
+
+        assert response.total == 1
+        assert response.items[0].email == "coach@gamata.test"
+
+    _run_with_session(scenario)
+
+
+def test_get_user_profile_async_rejects_deactivated_users() -> None:
+    async def scenario(session: AsyncSession) -> None:
+        user = await _create_user(
+            session, email="inactive@gamata.test", role=UserRole.USER, is_active=False
+        )
+
+        with pytest.raises(AuthServiceError) as exc:
+            await get_user_profile_async(session, user.id)
+
+        assert exc.value.status_code == 403
+
+    _run_with_session(scenario)
+
+
+def test_deactivate_user_async_blocks_self_deactivation() -> None:
+    async def scenario(session: AsyncSession) -> None:
+        admin = await _create_user(session, email="admin@gamata.test", role=UserRole.ADMIN)
+
+        with pytest.raises(UserServiceError) as exc:
+            await deactivate_user_async(session, admin.id, admin.id)
+
+        assert exc.value.status_code == 400
+
+    _run_with_session(scenario)
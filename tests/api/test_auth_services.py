@@ -0,0 +1,160 @@
+"""Authentication service tests."""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterator
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+from models.enums import UserRole
+from models.outbox import AuthSyncOutbox
+from models.user import User
+from services.auth import (
+    AuthServiceError,
+    _get_or_create_local_user,
+    _upsert_local_user_statement,
+)
+
+# Upsert behaviour needs PostgreSQL; these tests run against a migrated database and
+# roll back everything they write.
+PERF_DATABASE_URL = os.environ.get("PERF_DATABASE_URL")
+requires_postgres = pytest.mark.skipif(
+    PERF_DATABASE_URL is None, reason="PERF_DATABASE_URL is not set"
+)
+
+
+@pytest.fixture()
+def pg_session() -> Iterator[Session]:
+    engine = create_engine(PERF_DATABASE_URL)
+    with engine.connect() as connection:
+        transaction = connection.begin()
+        session = Session(
+            bind=connection,
+            join_transaction_mode="create_savepoint",
+            expire_on_commit=False,
+        )
+        try:
+            yield session
+        finally:
+            session.close()
+            transaction.rollback()
+    engine.dispose()
+
+
+def _local_user(session: Session, email: str) -> User:
+    user = User(id=uuid4(), name="Athlete", email=email, role=UserRole.USER)
+    session.add(user)
+    session.commit()
+    return user
+
+
+def _compile(statement: object) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))  # type: ignore[attr-defined]
+
+
+def test_login_upsert_only_writes_changed_active_profiles() -> None:
+    sql = _compile(
+        _upsert_local_user_statement(uuid4(), email="a@example.com", name="A", sync_name=False)
+    )
+
+    assert "ON CONFLICT (id) DO UPDATE" in sql
+    assert "users.is_active IS true" in sql
+    assert "users.email IS DISTINCT FROM excluded.email" in sql
+    assert "THEN users.email ELSE excluded.email END" in sql
+    assert "users.name IS DISTINCT FROM" not in sql
+    assert "RETURNING" in sql
+
+
+def test_registration_upsert_also_syncs_name() -> None:
+    sql = _compile(
+        _upsert_local_user_statement(uuid4(), email="a@example.com", name="A", sync_name=True)
+    )
+
+    assert "users.name IS DISTINCT FROM excluded.name" in sql
+    assert "THEN users.name ELSE excluded.name END" in sql
+
+
+@requires_postgres
+def test_login_keeps_local_email_while_outbox_row_is_undelivered(
+    pg_session: Session,
+) -> None:
+    local_email = f"new-{uuid4().hex}@example.com"
+    user = _local_user(pg_session, local_email)
+    pg_session.add(AuthSyncOutbox(user_id=user.id, payload={"email": local_email}))
+    pg_session.commit()
+
+    # The provider still reports the address it had before the admin edit.
+    logged_in = _get_or_create_local_user(
+        pg_session, SimpleNamespace(id=str(user.id), email="old@example.com")
+    )
+
+    assert logged_in.email == local_email
+
+
+@requires_postgres
+def test_login_copies_provider_email_when_only_other_fields_are_pending(
+    pg_session: Session,
+) -> None:
+    user = _local_user(pg_session, f"old-{uuid4().hex}@example.com")
+    pg_session.add(AuthSyncOutbox(user_id=user.id, payload={"name": "Renamed"}))
+    pg_session.commit()
+    provider_email = f"provider-{uuid4().hex}@example.com"
+
+    logged_in = _get_or_create_local_user(
+        pg_session, SimpleNamespace(id=str(user.id), email=provider_email)
+    )
+
+    assert logged_in.email == provider_email
+
+
+def _xmin(session: Session, user_id: object) -> str:
+    # Every row version gets a new xmin, so an unchanged one proves nothing was written.
+    return session.execute(
+        text("SELECT xmin::text FROM users WHERE id = :id"), {"id": user_id}
+    ).scalar_one()
+
+
+@requires_postgres
+def test_unchanged_login_writes_nothing(pg_session: Session) -> None:
+    user = _local_user(pg_session, f"same-{uuid4().hex}@example.com")
+    before = _xmin(pg_session, user.id)
+
+    (_, written) = pg_session.execute(
+        _upsert_local_user_statement(user.id, email=user.email, name="Other", sync_name=False)
+    ).one()
+
+    assert written is False
+    assert _xmin(pg_session, user.id) == before
+
+
+@requires_postgres
+def test_login_of_deactivated_user_is_forbidden_and_not_written(pg_session: Session) -> None:
+    user = _local_user(pg_session, f"gone-{uuid4().hex}@example.com")
+    user.is_active = False
+    pg_session.commit()
+    before = _xmin(pg_session, user.id)
+
+    with pytest.raises(AuthServiceError) as exc_info:
+        _get_or_create_local_user(
+            pg_session, SimpleNamespace(id=str(user.id), email=f"new-{uuid4().hex}@example.com")
+        )
+
+    assert exc_info.value.status_code == 403
+    assert _xmin(pg_session, user.id) == before
+
+
+@requires_postgres
+def test_login_with_email_taken_by_another_profile_conflicts(pg_session: Session) -> None:
+    taken_email = f"taken-{uuid4().hex}@example.com"
+    _local_user(pg_session, taken_email)
+
+    with pytest.raises(AuthServiceError) as exc_info:
+        _get_or_create_local_user(pg_session, SimpleNamespace(id=str(uuid4()), email=taken_email))
+
+    assert exc_info.value.status_code == 409
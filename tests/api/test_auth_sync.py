@@ -0,0 +1,159 @@
+"""Auth provider sync outbox tests."""
+
+from __future__ import annotations
+
+from collections.abc import Collection
+from datetime import datetime, timedelta, timezone
+from uuid import UUID, uuid4
+
+import pytest
+from app.config import settings
+from models import Base
+from models.enums import UserRole
+from models.outbox import AuthSyncOutbox
+from models.user import User
+from schemas.users import UserUpdateRequest
+from services.auth_sync import (
+    deliver_auth_sync_batch,
+    enqueue_auth_sync,
+    get_auth_sync_backlog,
+)
+from services.user_support import UserServiceError
+from services.users import update_user
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session, sessionmaker
+
+
+@pytest.fixture()
+def db_session() -> Session:
+    engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)()
+    try:
+        yield session
+    finally:
+        session.close()
+        Base.metadata.drop_all(engine)
+        engine.dispose()
+
+
+class _ProviderRejection(Exception):
+    status = 422
+
+
+class _RecordingSync:
+    def __init__(
+        self,
+        failing_user_ids: Collection[UUID] = frozenset(),
+        rejected_user_ids: Collection[UUID] = frozenset(),
+    ) -> None:
+        self.failing_user_ids = failing_user_ids
+        self.rejected_user_ids = rejected_user_ids
+        self.calls: list[tuple[UUID, dict[str, object]]] = []
+
+    def __call__(self, user_id: UUID, **fields: object) -> None:
+        self.calls.append((user_id, fields))
+        if user_id in self.failing_user_ids:
+            raise RuntimeError("provider unavailable")
+        if user_id in self.rejected_user_ids:
+            # Mirrors sync_supabase_user, which wraps the provider's error.
+            raise UserServiceError("Unable to sync user.", 502) from _ProviderRejection(
+                "Email address already registered"
+            )
+
+
+def _create_user(session: Session, email: str) -> User:
+    user = User(id=uuid4(), name=email.split("@")[0], email=email, role=UserRole.USER)
+    session.add(user)
+    session.commit()
+    return user
+
+
+def test_update_user_records_sync_in_outbox(db_session: Session) -> None:
+    user = _create_user(db_session, "before@gamata.test")
+
+    response = update_user(
+        db_session, user.id, UserUpdateRequest(email="after@gamata.test", role=UserRole.COACH)
+    )
+
+    assert response.email == "after@gamata.test"
+    entry = db_session.scalars(select(AuthSyncOutbox)).one()
+    assert entry.user_id == user.id
+    assert entry.payload == {"email": "after@gamata.test", "role": "coach"}
+    assert entry.delivered_at is None
+
+
+def test_deliver_batch_merges_rows_per_user(db_session: Session) -> None:
+    user = _create_user(db_session, "merge@gamata.test")
+    enqueue_auth_sync(db_session, user.id, name="First")
+    enqueue_auth_sync(db_session, user.id, name="Second", role=UserRole.COACH)
+    db_session.commit()
+    sync = _RecordingSync()
+
+    assert deliver_auth_sync_batch(db_session, sync=sync) == 2
+
+    assert sync.calls == [(user.id, {"email": None, "name": "Second", "role": UserRole.COACH})]
+    assert all(entry.delivered_at for entry in db_session.scalars(select(AuthSyncOutbox)))
+    assert get_auth_sync_backlog(db_session).pending_count == 0
+
+
+def test_failed_delivery_backs_off_until_attempts_run_out(
+    db_session: Session, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(settings, "auth_sync_max_attempts", 2)
+    failing = _create_user(db_session, "failing@gamata.test")
+    healthy = _create_user(db_session, "healthy@gamata.test")
+    enqueue_auth_sync(db_session, failing.id, name="Failing")
+    enqueue_auth_sync(db_session, healthy.id, name="Healthy")
+    db_session.commit()
+    sync = _RecordingSync(failing_user_ids={failing.id})
+
+    deliver_auth_sync_batch(db_session, sync=sync)
+
+    entry = db_session.scalars(
+        select(AuthSyncOutbox).where(AuthSyncOutbox.user_id == failing.id)
+    ).one()
+    assert entry.attempts == 1
+    assert entry.last_error == "provider unavailable"
+    assert entry.next_attempt_at.replace(tzinfo=timezone.utc) > datetime.now(timezone.utc)
+    assert deliver_auth_sync_batch(db_session, sync=sync) == 0
+
+    backlog = get_auth_sync_backlog(db_session)
+    assert (backlog.pending_count, backlog.failed_count) == (1, 0)
+    assert backlog.entries[0].fields == ["name"]
+
+    entry.next_attempt_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+    db_session.commit()
+    deliver_auth_sync_batch(db_session, sync=sync)
+
+    backlog = get_auth_sync_backlog(db_session)
+    assert (backlog.pending_count, backlog.failed_count) == (0, 1)
+    assert deliver_auth_sync_batch(db_session, sync=sync) == 0
+
+
+def test_rejected_delivery_fails_without_retrying(db_session: Session) -> None:
+    user = _create_user(db_session, "taken@gamata.test")
+    enqueue_auth_sync(db_session, user.id, email="someone-else@gamata.test")
+    db_session.commit()
+    sync = _RecordingSync(rejected_user_ids={user.id})
+
+    deliver_auth_sync_batch(db_session, sync=sync)
+
+    backlog = get_auth_sync_backlog(db_session)
+    assert (backlog.pending_count, backlog.failed_count) == (0, 1)
+    assert backlog.entries[0].last_error == "Email address already registered"
+    assert backlog.entries[0].attempts == settings.auth_sync_max_attempts
+    assert deliver_auth_sync_batch(db_session, sync=sync) == 0
+    assert len(sync.calls) == 1
+
+
+def test_later_rows_wait_for_an_earlier_row_in_backoff(db_session: Session) -> None:
+    user = _create_user(db_session, "ordered@gamata.test")
+    earlier = enqueue_auth_sync(db_session, user.id, email="old@gamata.test")
+    earlier.next_attempt_at = datetime.now(timezone.utc) + timedelta(minutes=5)
+    enqueue_auth_sync(db_session, user.id, email="new@gamata.test")
+    db_session.commit()
+    sync = _RecordingSync()
+
+    assert deliver_auth_sync_batch(db_session, sync=sync) == 0
+    assert sync.calls == []
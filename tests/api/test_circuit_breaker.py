@@ -0,0 +1,70 @@
+"""Auth provider circuit breaker tests."""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from services.circuit_breaker import CircuitBreaker, CircuitOpenError
+
+
+class ProviderDown(Exception):
+    pass
+
+
+class ProviderRejected(Exception):
+    status = 400
+
+
+def _fail(exc: Exception) -> None:
+    raise exc
+
+
+def test_breaker_opens_after_consecutive_failures() -> None:
+    breaker = CircuitBreaker("test", failure_threshold=2, recovery_timeout=60)
+
+    for _ in range(2):
+        with pytest.raises(ProviderDown):
+            breaker.call(_fail, ProviderDown())
+
+    with pytest.raises(CircuitOpenError):
+        breaker.call(lambda: "unreachable")
+
+    stats = breaker.stats()
+    assert stats["state"] == "open"
+    assert stats["rejected_calls"] == 1
+
+
+def test_breaker_ignores_client_errors() -> None:
+    breaker = CircuitBreaker("test", failure_threshold=1, recovery_timeout=60)
+
+    with pytest.raises(ProviderRejected):
+        breaker.call(_fail, ProviderRejected())
+
+    assert breaker.state == "closed"
+
+
+def test_breaker_half_open_probe_closes_on_success() -> None:
+    breaker = CircuitBreaker("test", failure_threshold=1, recovery_timeout=0.01)
+    with pytest.raises(ProviderDown):
+        breaker.call(_fail, ProviderDown())
+
+    time.sleep(0.02)
+
+    assert breaker.state == "half_open"
+    assert breaker.call(lambda: "ok") == "ok"
+    assert breaker.state == "closed"
+
+
+def test_breaker_half_open_probe_reopens_on_failure() -> None:
+    breaker = CircuitBreaker("test", failure_threshold=1, recovery_timeout=0.01)
+    with pytest.raises(ProviderDown):
+        breaker.call(_fail, ProviderDown())
+    time.sleep(0.02)
+
+    with pytest.raises(ProviderDown):
+        breaker.call(_fail, ProviderDown())
+
+    assert breaker.state == "open"
+    assert breaker.stats()["times_opened"] == 2
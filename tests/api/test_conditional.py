@@ -0,0 +1,248 @@
+"""Conditional GET (ETag / If-None-Match) tests."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Callable
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from types import SimpleNamespace
+from uuid import uuid4
+
+import api.auth as auth_api
+import api.users as users_api
+import httpx
+import pytest
+from api.auth import router as auth_router
+from api.users import router as users_router
+from app.database import get_async_db_session, get_async_read_db_session
+from core.conditional import etag_matches, make_etag
+from core.permissions import AuthenticatedUser, get_current_user
+from fastapi import FastAPI, Request
+from models import Base
+from models.enums import UserRole
+from models.user import CoachUserAssignment, User
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
+
+USER_ID = uuid4()
+
+
+def _request(if_none_match: str | None) -> Request:
+    headers = [] if if_none_match is None else [(b"if-none-match", if_none_match.encode())]
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+
+def test_etag_matching_uses_weak_comparison() -> None:
+    etag = make_etag("user", USER_ID, "2026-01-01T00:00:00+00:00")
+    opaque = etag.removeprefix("W/")
+
+    assert etag.startswith('W/"')
+    assert etag != make_etag("user", USER_ID, "2026-01-01T00:00:01+00:00")
+    assert etag_matches(_request(etag), etag)
+    assert etag_matches(_request(f'"other", {opaque}'), etag)
+    assert etag_matches(_request("*"), etag)
+    assert not etag_matches(_request('W/"other"'), etag)
+    assert not etag_matches(_request(None), etag)
+
+
+@pytest.fixture
+def profile(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    profile = SimpleNamespace(
+        id=USER_ID,
+        name="Athlete",
+        email="athlete@gamata.test",
+        role=UserRole.USER,
+        is_active=True,
+        created_at=now,
+        updated_at=now,
+        lookups=0,
+    )
+
+    async def get_profile(db: object, user_id: object) -> SimpleNamespace:
+        profile.lookups += 1
+        return profile
+
+    monkeypatch.setattr(auth_api, "get_user_profile_async", get_profile)
+    return profile
+
+
+def _app(profile: SimpleNamespace) -> FastAPI:
+    async def no_db() -> None:
+        return None
+
+    app = FastAPI()
+    app.include_router(auth_router)
+    app.dependency_overrides[get_async_db_session] = no_db
+    # Writes invalidate the cached principal, so it always carries the current updated_at.
+    app.dependency_overrides[get_current_user] = lambda: AuthenticatedUser(
+        id=USER_ID,
+        email="athlete@gamata.test",
+        name="Athlete",
+        role=UserRole.USER,
+        updated_at=profile.updated_at,
+    )
+    return app
+
+
+def test_auth_me_returns_304_until_profile_changes(profile: SimpleNamespace) -> None:
+    async def run() -> tuple[httpx.Response, httpx.Response, httpx.Response]:
+        transport = httpx.ASGITransport(app=_app(profile))
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            first = await client.get("/auth/me")
+            cached = await client.get("/auth/me", headers={"If-None-Match": first.headers["etag"]})
+            profile.updated_at += timedelta(seconds=1)
+            changed = await client.get("/auth/me", headers={"If-None-Match": first.headers["etag"]})
+        return first, cached, changed
+
+    first, cached, changed = asyncio.run(run())
+
+    assert first.status_code == 200
+    assert first.json()["email"] == "athlete@gamata.test"
+    assert first.headers["cache-control"] == "private, no-cache"
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["etag"] == first.headers["etag"]
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != first.headers["etag"]
+    # The revalidation was answered from the principal alone.
+    assert profile.lookups == 2
+
+
+def _seed_users(session: Session) -> tuple[User, User, User]:
+    admin = User(id=USER_ID, name="Admin", email="admin@gamata.test", role=UserRole.ADMIN)
+    athlete = User(id=uuid4(), name="Athlete", email="athlete@gamata.test", role=UserRole.USER)
+    coach = User(id=uuid4(), name="Coach", email="coach@gamata.test", role=UserRole.COACH)
+    other_coach = User(
+        id=uuid4(), name="Other Coach", email="other-coach@gamata.test", role=UserRole.COACH
+    )
+    session.add_all([admin, athlete, coach, other_coach])
+    session.flush()
+    session.add(
+        CoachUserAssignment(id=uuid4(), coach_id=coach.id, user_id=athlete.id, assigned_by=admin.id)
+    )
+    session.commit()
+    return athlete, coach, other_coach
+
+
+def _users_app(sessions: async_sessionmaker[AsyncSession]) -> FastAPI:
+    async def read_db() -> AsyncIterator[AsyncSession]:
+        async with sessions() as db:
+            yield db
+
+    app = FastAPI()
+    app.include_router(users_router)
+    app.dependency_overrides[get_async_read_db_session] = read_db
+    app.dependency_overrides[get_current_user] = lambda: AuthenticatedUser(
+        id=USER_ID, email="admin@gamata.test", name="Admin", role=UserRole.ADMIN
+    )
+    return app
+
+
+async def _conditional_gets(
+    tmp_path: Path,
+    path_for: Callable[[User, User, User], str],
+    change: Callable[[Session, User, User, User], None],
+) -> tuple[httpx.Response, httpx.Response, httpx.Response]:
+    """First GET, a revalidation, then a revalidation after `change` ran on the database."""
+
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'users.db'}")
+    try:
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+        sessions = async_sessionmaker(bind=engine, expire_on_commit=False)
+        async with sessions() as seed:
+            users = await seed.run_sync(_seed_users)
+
+        path = path_for(*users)
+        transport = httpx.ASGITransport(app=_users_app(sessions))
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            first = await client.get(path)
+            cached = await client.get(path, headers={"If-None-Match": first.headers["etag"]})
+            async with sessions() as db:
+                await db.run_sync(change, *users)
+            changed = await client.get(path, headers={"If-None-Match": first.headers["etag"]})
+        return first, cached, changed
+    finally:
+        await engine.dispose()
+
+
+def _count_calls(monkeypatch: pytest.MonkeyPatch, name: str) -> list[dict[str, object]]:
+    """Record the arguments of each call the users routes make to `name`."""
+
+    calls: list[dict[str, object]] = []
+    original = getattr(users_api, name)
+
+    async def counted(**kwargs: object) -> object:
+        calls.append(kwargs)
+        return await original(**kwargs)
+
+    monkeypatch.setattr(users_api, name, counted)
+    return calls
+
+
+def _reassign_coach(session: Session, athlete: User, coach: User, other_coach: User) -> None:
+    # Moving an athlete between coaches touches only the assignment row, not users.updated_at.
+    session.execute(
+        update(CoachUserAssignment)
+        .where(CoachUserAssignment.user_id == athlete.id)
+        .values(coach_id=other_coach.id)
+    )
+    session.commit()
+
+
+def test_user_detail_returns_304_until_coaches_are_reassigned(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    pytest.importorskip("aiosqlite")
+    details = _count_calls(monkeypatch, "get_user_detail_async")
+
+    first, cached, changed = asyncio.run(
+        _conditional_gets(tmp_path, lambda athlete, *_: f"/users/{athlete.id}", _reassign_coach)
+    )
+
+    assert first.status_code == 200
+    assert [coach["name"] for coach in first.json()["coaches"]] == ["Coach"]
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["etag"] == first.headers["etag"]
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != first.headers["etag"]
+    assert [coach["name"] for coach in changed.json()["coaches"]] == ["Other Coach"]
+    # The revalidation that matched never built the detail.
+    assert len(details) == 2
+
+
+def _add_coach(session: Session, athlete: User, coach: User, other_coach: User) -> None:
+    session.add(
+        CoachUserAssignment(
+            id=uuid4(), coach_id=other_coach.id, user_id=athlete.id, assigned_by=USER_ID
+        )
+    )
+    session.commit()
+
+
+def test_user_list_returns_304_until_a_listed_user_changes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    pytest.importorskip("aiosqlite")
+    pages = _count_calls(monkeypatch, "list_users_async")
+
+    first, cached, changed = asyncio.run(
+        _conditional_gets(tmp_path, lambda *_: "/users?role=user", _add_coach)
+    )
+
+    def coach_counts(response: httpx.Response) -> list[int]:
+        return [item["coach_count"] for item in response.json()["items"]]
+
+    assert first.status_code == 200
+    assert coach_counts(first) == [1]
+    assert first.headers["cache-control"] == "private, no-cache"
+    assert cached.status_code == 304
+    assert cached.headers["etag"] == first.headers["etag"]
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != first.headers["etag"]
+    assert coach_counts(changed) == [2]
+    assert len(pages) == 2
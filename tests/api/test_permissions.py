@@ -5,11 +5,19 @@ from __future__ import annotations
 import asyncio
 from uuid import uuid4
 
+import httpx
 import pytest
-from fastapi import HTTPException
-
-from core.permissions import AuthenticatedUser, _extract_bearer_token, require_role
+import services.auth as auth_service
+from fastapi import FastAPI, HTTPException, Request
+
+from core.permissions import (
+    AuthenticatedUser,
+    JWTVerificationMiddleware,
+    _extract_bearer_token,
+    require_role,
+)
 from models.enums import UserRole
+from services.auth import AuthServiceError, VerifiedToken
 
 
 def _sample_user(role: UserRole) -> AuthenticatedUser:
@@ -62,3 +70,59 @@ def test_require_role_requires_current_user_dependency() -> None:
         asyncio.run(protected_endpoint())
 
     assert exc.value.status_code == 500
+
+
+def _middleware_app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(JWTVerificationMiddleware)
+
+    @app.get("/claims")
+    async def claims(request: Request) -> dict[str, str | None]:
+        user_id = request.state.auth_token_user_id
+        return {
+            "user_id": str(user_id) if user_id is not None else None,
+            "email": request.state.auth_token_email,
+        }
+
+    return app
+
+
+async def _get_claims(headers: dict[str, str] | None = None) -> httpx.Response:
+    transport = httpx.ASGITransport(app=_middleware_app())
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await client.get("/claims", headers=headers)
+
+
+def test_jwt_middleware_stores_verified_claims_on_request_state(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    user_id = uuid4()
+    monkeypatch.setattr(
+        auth_service,
+        "verify_access_token",
+        lambda token: VerifiedToken(user_id=user_id, email="tester@example.com"),
+    )
+
+    response = asyncio.run(_get_claims({"Authorization": "Bearer abc123"}))
+
+    assert response.status_code == 200
+    assert response.json() == {"user_id": str(user_id), "email": "tester@example.com"}
+
+
+def test_jwt_middleware_passes_anonymous_requests_through() -> None:
+    response = asyncio.run(_get_claims())
+
+    assert response.status_code == 200
+    assert response.json() == {"user_id": None, "email": None}
+
+
+def test_jwt_middleware_rejects_invalid_tokens(monkeypatch: pytest.MonkeyPatch) -> None:
+    def reject(token: str) -> VerifiedToken:
+        raise AuthServiceError("Invalid or expired access token.", 401)
+
+    monkeypatch.setattr(auth_service, "verify_access_token", reject)
+
+    response = asyncio.run(_get_claims({"Authorization": "Bearer expired"}))
+
+    assert response.status_code == 401
+    assert response.json() == {"detail": "Invalid or expired access token."}
@@ -0,0 +1,73 @@
+"""Connection pool instrumentation tests."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from app.pooling import (
+    CHECKOUT_LATENCY_BUCKETS_MS,
+    PoolMetrics,
+    install_idle_pre_ping,
+    instrumented_pool_class,
+    pool_metrics,
+    pool_stats,
+)
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+
+def _engine(tmp_path: Path, name: str, **pool_options: object) -> Engine:
+    metrics = pool_metrics.setdefault(name, PoolMetrics(name))
+    return create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=instrumented_pool_class(QueuePool, metrics),
+        **pool_options,
+    )
+
+
+def test_instrumented_pool_records_checkouts_and_occupancy(tmp_path: Path) -> None:
+    engine = _engine(tmp_path, "test_occupancy", pool_size=2, max_overflow=1)
+
+    first = engine.connect()
+    second = engine.connect()
+    third = engine.connect()
+    stats = pool_stats("test_occupancy", engine.pool)
+    first.close()
+    second.close()
+    third.close()
+
+    assert stats["checked_out"] == 3
+    assert stats["overflow"] == 1
+    assert stats["max_overflow"] == 1
+    assert stats["checkouts"] == 3
+    assert len(stats["checkout_latency_histogram"]) == len(CHECKOUT_LATENCY_BUCKETS_MS) + 1
+    assert sum(bucket["count"] for bucket in stats["checkout_latency_histogram"]) == 3
+    assert stats["checkout_latency_histogram"][-1]["upper_bound_ms"] is None
+
+
+def test_instrumented_pool_counts_checkout_timeouts(tmp_path: Path) -> None:
+    engine = _engine(tmp_path, "test_timeouts", pool_size=1, max_overflow=0, pool_timeout=0.05)
+
+    with engine.connect():
+        with pytest.raises(PoolTimeoutError):
+            engine.connect()
+
+    stats = pool_stats("test_timeouts", engine.pool)
+    assert stats["checkout_timeouts"] == 1
+    assert stats["checkout_wait_seconds_max"] >= 0.05
+
+
+def test_idle_pre_ping_replaces_dead_connections(tmp_path: Path) -> None:
+    engine = _engine(tmp_path, "test_idle_ping", pool_size=1, max_overflow=0)
+    install_idle_pre_ping(engine, idle_seconds=0)
+
+    with engine.connect() as connection:
+        dead = connection.connection.dbapi_connection
+    dead.close()
+
+    with engine.connect() as connection:
+        assert connection.execute(text("SELECT 1")).scalar_one() == 1
+        assert connection.connection.dbapi_connection is not dead
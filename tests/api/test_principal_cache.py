@@ -0,0 +1,52 @@
+"""Principal cache behaviour tests."""
+
+from __future__ import annotations
+
+import time
+from uuid import uuid4
+
+from services.principal_cache import PrincipalCache
+
+
+def test_principal_cache_counts_hits_and_misses() -> None:
+    cache: PrincipalCache[str] = PrincipalCache(max_entries=10, ttl_seconds=60)
+    key = uuid4()
+
+    assert cache.get(key) is None
+    cache.set(key, "principal")
+
+    assert cache.get(key) == "principal"
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_principal_cache_evicts_least_recently_used() -> None:
+    cache: PrincipalCache[str] = PrincipalCache(max_entries=2, ttl_seconds=60)
+    first, second, third = uuid4(), uuid4(), uuid4()
+
+    cache.set(first, "first")
+    cache.set(second, "second")
+    cache.get(first)
+    cache.set(third, "third")
+
+    assert cache.get(second) is None
+    assert cache.get(first) == "first"
+    assert cache.stats()["evictions"] == 1
+
+
+def test_principal_cache_expires_entries_after_ttl() -> None:
+    cache: PrincipalCache[str] = PrincipalCache(max_entries=10, ttl_seconds=0.01)
+    key = uuid4()
+    cache.set(key, "principal")
+
+    time.sleep(0.02)
+
+    assert cache.get(key) is None
+
+
+def test_principal_cache_disabled_with_zero_ttl() -> None:
+    cache: PrincipalCache[str] = PrincipalCache(max_entries=10, ttl_seconds=0)
+    key = uuid4()
+    cache.set(key, "principal")
+
+    assert cache.get(key) is None
@@ -0,0 +1,109 @@
+"""Read replica routing tests."""
+
+from __future__ import annotations
+
+import asyncio
+from uuid import UUID, uuid4
+
+import app.database as database
+import pytest
+from app.read_routing import RecentWriters, recent_writers
+from fastapi import Request
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+
+@pytest.fixture(autouse=True)
+def reset_recent_writers() -> None:
+    recent_writers.clear()
+
+
+def _request(user_id: UUID | None = None, headers: dict[str, str] | None = None) -> Request:
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/users",
+        "headers": [
+            (name.lower().encode("latin-1"), value.encode("latin-1"))
+            for name, value in (headers or {}).items()
+        ],
+        "state": {"auth_token_user_id": user_id},
+    }
+    return Request(scope)
+
+
+async def _session_bind_url(request: Request) -> str:
+    dependency = database.get_async_read_db_session(request)
+    session = await anext(dependency)
+    try:
+        return str(session.bind.url)
+    finally:
+        await dependency.aclose()
+
+
+@pytest.fixture
+def replica(monkeypatch: pytest.MonkeyPatch) -> async_sessionmaker[AsyncSession]:
+    pytest.importorskip("aiosqlite")
+    replica_engine = create_async_engine("sqlite+aiosqlite:///replica.db")
+    replica_sessions = async_sessionmaker(bind=replica_engine, expire_on_commit=False)
+    monkeypatch.setattr(database, "AsyncReplicaSessionLocal", replica_sessions)
+    return replica_sessions
+
+
+def test_recent_writers_expire_after_window() -> None:
+    writers = RecentWriters(window_seconds=0.05)
+    user_id = uuid4()
+
+    writers.mark(user_id)
+    assert writers.wrote_recently(user_id)
+
+    asyncio.run(asyncio.sleep(0.06))
+    assert not writers.wrote_recently(user_id)
+
+
+def test_read_session_uses_replica_by_default(
+    replica: async_sessionmaker[AsyncSession],
+) -> None:
+    url = asyncio.run(_session_bind_url(_request(uuid4())))
+
+    assert url == "sqlite+aiosqlite:///replica.db"
+
+
+def test_read_session_uses_primary_after_own_write(
+    replica: async_sessionmaker[AsyncSession],
+) -> None:
+    user_id = uuid4()
+    recent_writers.mark(user_id)
+
+    assert asyncio.run(_session_bind_url(_request(user_id))) == str(database.async_engine.url)
+    assert asyncio.run(_session_bind_url(_request(uuid4()))) == "sqlite+aiosqlite:///replica.db"
+
+
+def test_read_session_honours_primary_consistency_header(
+    replica: async_sessionmaker[AsyncSession],
+) -> None:
+    request = _request(uuid4(), headers={"X-Read-Consistency": "primary"})
+
+    assert asyncio.run(_session_bind_url(request)) == str(database.async_engine.url)
+
+
+def test_write_session_marks_user_after_commit(monkeypatch: pytest.MonkeyPatch) -> None:
+    pytest.importorskip("aiosqlite")
+    user_id = uuid4()
+
+    async def run() -> tuple[bool, bool]:
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        monkeypatch.setattr(
+            database, "AsyncSessionLocal", async_sessionmaker(bind=engine, expire_on_commit=False)
+        )
+        dependency = database.get_async_db_session(_request(user_id))
+        session = await anext(dependency)
+        await session.execute(text("SELECT 1"))
+        before_commit = recent_writers.wrote_recently(user_id)
+        await session.commit()
+        after_commit = recent_writers.wrote_recently(user_id)
+        await dependency.aclose()
+        await engine.dispose()
+        return before_commit, after_commit
+
+    assert asyncio.run(run()) == (False, True)
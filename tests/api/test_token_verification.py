@@ -0,0 +1,153 @@
+"""Local access token verification tests."""
+
+from __future__ import annotations
+
+import time
+from uuid import uuid4
+
+import jwt
+import pytest
+import services.auth as auth_service
+from app.config import Settings, settings
+from services.auth import AuthServiceError, VerifiedToken, verify_access_token
+from services.token_verification import LocalVerificationUnavailable, rejected_tokens
+
+TEST_JWT_SECRET = "test-jwt-secret-with-enough-entropy-for-hs256"
+
+
+@pytest.fixture(autouse=True)
+def local_verification(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "auth_jwt_verification", "local")
+    monkeypatch.setattr(settings, "auth_jwt_remote_fallback", False)
+    monkeypatch.setattr(settings, "supabase_jwt_secret", TEST_JWT_SECRET)
+    rejected_tokens.clear()
+
+
+def _issue_token(**overrides: object) -> str:
+    now = int(time.time())
+    claims: dict[str, object] = {
+        "sub": str(uuid4()),
+        "email": "Athlete@Example.com",
+        "aud": settings.auth_jwt_audience,
+        "iss": settings.supabase_auth_issuer,
+        "iat": now,
+        "exp": now + 3600,
+    }
+    claims.update(overrides)
+    return jwt.encode(claims, TEST_JWT_SECRET, algorithm="HS256")
+
+
+def test_verify_access_token_accepts_valid_local_token() -> None:
+    subject = uuid4()
+
+    verified = verify_access_token(_issue_token(sub=str(subject)))
+
+    assert verified.user_id == subject
+    assert verified.email == "athlete@example.com"
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        {"exp": int(time.time()) - 3600},
+        {"aud": "anon"},
+        {"iss": "https://attacker.example.com/auth/v1"},
+        {"sub": "not-a-uuid"},
+    ],
+)
+def test_verify_access_token_rejects_invalid_claims(overrides: dict[str, object]) -> None:
+    with pytest.raises(AuthServiceError) as exc:
+        verify_access_token(_issue_token(**overrides))
+
+    assert exc.value.status_code == 401
+
+
+def test_verify_access_token_rejects_wrong_signature() -> None:
+    token = jwt.encode(
+        {"sub": str(uuid4()), "aud": settings.auth_jwt_audience, "exp": time.time() + 60},
+        "some-other-secret-with-enough-entropy-too",
+        algorithm="HS256",
+    )
+
+    with pytest.raises(AuthServiceError) as exc:
+        verify_access_token(token)
+
+    assert exc.value.status_code == 401
+
+
+def test_verify_access_token_without_secret_rejects_when_fallback_disabled(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings, "supabase_jwt_secret", None)
+
+    with pytest.raises(AuthServiceError) as exc:
+        verify_access_token(_issue_token())
+
+    assert exc.value.status_code == 401
+
+
+def test_remote_fallback_is_on_by_default() -> None:
+    assert Settings.model_fields["auth_jwt_remote_fallback"].default is True
+
+
+def test_verify_access_token_without_secret_falls_back_to_provider(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings, "supabase_jwt_secret", None)
+    monkeypatch.setattr(settings, "auth_jwt_remote_fallback", True)
+    subject = uuid4()
+    monkeypatch.setattr(
+        auth_service,
+        "_verify_access_token_remote",
+        lambda token: VerifiedToken(user_id=subject, email=None),
+    )
+
+    assert verify_access_token(_issue_token()).user_id == subject
+
+
+def test_verify_access_token_remembers_rejected_tokens(monkeypatch: pytest.MonkeyPatch) -> None:
+    token = _issue_token(exp=int(time.time()) - 3600)
+    with pytest.raises(AuthServiceError):
+        verify_access_token(token)
+
+    def fail_if_called(token: str) -> None:
+        raise AssertionError("rejected token should not be re-verified")
+
+    monkeypatch.setattr(auth_service, "_verify_access_token_uncached", fail_if_called)
+
+    with pytest.raises(AuthServiceError) as exc:
+        verify_access_token(token)
+
+    assert exc.value.status_code == 401
+
+
+def test_verify_access_token_does_not_remember_unverifiable_tokens(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    token = _issue_token()
+    monkeypatch.setattr(settings, "supabase_jwt_secret", None)
+    with pytest.raises(AuthServiceError):
+        verify_access_token(token)
+
+    # Once the key source is configured the same token must verify.
+    monkeypatch.setattr(settings, "supabase_jwt_secret", TEST_JWT_SECRET)
+
+    assert verify_access_token(token).email == "athlete@example.com"
+
+
+def test_verify_access_token_does_not_remember_unknown_key_ids(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    token = _issue_token()
+
+    def unknown_key(token: str) -> None:
+        raise LocalVerificationUnavailable("No published signing key matches the token.")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(auth_service, "decode_access_token", unknown_key)
+        with pytest.raises(AuthServiceError) as exc:
+            verify_access_token(token)
+    assert exc.value.status_code == 401
+
+    # A later JWKS refresh publishes the key; the token must not stay rejected.
+    assert verify_access_token(token).email == "athlete@example.com"
@@ -2,19 +2,55 @@
 
 from __future__ import annotations
 
-from uuid import uuid4
+import asyncio
+import os
+import threading
+import time
+from collections.abc import Collection, Iterator, Sequence
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+from uuid import UUID, uuid4
 
 import pytest
+import services.users as users_service
+from app.config import settings
 from models import Base
 from models.enums import UserRole, WorkoutType
 from models.user import CoachUserAssignment, User
 from models.workout import Workout
-from schemas.users import UserListQuery
-from services.users import (MAX_USERS_PER_COACH, UserServiceError,
-                            assign_coaches_to_user, deactivate_user,
-                            get_admin_overview, list_users)
-from sqlalchemy import create_engine
+from schemas.users import (
+    BulkCoachAssignmentItem,
+    BulkUserCreateResponse,
+    CoachRebalanceRequest,
+    UserCreateRequest,
+    UserListQuery,
+)
+from services.principal_cache import principal_cache
+from services.users import (
+    MAX_USERS_PER_COACH,
+    UserServiceError,
+    assign_coaches_to_user,
+    bulk_assign_coaches,
+    bulk_create_users_async,
+    deactivate_user,
+    _search_criteria,
+    get_admin_overview,
+    list_users,
+    rebalance_coach_assignments,
+    reconcile_admin_overview_stats,
+)
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.orm.attributes import set_committed_value
+
+PERF_DATABASE_URL = os.environ.get("PERF_DATABASE_URL")
+requires_postgres = pytest.mark.skipif(
+    PERF_DATABASE_URL is None, reason="PERF_DATABASE_URL is not set"
+)
 
 
 @pytest.fixture()
@@ -36,6 +72,22 @@ def db_session() -> Session:
         engine.dispose()
 
 
+@pytest.fixture()
+def pg_session() -> Iterator[Session]:
+    engine = create_engine(PERF_DATABASE_URL)
+    with engine.connect() as connection:
+        transaction = connection.begin()
+        session = Session(
+            bind=connection, join_transaction_mode="create_savepoint", expire_on_commit=False
+        )
+        try:
+            yield session
+        finally:
+            session.close()
+            transaction.rollback()
+    engine.dispose()
+
+
 def _create_user(
     session: Session,
     *,
@@ -77,6 +129,26 @@ def test_deactivate_user_marks_user_inactive(db_session: Session) -> None:
     assert response.deactivated_at is not None
 
 
+def test_deactivate_user_invalidates_cached_principal(db_session: Session) -> None:
+    admin = _create_user(
+        db_session,
+        name="Admin",
+        email="cache-admin@gamata.test",
+        role=UserRole.ADMIN,
+    )
+    athlete = _create_user(
+        db_session,
+        name="Athlete",
+        email="cache-athlete@gamata.test",
+        role=UserRole.USER,
+    )
+    principal_cache.set(athlete.id, object())
+
+    deactivate_user(db_session, athlete.id, admin.id)
+
+    assert principal_cache.get(athlete.id) is None
+
+
 def test_deactivate_user_blocks_self_deactivation(db_session: Session) -> None:
     admin = _create_user(
         db_session,
@@ -91,6 +163,144 @@ def test_deactivate_user_blocks_self_deactivation(db_session: Session) -> None:
     assert exc.value.status_code == 400
 
 
+class _LocalAuthAdmin:
+    """In-memory stand-in for the Supabase auth admin API."""
+
+    def __init__(
+        self,
+        *,
+        rejected_emails: Collection[str] = frozenset(),
+        user_ids: Sequence[UUID] = (),
+    ) -> None:
+        self.rejected_emails = rejected_emails
+        self.user_ids = list(user_ids)
+        self.created: dict[str, UUID] = {}
+        self.deleted: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def create_user(self, attributes: dict[str, Any]) -> SimpleNamespace:
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(0.01)
+            if attributes["email"] in self.rejected_emails:
+                raise RuntimeError("provider rejected the user")
+            with self._lock:
+                user_id = self.user_ids.pop(0) if self.user_ids else uuid4()
+                self.created[attributes["email"]] = user_id
+            return SimpleNamespace(user=SimpleNamespace(id=str(user_id)))
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+    def delete_user(self, id: str) -> None:
+        with self._lock:
+            self.deleted.append(id)
+
+
+def _new_user_payload(email: str) -> UserCreateRequest:
+    return UserCreateRequest(
+        name=email.split("@")[0], email=email, role=UserRole.USER, password="password123"
+    )
+
+
+@pytest.fixture()
+def file_session(tmp_path: Path) -> Iterator[Session]:
+    engine = create_engine(f"sqlite+pysqlite:///{tmp_path / 'users.db'}")
+    Base.metadata.create_all(engine)
+    session = Session(bind=engine, expire_on_commit=False)
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
+
+def _bulk_create(
+    session: Session, emails: list[str], auth_admin: _LocalAuthAdmin
+) -> BulkUserCreateResponse:
+    """Run the bulk create the route runs, on an async session over `session`'s database."""
+
+    pytest.importorskip("aiosqlite")
+    session.commit()
+
+    async def run() -> BulkUserCreateResponse:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{session.bind.url.database}")
+        try:
+            async with AsyncSession(engine, expire_on_commit=False) as db:
+                return await bulk_create_users_async(
+                    db, [_new_user_payload(email) for email in emails], auth_admin=auth_admin
+                )
+        finally:
+            await engine.dispose()
+
+    return asyncio.run(run())
+
+
+def test_bulk_create_users_reports_conflicts_and_provider_failures(
+    file_session: Session, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(settings, "user_provisioning_concurrency", 2)
+    _create_user(file_session, name="Taken", email="taken@gamata.test", role=UserRole.USER)
+    auth_admin = _LocalAuthAdmin(rejected_emails={"rejected@gamata.test"})
+    emails = [
+        "one@gamata.test",
+        "taken@gamata.test",
+        "two@gamata.test",
+        "one@gamata.test",
+        "rejected@gamata.test",
+        "three@gamata.test",
+    ]
+
+    report = _bulk_create(file_session, emails, auth_admin)
+
+    assert [result.status for result in report.results] == [
+        "created",
+        "failed",
+        "created",
+        "failed",
+        "failed",
+        "created",
+    ]
+    assert report.results[1].detail == "A user with this email already exists."
+    assert report.results[3].detail == "Email appears more than once in the request."
+    assert report.results[4].detail == "Unable to create user in authentication provider."
+    assert report.results[0].user.id == auth_admin.created["one@gamata.test"]
+    assert (report.created_count, report.failed_count) == (3, 3)
+    assert auth_admin.max_in_flight <= 2
+    assert "taken@gamata.test" not in auth_admin.created
+    assert file_session.scalar(select(func.count()).select_from(User)) == 4
+
+
+def test_bulk_create_users_fails_only_the_items_whose_local_insert_fails(
+    file_session: Session, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # One provider call at a time, so the ids below are handed out in request order.
+    monkeypatch.setattr(settings, "user_provisioning_concurrency", 1)
+    existing = _create_user(
+        file_session, name="Existing", email="existing@gamata.test", role=UserRole.USER
+    )
+    # The provider hands back an id that already exists locally for the second user.
+    auth_admin = _LocalAuthAdmin(user_ids=[uuid4(), existing.id, uuid4()])
+
+    report = _bulk_create(
+        file_session, ["first@gamata.test", "second@gamata.test", "third@gamata.test"], auth_admin
+    )
+
+    assert [result.status for result in report.results] == ["created", "failed", "created"]
+    assert report.results[1].detail == "Unable to create local user profile."
+    assert (report.created_count, report.failed_count) == (2, 1)
+    assert auth_admin.deleted == [str(existing.id)]
+    assert sorted(file_session.scalars(select(User.email)).all()) == [
+        "existing@gamata.test",
+        "first@gamata.test",
+        "third@gamata.test",
+    ]
+
+
 def test_assign_coaches_enforces_50_user_limit(db_session: Session) -> None:
     admin = _create_user(
         db_session,
@@ -126,6 +336,8 @@ def test_assign_coaches_enforces_50_user_limit(db_session: Session) -> None:
                 assigned_by=admin.id,
             )
         )
+    # SQLite has no coach assignment triggers; mirror the counter they maintain on PostgreSQL.
+    coach.assigned_user_count = MAX_USERS_PER_COACH
     db_session.commit()
 
     with pytest.raises(UserServiceError) as exc:
@@ -140,6 +352,275 @@ def test_assign_coaches_enforces_50_user_limit(db_session: Session) -> None:
     assert str(MAX_USERS_PER_COACH) in exc.value.detail
 
 
+def test_bulk_assign_coaches_reports_each_item(db_session: Session) -> None:
+    admin = _create_user(
+        db_session, name="Admin", email="bulk-admin@gamata.test", role=UserRole.ADMIN
+    )
+    coach = _create_user(
+        db_session, name="Coach", email="bulk-coach@gamata.test", role=UserRole.COACH
+    )
+    idle_coach = _create_user(
+        db_session,
+        name="Idle Coach",
+        email="idle-coach@gamata.test",
+        role=UserRole.COACH,
+        is_active=False,
+    )
+    new_user = _create_user(db_session, name="New", email="new@gamata.test", role=UserRole.USER)
+    existing_user = _create_user(
+        db_session, name="Existing", email="existing@gamata.test", role=UserRole.USER
+    )
+    inactive_user = _create_user(
+        db_session,
+        name="Inactive",
+        email="inactive@gamata.test",
+        role=UserRole.USER,
+        is_active=False,
+    )
+    db_session.add(
+        CoachUserAssignment(
+            id=uuid4(), coach_id=coach.id, user_id=existing_user.id, assigned_by=admin.id
+        )
+    )
+    coach.assigned_user_count = 1
+    db_session.commit()
+    missing_user_id = uuid4()
+
+    report = bulk_assign_coaches(
+        db_session,
+        items=[
+            BulkCoachAssignmentItem(user_id=new_user.id, coach_ids=[coach.id]),
+            BulkCoachAssignmentItem(user_id=existing_user.id, coach_ids=[coach.id]),
+            BulkCoachAssignmentItem(user_id=inactive_user.id, coach_ids=[coach.id]),
+            BulkCoachAssignmentItem(user_id=missing_user_id, coach_ids=[coach.id]),
+            BulkCoachAssignmentItem(user_id=existing_user.id, coach_ids=[idle_coach.id]),
+        ],
+        assigned_by_user_id=admin.id,
+    )
+
+    assert [(result.user_id, result.status) for result in report.results] == [
+        (new_user.id, "assigned"),
+        (existing_user.id, "unchanged"),
+        (inactive_user.id, "failed"),
+        (missing_user_id, "failed"),
+        (existing_user.id, "failed"),
+    ]
+    assert report.results[0].assigned_coach_ids == [coach.id]
+    assert report.results[2].detail == "Cannot assign coaches to a deactivated user."
+    assert report.results[3].detail == "User not found."
+    assert report.assigned_count == 1
+    assert report.failed_count == 3
+    assigned_user_ids = db_session.scalars(
+        select(CoachUserAssignment.user_id).where(CoachUserAssignment.coach_id == coach.id)
+    ).all()
+    assert sorted(assigned_user_ids) == sorted([new_user.id, existing_user.id])
+
+
+def test_bulk_assign_coaches_allocates_capacity_in_request_order(db_session: Session) -> None:
+    admin = _create_user(
+        db_session, name="Admin", email="cap-admin@gamata.test", role=UserRole.ADMIN
+    )
+    coach = _create_user(
+        db_session, name="Coach", email="cap-coach@gamata.test", role=UserRole.COACH
+    )
+    coach.assigned_user_count = MAX_USERS_PER_COACH - 1
+    db_session.commit()
+    first = _create_user(db_session, name="First", email="first@gamata.test", role=UserRole.USER)
+    second = _create_user(db_session, name="Second", email="second@gamata.test", role=UserRole.USER)
+
+    report = bulk_assign_coaches(
+        db_session,
+        items=[
+            BulkCoachAssignmentItem(user_id=first.id, coach_ids=[coach.id]),
+            BulkCoachAssignmentItem(user_id=second.id, coach_ids=[coach.id]),
+        ],
+        assigned_by_user_id=admin.id,
+    )
+
+    assert [result.status for result in report.results] == ["assigned", "failed"]
+    assert str(MAX_USERS_PER_COACH) in report.results[1].detail
+
+
+def _seed_source_coach(session: Session, admin: User, user_count: int) -> User:
+    source = _create_user(
+        session, name="Leaving Coach", email="leaving@gamata.test", role=UserRole.COACH
+    )
+    for index in range(user_count):
+        athlete = _create_user(
+            session,
+            name=f"Athlete {index}",
+            email=f"athlete-{index}@gamata.test",
+            role=UserRole.USER,
+        )
+        session.add(
+            CoachUserAssignment(
+                id=uuid4(), coach_id=source.id, user_id=athlete.id, assigned_by=admin.id
+            )
+        )
+    source.assigned_user_count = user_count
+    session.commit()
+    return source
+
+
+def test_rebalance_moves_source_users_to_least_loaded_coaches(db_session: Session) -> None:
+    admin = _create_user(
+        db_session, name="Admin", email="rebalance-admin@gamata.test", role=UserRole.ADMIN
+    )
+    source = _seed_source_coach(db_session, admin, user_count=6)
+    busy = _create_user(db_session, name="Busy", email="busy@gamata.test", role=UserRole.COACH)
+    free = _create_user(db_session, name="Free", email="free@gamata.test", role=UserRole.COACH)
+    busy.assigned_user_count = 4
+    db_session.commit()
+    request = CoachRebalanceRequest(source_coach_id=source.id, target_coach_ids=[busy.id, free.id])
+
+    plan = rebalance_coach_assignments(
+        db_session, request.model_copy(update={"dry_run": True}), assigned_by_user_id=admin.id
+    )
+
+    assert plan.dry_run
+    assert {load.coach_id: load.assigned_user_count for load in plan.coach_loads} == {
+        source.id: 0,
+        busy.id: 5,
+        free.id: 5,
+    }
+    assert (
+        db_session.scalar(select(func.count()).where(CoachUserAssignment.coach_id == source.id))
+        == 6
+    )
+
+    applied = rebalance_coach_assignments(db_session, request, assigned_by_user_id=admin.id)
+
+    assert applied.moves == plan.moves
+    assigned_coach_ids = db_session.scalars(select(CoachUserAssignment.coach_id)).all()
+    assert sorted(map(str, assigned_coach_ids)) == sorted([str(busy.id)] + [str(free.id)] * 5)
+
+
+def test_rebalance_rejects_plans_that_exceed_capacity(db_session: Session) -> None:
+    admin = _create_user(
+        db_session, name="Admin", email="full-admin@gamata.test", role=UserRole.ADMIN
+    )
+    source = _seed_source_coach(db_session, admin, user_count=3)
+    target = _create_user(
+        db_session, name="Target Coach", email="target-coach@gamata.test", role=UserRole.COACH
+    )
+    target.assigned_user_count = MAX_USERS_PER_COACH - 1
+    db_session.commit()
+    request = CoachRebalanceRequest(source_coach_id=source.id, target_coach_ids=[target.id])
+
+    plan = rebalance_coach_assignments(
+        db_session, request.model_copy(update={"dry_run": True}), assigned_by_user_id=admin.id
+    )
+    assert len(plan.unplaced_user_ids) == 2
+
+    with pytest.raises(UserServiceError) as exc:
+        rebalance_coach_assignments(db_session, request, assigned_by_user_id=admin.id)
+
+    assert exc.value.status_code == 400
+    assert (
+        db_session.scalar(select(func.count()).where(CoachUserAssignment.coach_id == source.id))
+        == 3
+    )
+
+
+def test_rebalance_rejects_users_not_assigned_to_the_source_coach(db_session: Session) -> None:
+    admin = _create_user(
+        db_session, name="Admin", email="stray-admin@gamata.test", role=UserRole.ADMIN
+    )
+    source = _seed_source_coach(db_session, admin, user_count=2)
+    target = _create_user(
+        db_session, name="Target Coach", email="stray-target@gamata.test", role=UserRole.COACH
+    )
+    stray = _create_user(db_session, name="Stray", email="stray@gamata.test", role=UserRole.USER)
+    source_user_id = db_session.scalars(
+        select(CoachUserAssignment.user_id).where(CoachUserAssignment.coach_id == source.id)
+    ).first()
+    request = CoachRebalanceRequest(
+        source_coach_id=source.id,
+        user_ids=[source_user_id, stray.id, uuid4()],
+        target_coach_ids=[target.id],
+        dry_run=True,
+    )
+
+    with pytest.raises(UserServiceError) as exc:
+        rebalance_coach_assignments(db_session, request, assigned_by_user_id=admin.id)
+
+    assert exc.value.status_code == 400
+    assert exc.value.detail.startswith("2 selected users")
+
+
+@requires_postgres
+def test_coach_cap_trigger_rejections_map_to_capacity_errors(
+    pg_session: Session, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    tag = uuid4().hex[:8]
+
+    def add_user(role: UserRole) -> User:
+        user = User(
+            id=uuid4(),
+            name=f"{role.value} {uuid4().hex[:6]}",
+            email=f"{uuid4().hex}@{tag}.test",
+            role=role,
+        )
+        pg_session.add(user)
+        return user
+
+    admin = add_user(UserRole.ADMIN)
+    full = add_user(UserRole.COACH)
+    source = add_user(UserRole.COACH)
+    athletes = [add_user(UserRole.USER) for _ in range(MAX_USERS_PER_COACH + 2)]
+    pg_session.flush()
+    # The triggers keep assigned_user_count, so `full` ends up at the cap.
+    pg_session.add_all(
+        CoachUserAssignment(id=uuid4(), coach_id=full.id, user_id=athlete.id, assigned_by=admin.id)
+        for athlete in athletes[:MAX_USERS_PER_COACH]
+    )
+    pg_session.add(
+        CoachUserAssignment(
+            id=uuid4(), coach_id=source.id, user_id=athletes[-1].id, assigned_by=admin.id
+        )
+    )
+    pg_session.commit()
+
+    lock_coaches = users_service._lock_coaches
+
+    def stale_lock_coaches(db: Session, coach_ids: list[UUID]) -> dict[UUID, User]:
+        # Stands in for a writer that read the count before a concurrent one committed.
+        coach_map = lock_coaches(db, coach_ids)
+        for coach in coach_map.values():
+            set_committed_value(coach, "assigned_user_count", 0)
+        return coach_map
+
+    monkeypatch.setattr(users_service, "_lock_coaches", stale_lock_coaches)
+    expected = f"{full.name} already has {MAX_USERS_PER_COACH} assigned users."
+
+    with pytest.raises(UserServiceError) as single:
+        assign_coaches_to_user(
+            pg_session,
+            user_id=athletes[-2].id,
+            coach_ids=[full.id],
+            assigned_by_user_id=admin.id,
+        )
+    with pytest.raises(UserServiceError) as bulk:
+        bulk_assign_coaches(
+            pg_session,
+            [BulkCoachAssignmentItem(user_id=athletes[-2].id, coach_ids=[full.id])],
+            assigned_by_user_id=admin.id,
+        )
+    with pytest.raises(UserServiceError) as rebalance:
+        rebalance_coach_assignments(
+            pg_session,
+            CoachRebalanceRequest(source_coach_id=source.id, target_coach_ids=[full.id]),
+            assigned_by_user_id=admin.id,
+        )
+
+    for exc in (single, bulk, rebalance):
+        assert (exc.value.status_code, exc.value.detail) == (400, expected)
+    assert (
+        pg_session.scalar(select(func.count()).where(CoachUserAssignment.coach_id == full.id))
+        == MAX_USERS_PER_COACH
+    )
+
+
 def test_list_users_applies_role_and_status_filters(db_session: Session) -> None:
     _create_user(
         db_session,
@@ -171,6 +652,82 @@ def test_list_users_applies_role_and_status_filters(db_session: Session) -> None
     assert response.items[0].is_active is True
 
 
+def test_list_users_keyset_pages_cover_every_user_once(db_session: Session) -> None:
+    # Shared timestamps force the id tie-breaker to decide page boundaries.
+    created_at = datetime(2026, 2, 1, tzinfo=timezone.utc)
+    for index in range(5):
+        db_session.add(
+            User(
+                id=uuid4(),
+                name=f"Athlete {index}",
+                email=f"keyset-{index}@gamata.test",
+                role=UserRole.USER,
+                created_at=created_at if index < 3 else created_at + timedelta(days=index),
+            )
+        )
+    db_session.commit()
+
+    first_page = list_users(db_session, UserListQuery(page_size=2, count="none"))
+    seen = [item.id for item in first_page.items]
+    cursor = first_page.next_cursor
+    while cursor is not None:
+        page = list_users(db_session, UserListQuery(page_size=2, cursor=cursor, count="none"))
+        seen.extend(item.id for item in page.items)
+        cursor = page.next_cursor
+
+    offset_page = list_users(db_session, UserListQuery(page_size=10))
+    assert first_page.total is None
+    assert first_page.total_pages is None
+    assert seen == [item.id for item in offset_page.items]
+    assert len(set(seen)) == 5
+    assert offset_page.total == 5
+    assert offset_page.next_cursor is None
+
+
+def test_list_users_rejects_malformed_cursor(db_session: Session) -> None:
+    with pytest.raises(UserServiceError) as exc:
+        list_users(db_session, UserListQuery(cursor="not-a-cursor"))
+
+    assert exc.value.status_code == 400
+
+
+def test_search_criteria_uses_trigram_operators_on_postgresql() -> None:
+    search_filter, rank = _search_criteria("postgresql", "Smith")
+    assert rank is not None
+
+    statement = select(User.id).where(search_filter).order_by(rank.desc())
+    # psycopg2 escapes literal percent signs in compiled SQL.
+    sql = str(statement.compile(dialect=postgresql.dialect())).replace("%%", "%")
+
+    # Expressions must match the ix_users_*_trgm index definitions.
+    assert "lower(users.name) %>" in sql
+    assert "lower(users.email) %>" in sql
+    assert "word_similarity" in sql
+    assert _search_criteria("sqlite", "Smith")[1] is None
+
+
+@requires_postgres
+def test_search_ranks_misspelled_names_by_word_similarity(pg_session: Session) -> None:
+    created_at = datetime(2026, 2, 1, tzinfo=timezone.utc)
+    # The weaker match is the newest, so only the similarity rank puts it last.
+    for index, name in enumerate(["Zebulon Marsh", "Zeb Kowalski", "Zebulan Ortiz"]):
+        pg_session.add(
+            User(
+                id=uuid4(),
+                name=name,
+                email=f"{uuid4().hex}@gamata.test",
+                role=UserRole.USER,
+                created_at=created_at + timedelta(days=index),
+            )
+        )
+    pg_session.commit()
+
+    page = list_users(pg_session, UserListQuery(search="Zebulom", count="none"))
+
+    # No row contains "zebulom"; both hits come from `%>` (word_similarity 0.75 and 0.625).
+    assert [item.name for item in page.items] == ["Zebulon Marsh", "Zebulan Ortiz"]
+
+
 def test_get_admin_overview_counts_dashboard_metrics(db_session: Session) -> None:
     _create_user(
         db_session,
@@ -209,3 +766,20 @@ def test_get_admin_overview_counts_dashboard_metrics(db_session: Session) -> Non
     assert overview.total_workouts == 1
     assert overview.active_users == 2
     assert overview.inactive_users == 1
+
+
+def test_get_admin_overview_reads_reconciled_counters(db_session: Session) -> None:
+    _create_user(db_session, name="Coach", email="stats-coach@gamata.test", role=UserRole.COACH)
+    _create_user(db_session, name="Athlete", email="stats-user@gamata.test", role=UserRole.USER)
+
+    reconciled = reconcile_admin_overview_stats(db_session)
+    assert reconciled.total_users == 1
+    assert reconciled.total_coaches == 1
+
+    # Without the PostgreSQL triggers the row only changes on reconciliation, which shows
+    # the overview is served from the stats row rather than live counts.
+    _create_user(db_session, name="Later", email="stats-later@gamata.test", role=UserRole.USER)
+    assert get_admin_overview(db_session) == reconciled
+
+    assert reconcile_admin_overview_stats(db_session).total_users == 2
+    assert get_admin_overview(db_session).total_users == 2
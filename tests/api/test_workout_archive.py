@@ -0,0 +1,192 @@
+"""Batch workout archiving tests."""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from datetime import date
+from uuid import UUID, uuid4
+
+import pytest
+import services.workouts as workout_service
+from models import Base
+from models.enums import PlanAssignmentStatus, UserRole, WorkoutType
+from models.plan import PlanAssignment, PlanDay, PlanDayWorkout, WorkoutPlan
+from models.user import User
+from models.workout import Workout
+from schemas.workouts import WorkoutArchiveResponse
+from services.workouts import archive_workouts
+from sqlalchemy import create_engine, delete, insert, select
+from sqlalchemy.orm import Session, sessionmaker
+
+PERF_DATABASE_URL = os.environ.get("PERF_DATABASE_URL")
+
+
+@pytest.fixture()
+def db_session() -> Session:
+    engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)()
+    try:
+        yield session
+    finally:
+        session.close()
+        Base.metadata.drop_all(engine)
+        engine.dispose()
+
+
+def _create_user(session: Session, role: UserRole) -> User:
+    user = User(id=uuid4(), name=role.value, email=f"{uuid4().hex[:8]}@gamata.test", role=role)
+    session.add(user)
+    session.flush()
+    return user
+
+
+def _create_plan(
+    session: Session,
+    name: str,
+    workouts: list[Workout],
+    statuses: list[PlanAssignmentStatus],
+) -> WorkoutPlan:
+    coach = _create_user(session, UserRole.COACH)
+    plan = WorkoutPlan(
+        id=uuid4(),
+        name=name,
+        coach_id=coach.id,
+        start_date=date(2026, 1, 1),
+        end_date=date(2026, 12, 31),
+    )
+    day = PlanDay(id=uuid4(), plan_id=plan.id, day_of_week=1)
+    session.add_all([plan, day])
+    session.flush()
+    session.add_all(
+        [PlanDayWorkout(plan_day_id=day.id, workout_id=workout.id) for workout in workouts]
+    )
+    for status in statuses:
+        user = _create_user(session, UserRole.USER)
+        session.add(PlanAssignment(id=uuid4(), plan_id=plan.id, user_id=user.id, status=status))
+    session.flush()
+    return plan
+
+
+def _workout(session: Session, name: str, is_archived: bool = False) -> Workout:
+    workout = Workout(id=uuid4(), name=name, type=WorkoutType.STRENGTH, is_archived=is_archived)
+    session.add(workout)
+    session.flush()
+    return workout
+
+
+def _archived_ids(session: Session, workout_ids: list[UUID]) -> set[UUID]:
+    return set(
+        session.scalars(
+            select(Workout.id).where(Workout.id.in_(workout_ids), Workout.is_archived.is_(True))
+        )
+    )
+
+
+def test_archive_workouts_reports_blocking_active_plans(db_session: Session) -> None:
+    blocked = _workout(db_session, "Bench Press")
+    free = _workout(db_session, "Push-Up")
+    old_plan_only = _workout(db_session, "Dips")
+    already = _workout(db_session, "Old Press", is_archived=True)
+    active_plan = _create_plan(
+        db_session,
+        "Strength Block",
+        [blocked],
+        [PlanAssignmentStatus.ACTIVE, PlanAssignmentStatus.ACTIVE, PlanAssignmentStatus.INACTIVE],
+    )
+    _create_plan(
+        db_session, "Past Block", [old_plan_only, blocked], [PlanAssignmentStatus.INACTIVE]
+    )
+    db_session.commit()
+    missing_id = uuid4()
+
+    response = archive_workouts(
+        db_session, [blocked.id, free.id, old_plan_only.id, already.id, missing_id, free.id]
+    )
+
+    assert [(result.workout_id, result.status) for result in response.results] == [
+        (blocked.id, "blocked"),
+        (free.id, "archived"),
+        (old_plan_only.id, "archived"),
+        (already.id, "unchanged"),
+        (missing_id, "not_found"),
+    ]
+    (blocking_plan,) = response.results[0].blocking_plans
+    assert (blocking_plan.id, blocking_plan.name, blocking_plan.active_assignment_count) == (
+        active_plan.id,
+        "Strength Block",
+        2,
+    )
+    assert (response.archived_count, response.blocked_count) == (2, 1)
+    assert _archived_ids(db_session, [blocked.id, free.id, old_plan_only.id]) == {
+        free.id,
+        old_plan_only.id,
+    }
+
+
+def test_archive_rechecks_dependencies_in_the_update(
+    db_session: Session, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    workout = _workout(db_session, "Bench Press")
+    plan = _create_plan(db_session, "Strength Block", [workout], [PlanAssignmentStatus.ACTIVE])
+    db_session.commit()
+    check_dependencies = workout_service._blocking_plans
+    calls: list[list[UUID]] = []
+
+    def activated_after_first_check(db: Session, workout_ids: list[UUID]) -> dict:
+        # The first check runs as if the assignment had not been activated yet.
+        calls.append(workout_ids)
+        return {} if len(calls) == 1 else check_dependencies(db, workout_ids)
+
+    monkeypatch.setattr(workout_service, "_blocking_plans", activated_after_first_check)
+
+    response = archive_workouts(db_session, [workout.id])
+
+    (result,) = response.results
+    assert result.status == "blocked"
+    assert [blocking_plan.id for blocking_plan in result.blocking_plans] == [plan.id]
+    assert (response.archived_count, response.blocked_count) == (0, 1)
+    assert _archived_ids(db_session, [workout.id]) == set()
+
+
+@pytest.mark.skipif(PERF_DATABASE_URL is None, reason="PERF_DATABASE_URL is not set")
+def test_archive_waits_for_a_concurrent_plan_assignment() -> None:
+    engine = create_engine(PERF_DATABASE_URL)
+    with Session(engine, expire_on_commit=False) as seed:
+        workout = _workout(seed, f"Bench Press {uuid4().hex}")
+        plan = _create_plan(seed, f"Strength Block {uuid4().hex}", [workout], [])
+        athlete = _create_user(seed, UserRole.USER)
+        seed.commit()
+
+    outcome: list[WorkoutArchiveResponse] = []
+    try:
+        with engine.connect() as coach_connection:
+            # The coach's transaction assigns the plan but has not committed yet.
+            coach_connection.execute(
+                insert(PlanAssignment).values(
+                    plan_id=plan.id, user_id=athlete.id, status=PlanAssignmentStatus.ACTIVE
+                )
+            )
+
+            def archive() -> None:
+                with Session(engine) as admin:
+                    outcome.append(archive_workouts(admin, [workout.id]))
+
+            archiver = threading.Thread(target=archive)
+            archiver.start()
+            time.sleep(0.3)
+            assert archiver.is_alive(), "archive should wait for the plan lock"
+            coach_connection.commit()
+            archiver.join(timeout=10)
+
+        (result,) = outcome[0].results
+        assert result.status == "blocked"
+        assert [blocking_plan.id for blocking_plan in result.blocking_plans] == [plan.id]
+    finally:
+        with engine.begin() as connection:
+            connection.execute(delete(WorkoutPlan).where(WorkoutPlan.id == plan.id))
+            connection.execute(delete(User).where(User.id.in_([plan.coach_id, athlete.id])))
+            connection.execute(delete(Workout).where(Workout.id == workout.id))
+        engine.dispose()
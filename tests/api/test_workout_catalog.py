@@ -0,0 +1,287 @@
+"""Workout catalog cache tests."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from uuid import uuid4
+
+import httpx
+import pytest
+import services.workout_catalog as workout_catalog
+from api.workouts import router as workouts_router
+from app.database import get_async_read_db_session
+from core.permissions import AuthenticatedUser, get_current_user
+from fastapi import FastAPI
+from models import Base
+from models.enums import UserRole, WorkoutType
+from models.stats import WorkoutCatalogVersion
+from models.workout import CardioType, MuscleGroup, Workout, WorkoutMuscleGroup
+from schemas.workouts import WorkoutBrowseQuery
+from services.workout_catalog import (
+    MAX_SWAP_ALTERNATIVES,
+    WorkoutCatalogCache,
+    browse_workout_catalog,
+    find_swap_alternatives,
+)
+from services.workouts import WorkoutServiceError
+from sqlalchemy import create_engine, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+
+@pytest.fixture()
+def db_session() -> Session:
+    engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)()
+    try:
+        yield session
+    finally:
+        session.close()
+        Base.metadata.drop_all(engine)
+        engine.dispose()
+
+
+def _seed_catalog(session: Session) -> tuple[MuscleGroup, Workout, Workout]:
+    # SQLite has no catalog triggers; tests bump the version row themselves.
+    chest = MuscleGroup(id=uuid4(), name="Chest", icon="chest")
+    legs = MuscleGroup(id=uuid4(), name="Legs", icon="legs")
+    rowing = CardioType(id=uuid4(), name="Rowing", description="Indoor rower")
+    bench = Workout(id=uuid4(), name="Bench Press", type=WorkoutType.STRENGTH)
+    squat = Workout(id=uuid4(), name="Squat", type=WorkoutType.STRENGTH)
+    row = Workout(
+        id=uuid4(),
+        name="Row Intervals",
+        type=WorkoutType.CARDIO,
+        cardio_type_id=rowing.id,
+        is_archived=True,
+    )
+    session.add_all([chest, legs, rowing, bench, squat, row])
+    session.flush()
+    session.add_all(
+        [
+            WorkoutMuscleGroup(workout_id=bench.id, muscle_group_id=chest.id),
+            WorkoutMuscleGroup(workout_id=squat.id, muscle_group_id=legs.id),
+            WorkoutCatalogVersion(id=1, version=1),
+        ]
+    )
+    session.commit()
+    return chest, bench, squat
+
+
+def _bump_version(session: Session) -> None:
+    session.execute(
+        update(WorkoutCatalogVersion)
+        .where(WorkoutCatalogVersion.id == 1)
+        .values(version=WorkoutCatalogVersion.version + 1)
+    )
+    session.commit()
+
+
+def test_catalog_is_served_from_memory_until_version_changes(db_session: Session) -> None:
+    chest, bench, squat = _seed_catalog(db_session)
+    cache = WorkoutCatalogCache(probe_interval=0)
+
+    first = cache.get(db_session)
+    assert first.version == 1
+    assert [workout.name for workout in first.workouts] == ["Bench Press", "Row Intervals", "Squat"]
+    assert [workout.name for workout in first.active_workouts()] == ["Bench Press", "Squat"]
+    assert first.workouts_by_id[bench.id].muscle_group_ids == (chest.id,)
+    assert first.workout_ids_by_muscle_group[chest.id] == (bench.id,)
+
+    db_session.execute(update(Workout).where(Workout.id == squat.id).values(name="Back Squat"))
+    db_session.commit()
+    assert cache.get(db_session) is first
+    assert cache.reloads == 1
+
+    _bump_version(db_session)
+    second = cache.get(db_session)
+    assert second is not first
+    assert second.version == 2
+    assert second.workouts_by_id[squat.id].name == "Back Squat"
+    assert cache.reloads == 2
+
+
+def test_catalog_skips_version_probe_within_interval(db_session: Session) -> None:
+    _seed_catalog(db_session)
+    cache = WorkoutCatalogCache(probe_interval=3600)
+
+    first = cache.get(db_session)
+    _bump_version(db_session)
+
+    assert cache.get(db_session) is first
+    assert (cache.probes, cache.hits) == (1, 1)
+
+    cache.invalidate()
+    assert cache.get(db_session).version == 2
+
+
+def test_catalog_load_skips_links_to_workouts_missing_from_snapshot(db_session: Session) -> None:
+    chest, bench, _ = _seed_catalog(db_session)
+    # Stands in for a workout deleted between the links read and the workouts read.
+    db_session.add(WorkoutMuscleGroup(workout_id=uuid4(), muscle_group_id=chest.id))
+    db_session.commit()
+
+    catalog = WorkoutCatalogCache(probe_interval=0).get(db_session)
+
+    assert catalog.workout_ids_by_muscle_group[chest.id] == (bench.id,)
+
+
+def test_concurrent_async_reads_share_one_refresh(tmp_path: Path) -> None:
+    pytest.importorskip("aiosqlite")
+    url = f"sqlite+aiosqlite:///{tmp_path / 'catalog.db'}"
+    cache = WorkoutCatalogCache(probe_interval=0)
+
+    async def run() -> list[int]:
+        engine = create_async_engine(url)
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+        sessions = async_sessionmaker(bind=engine, expire_on_commit=False)
+        async with sessions() as seed:
+            await seed.run_sync(_seed_catalog)
+
+        async def read() -> int:
+            async with sessions() as db:
+                return (await cache.get_async(db)).version
+
+        try:
+            # A cold cache with several readers at once used to deadlock the event loop.
+            return await asyncio.wait_for(asyncio.gather(*(read() for _ in range(5))), 5)
+        finally:
+            await engine.dispose()
+
+    assert asyncio.run(run()) == [1] * 5
+    assert cache.reloads == 1
+
+
+def test_catalog_route_honours_if_none_match(
+    db_session: Session, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _seed_catalog(db_session)
+    cache = WorkoutCatalogCache(probe_interval=0)
+
+    async def get_catalog(db: object) -> workout_catalog.WorkoutCatalog:
+        return cache.get(db_session)
+
+    monkeypatch.setattr("api.workouts.get_workout_catalog_async", get_catalog)
+    app = FastAPI()
+    app.include_router(workouts_router)
+    app.dependency_overrides[get_async_read_db_session] = lambda: None
+    app.dependency_overrides[get_current_user] = lambda: AuthenticatedUser(
+        id=uuid4(), email="athlete@gamata.test", name="Athlete", role=UserRole.USER
+    )
+
+    async def run() -> tuple[httpx.Response, httpx.Response, httpx.Response]:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            first = await client.get("/workouts/catalog")
+            cached = await client.get(
+                "/workouts/catalog", headers={"If-None-Match": first.headers["etag"]}
+            )
+            _bump_version(db_session)
+            changed = await client.get(
+                "/workouts/catalog", headers={"If-None-Match": first.headers["etag"]}
+            )
+        return first, cached, changed
+
+    first, cached, changed = asyncio.run(run())
+
+    assert first.status_code == 200
+    assert first.json()["version"] == 1
+    assert [workout["name"] for workout in first.json()["workouts"]] == ["Bench Press", "Squat"]
+    assert cached.status_code == 304
+    assert changed.status_code == 200
+    assert changed.json()["version"] == 2
+
+
+def test_browse_counts_each_facet_without_its_own_filter(db_session: Session) -> None:
+    chest, bench, squat = _seed_catalog(db_session)
+    catalog = WorkoutCatalogCache(probe_interval=0).get(db_session)
+
+    page = browse_workout_catalog(catalog, WorkoutBrowseQuery(muscle_group_id=chest.id))
+    assert [item.id for item in page.items] == [bench.id]
+    assert page.total == 1
+    assert {facet.name: facet.count for facet in page.muscle_groups} == {"Chest": 1, "Legs": 1}
+    assert {facet.type: facet.count for facet in page.types} == {
+        WorkoutType.STRENGTH: 1,
+        WorkoutType.CARDIO: 0,
+    }
+
+    everything = browse_workout_catalog(
+        catalog, WorkoutBrowseQuery(is_archived=None, type=WorkoutType.CARDIO)
+    )
+    assert [item.name for item in everything.items] == ["Row Intervals"]
+    assert {facet.name: facet.count for facet in everything.cardio_types} == {"Rowing": 1}
+    assert {facet.type: facet.count for facet in everything.types} == {
+        WorkoutType.STRENGTH: 2,
+        WorkoutType.CARDIO: 1,
+    }
+
+    second_page = browse_workout_catalog(catalog, WorkoutBrowseQuery(page=2, page_size=1))
+    assert [item.id for item in second_page.items] == [squat.id]
+    assert second_page.total == 2
+
+
+def test_swap_alternatives_rank_by_shared_muscle_groups(db_session: Session) -> None:
+    chest, bench, squat = _seed_catalog(db_session)
+    legs_id = db_session.scalar(select(MuscleGroup.id).where(MuscleGroup.name == "Legs"))
+    thruster = Workout(id=uuid4(), name="Thruster", type=WorkoutType.STRENGTH)
+    burpee = Workout(id=uuid4(), name="Burpee", type=WorkoutType.CARDIO)
+    push_up = Workout(id=uuid4(), name="Push-Up", type=WorkoutType.STRENGTH)
+    db_session.add_all([thruster, burpee, push_up])
+    db_session.flush()
+    db_session.add_all(
+        [
+            WorkoutMuscleGroup(workout_id=thruster.id, muscle_group_id=chest.id),
+            WorkoutMuscleGroup(workout_id=thruster.id, muscle_group_id=legs_id),
+            WorkoutMuscleGroup(workout_id=burpee.id, muscle_group_id=chest.id),
+            WorkoutMuscleGroup(workout_id=burpee.id, muscle_group_id=legs_id),
+            WorkoutMuscleGroup(workout_id=push_up.id, muscle_group_id=chest.id),
+        ]
+    )
+    db_session.commit()
+    cache = WorkoutCatalogCache(probe_interval=0)
+    catalog = cache.get(db_session)
+
+    result = find_swap_alternatives(catalog, thruster.id, limit=10)
+    assert [(item.workout.name, item.shared_muscle_group_count) for item in result.items] == [
+        ("Burpee", 2),
+        ("Bench Press", 1),
+        ("Push-Up", 1),
+        ("Squat", 1),
+    ]
+    assert [item.workout.id for item in find_swap_alternatives(catalog, bench.id, 2).items] == [
+        push_up.id,
+        thruster.id,
+    ]
+    assert set(catalog.swap_rankings) == {thruster.id, bench.id}
+
+    with pytest.raises(WorkoutServiceError) as exc_info:
+        find_swap_alternatives(catalog, uuid4(), limit=10)
+    assert exc_info.value.status_code == 404
+
+    _bump_version(db_session)
+    assert cache.get(db_session).swap_rankings == {}
+
+
+def test_swap_rankings_keep_only_the_largest_servable_page(db_session: Session) -> None:
+    chest, bench, _ = _seed_catalog(db_session)
+    extras = [
+        Workout(id=uuid4(), name=f"Press {index:03d}", type=WorkoutType.STRENGTH)
+        for index in range(MAX_SWAP_ALTERNATIVES + 10)
+    ]
+    db_session.add_all(extras)
+    db_session.flush()
+    db_session.add_all(
+        WorkoutMuscleGroup(workout_id=workout.id, muscle_group_id=chest.id) for workout in extras
+    )
+    db_session.commit()
+    catalog = WorkoutCatalogCache(probe_interval=0).get(db_session)
+
+    result = find_swap_alternatives(catalog, bench.id, limit=MAX_SWAP_ALTERNATIVES)
+
+    assert len(catalog.swap_rankings[bench.id]) == MAX_SWAP_ALTERNATIVES
+    assert [item.workout.name for item in result.items] == [
+        workout.name for workout in extras[:MAX_SWAP_ALTERNATIVES]
+    ]
@@ -0,0 +1,160 @@
+"""Workout search tests.
+
+Search runs on the PostgreSQL `search_vector` column, so the behaviour tests need
+PERF_DATABASE_URL pointing at a database migrated to head; everything they write is
+rolled back.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from collections.abc import Iterator
+from uuid import uuid4
+
+import httpx
+import pytest
+from api.workouts import router as workouts_router
+from app.database import get_async_read_db_session
+from core.permissions import AuthenticatedUser, get_current_user
+from fastapi import FastAPI
+from models.enums import UserRole, WorkoutType
+from models.workout import MuscleGroup, Workout, WorkoutMuscleGroup
+from pydantic import ValidationError
+from schemas.workouts import WorkoutSearchQuery
+from services.workouts import search_workouts
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+PERF_DATABASE_URL = os.environ.get("PERF_DATABASE_URL")
+requires_postgres = pytest.mark.skipif(
+    PERF_DATABASE_URL is None, reason="PERF_DATABASE_URL is not set"
+)
+
+
+@pytest.fixture()
+def pg_session() -> Iterator[Session]:
+    engine = create_engine(PERF_DATABASE_URL)
+    with engine.connect() as connection:
+        transaction = connection.begin()
+        session = Session(
+            bind=connection, join_transaction_mode="create_savepoint", expire_on_commit=False
+        )
+        try:
+            yield session
+        finally:
+            session.close()
+            transaction.rollback()
+    engine.dispose()
+
+
+@pytest.fixture()
+def tag() -> str:
+    # A word no other row contains, so every search can be scoped to this test's rows.
+    return "zz" + "".join(chr(ord("a") + int(digit, 16)) for digit in uuid4().hex[:10]) + "q"
+
+
+def _seed_library(session: Session, tag: str) -> MuscleGroup:
+    # Names are unique across the library, so each one carries the test's tag.
+    legs = MuscleGroup(id=uuid4(), name=f"Legs {tag}", icon="legs")
+    leg_press = Workout(
+        id=uuid4(),
+        name=f"Leg Press {tag}",
+        description="Sled press for quads",
+        type=WorkoutType.STRENGTH,
+    )
+    session.add_all(
+        [
+            legs,
+            leg_press,
+            Workout(id=uuid4(), name=f"Bench Press {tag}", type=WorkoutType.STRENGTH),
+            Workout(
+                id=uuid4(),
+                name=f"Press Machine {tag}",
+                type=WorkoutType.STRENGTH,
+                is_archived=True,
+            ),
+            Workout(
+                id=uuid4(),
+                name=f"Treadmill Run {tag}",
+                instructions="Keep a steady press of the pace",
+                type=WorkoutType.CARDIO,
+            ),
+        ]
+    )
+    session.flush()
+    session.add(WorkoutMuscleGroup(workout_id=leg_press.id, muscle_group_id=legs.id))
+    session.commit()
+    return legs
+
+
+def _names(session: Session, tag: str, **query: object) -> list[str]:
+    page = search_workouts(session, WorkoutSearchQuery(**query))
+    return [item.name.removesuffix(f" {tag}") for item in page.items]
+
+
+@requires_postgres
+def test_search_treats_the_last_typed_terms_as_prefixes(pg_session: Session, tag: str) -> None:
+    _seed_library(pg_session, tag)
+
+    assert _names(pg_session, tag, q=f"{tag} ben pre") == ["Bench Press"]
+    assert _names(pg_session, tag, q=f"{tag} treadm") == ["Treadmill Run"]
+    assert sorted(_names(pg_session, tag, q=f"{tag} pres")) == [
+        "Bench Press",
+        "Leg Press",
+        "Treadmill Run",
+    ]
+
+
+@requires_postgres
+def test_search_ranks_name_matches_above_instruction_matches(pg_session: Session, tag: str) -> None:
+    _seed_library(pg_session, tag)
+
+    assert _names(pg_session, tag, q=f"{tag} press") == [
+        "Leg Press",
+        "Bench Press",
+        "Treadmill Run",
+    ]
+    ranks = [
+        item.rank
+        for item in search_workouts(pg_session, WorkoutSearchQuery(q=f"{tag} press")).items
+    ]
+    # A second hit in the description outranks the name alone, which outranks instructions.
+    assert ranks[0] > ranks[1] > ranks[2]
+
+
+@requires_postgres
+def test_search_requires_every_term(pg_session: Session, tag: str) -> None:
+    legs = _seed_library(pg_session, tag)
+
+    assert _names(pg_session, tag, q=f"{tag} press quads") == ["Leg Press"]
+    assert _names(pg_session, tag, q=f"{tag} press rowing") == []
+    assert _names(
+        pg_session, tag, q=f"{tag} press", type=WorkoutType.STRENGTH, muscle_group_id=legs.id
+    ) == ["Leg Press"]
+    assert len(_names(pg_session, tag, q=f"{tag} press", is_archived=None)) == 4
+
+    beyond = search_workouts(pg_session, WorkoutSearchQuery(q=f"{tag} press", page=3, page_size=2))
+    assert beyond.items == []
+    assert beyond.total == 3
+
+
+def test_search_query_requires_a_word() -> None:
+    with pytest.raises(ValidationError):
+        WorkoutSearchQuery(q=" !!! ")
+
+    app = FastAPI()
+    app.include_router(workouts_router)
+    app.dependency_overrides[get_async_read_db_session] = lambda: None
+    app.dependency_overrides[get_current_user] = lambda: AuthenticatedUser(
+        id=uuid4(), email="athlete@gamata.test", name="Athlete", role=UserRole.USER
+    )
+
+    async def run() -> httpx.Response:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.get("/workouts/search", params={"q": "!!!"})
+
+    response = asyncio.run(run())
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["query", "q"]
@@ -0,0 +1,31 @@
+"""Helpers shared by the performance tests."""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Callable
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+
+# Database benchmarks need a migrated PostgreSQL database; they are skipped otherwise.
+PERF_DATABASE_URL = os.environ.get("PERF_DATABASE_URL")
+MIGRATIONS_SQL_DIR = ROOT / "database" / "migrations" / "sql"
+
+
+def best_interleaved(
+    baseline: Callable[[], float], candidate: Callable[[], float], *, rounds: int
+) -> tuple[float, float]:
+    """Lowest cost measured for each side over `rounds` alternating runs.
+
+    Each callable runs one measurement and returns its cost (e.g. ms per request).
+    Alternating spreads background noise over both sides, and the minimum is the
+    sample that noise disturbed least.
+    """
+
+    baseline_samples: list[float] = []
+    candidate_samples: list[float] = []
+    for _ in range(rounds):
+        baseline_samples.append(baseline())
+        candidate_samples.append(candidate())
+    return min(baseline_samples), min(candidate_samples)
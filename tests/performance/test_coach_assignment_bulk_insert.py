@@ -0,0 +1,92 @@
+"""Benchmark: 10k coach assignments with per-row vs statement-level triggers.
+
+Requires PERF_DATABASE_URL pointing at a database migrated to head. All writes happen
+in transactions that are rolled back.
+"""
+
+from __future__ import annotations
+
+import time
+from uuid import uuid4
+
+import pytest
+from perf_support import MIGRATIONS_SQL_DIR, PERF_DATABASE_URL
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Connection
+
+COACHES = 200
+USERS_PER_COACH = 50  # 200 x 50 = 10k assignments, every coach filled to the cap.
+
+pytestmark = pytest.mark.skipif(PERF_DATABASE_URL is None, reason="PERF_DATABASE_URL is not set")
+
+
+def _seed_people(connection: Connection) -> tuple[str, list[str], list[str]]:
+    run_id = uuid4().hex[:8]
+
+    def insert_users(role: str, count: int) -> list[str]:
+        return [
+            str(user_id)
+            for user_id in connection.execute(
+                text(
+                    "INSERT INTO users (name, email, role) "
+                    "SELECT 'Bench ' || g, :prefix || g || '@perf.test', CAST(:role AS user_role) "
+                    "FROM generate_series(1, :count) AS g RETURNING id"
+                ),
+                {"prefix": f"bench-{run_id}-{role}-", "role": role, "count": count},
+            ).scalars()
+        ]
+
+    (admin_id,) = insert_users("admin", 1)
+    return admin_id, insert_users("coach", COACHES), insert_users("user", USERS_PER_COACH)
+
+
+def _timed_bulk_insert(connection: Connection) -> float:
+    admin_id, coach_ids, user_ids = _seed_people(connection)
+    started = time.perf_counter()
+    inserted = connection.execute(
+        text(
+            "INSERT INTO coach_user_assignments (coach_id, user_id, assigned_by) "
+            "SELECT coach_id, user_id, CAST(:admin_id AS uuid) "
+            "FROM unnest(CAST(:coach_ids AS uuid[])) AS coach_id "
+            "CROSS JOIN unnest(CAST(:user_ids AS uuid[])) AS user_id"
+        ),
+        {"admin_id": admin_id, "coach_ids": coach_ids, "user_ids": user_ids},
+    ).rowcount
+    elapsed = time.perf_counter() - started
+
+    assert inserted == COACHES * USERS_PER_COACH
+    filled = connection.scalar(
+        text(
+            "SELECT COUNT(*) FROM users WHERE id = ANY(CAST(:ids AS uuid[])) "
+            "AND assigned_user_count = :cap"
+        ),
+        {"ids": coach_ids, "cap": USERS_PER_COACH},
+    )
+    assert filled == COACHES
+    return elapsed
+
+
+def test_statement_level_trigger_bulk_insert_10k() -> None:
+    engine = create_engine(PERF_DATABASE_URL)
+    legacy_sql = (
+        MIGRATIONS_SQL_DIR / "202602090009_coach_assignment_statement_triggers_down.sql"
+    ).read_text(encoding="utf-8")
+    try:
+        with engine.connect() as connection:
+            with connection.begin() as transaction:
+                statement_level = _timed_bulk_insert(connection)
+                transaction.rollback()
+
+            # Baseline: swap in the previous per-row triggers inside a rolled-back transaction.
+            with connection.begin() as transaction:
+                connection.execute(text(legacy_sql))
+                per_row = _timed_bulk_insert(connection)
+                transaction.rollback()
+    finally:
+        engine.dispose()
+
+    # One trigger call per statement instead of per row; locally the gap is ~4x.
+    assert statement_level * 2 <= per_row, (
+        f"10k coach assignments: per-row triggers={per_row * 1000:.0f}ms "
+        f"statement-level={statement_level * 1000:.0f}ms"
+    )
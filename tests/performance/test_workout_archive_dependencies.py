@@ -0,0 +1,160 @@
+"""Benchmark: archive dependency check for 50 workouts, with and without workout-side indexes.
+
+Requires PERF_DATABASE_URL pointing at a database migrated to head. All writes happen
+in transactions that are rolled back.
+"""
+
+from __future__ import annotations
+
+import time
+from uuid import UUID, uuid4
+
+import pytest
+from perf_support import PERF_DATABASE_URL, best_interleaved
+from services.workouts import _blocking_plans
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+WORKOUTS = 5_000
+PLANS = 20_000  # 3 days x 4 workouts each: 240k plan_day_workouts rows.
+ACTIVE_EVERY = 10
+CHECKED_WORKOUTS = 50
+ROUNDS = 7
+
+pytestmark = pytest.mark.skipif(PERF_DATABASE_URL is None, reason="PERF_DATABASE_URL is not set")
+
+
+def _seed(connection: Connection) -> list[UUID]:
+    run_id = uuid4().hex[:8]
+    workout_ids = list(
+        connection.execute(
+            text(
+                "INSERT INTO workouts (name, type) "
+                "SELECT 'Bench ' || :run || ' ' || g, 'strength'::workout_type "
+                "FROM generate_series(1, :count) AS g RETURNING id"
+            ),
+            {"run": run_id, "count": WORKOUTS},
+        ).scalars()
+    )
+    connection.execute(
+        text(
+            "CREATE TEMP TABLE bench_workouts ON COMMIT DROP AS "
+            "SELECT id, row_number() OVER (ORDER BY id) - 1 AS slot "
+            "FROM unnest(CAST(:ids AS uuid[])) AS id"
+        ),
+        {"ids": workout_ids},
+    )
+    coach_id = connection.execute(
+        text(
+            "INSERT INTO users (name, email, role) "
+            "VALUES ('Bench Coach', :email, 'coach'::user_role) RETURNING id"
+        ),
+        {"email": f"bench-{run_id}-coach@perf.test"},
+    ).scalar_one()
+    connection.execute(
+        text(
+            "INSERT INTO users (name, email, role) "
+            "SELECT 'Bench ' || g, :prefix || g || '@perf.test', 'user'::user_role "
+            "FROM generate_series(1, :count) AS g"
+        ),
+        {"prefix": f"bench-{run_id}-user-", "count": PLANS},
+    )
+    connection.execute(
+        text(
+            "INSERT INTO workout_plans (name, coach_id, start_date, end_date) "
+            "SELECT 'Bench Plan ' || g, :coach_id, DATE '2026-01-01', DATE '2026-12-31' "
+            "FROM generate_series(1, :count) AS g"
+        ),
+        {"coach_id": coach_id, "count": PLANS},
+    )
+    connection.execute(
+        text(
+            "CREATE TEMP TABLE bench_plans ON COMMIT DROP AS "
+            "SELECT id, row_number() OVER (ORDER BY id) AS slot "
+            "FROM workout_plans WHERE coach_id = :coach_id"
+        ),
+        {"coach_id": coach_id},
+    )
+    connection.execute(
+        text(
+            "INSERT INTO plan_days (plan_id, day_of_week) "
+            "SELECT bench_plans.id, day FROM bench_plans CROSS JOIN generate_series(0, 2) AS day"
+        )
+    )
+    connection.execute(
+        text(
+            "INSERT INTO plan_day_workouts (plan_day_id, workout_id) "
+            "SELECT plan_days.id, bench_workouts.id "
+            "FROM bench_plans "
+            "JOIN plan_days ON plan_days.plan_id = bench_plans.id "
+            "CROSS JOIN generate_series(0, 3) AS pick "
+            "JOIN bench_workouts ON bench_workouts.slot = "
+            "(bench_plans.slot * 12 + plan_days.day_of_week * 4 + pick) % :workouts"
+        ),
+        {"workouts": WORKOUTS},
+    )
+    connection.execute(
+        text(
+            "INSERT INTO plan_assignments (plan_id, user_id, status) "
+            "SELECT bench_plans.id, users.id, "
+            "CASE WHEN bench_plans.slot % :active_every = 0 THEN 'active' ELSE 'inactive' END"
+            "::plan_assignment_status "
+            "FROM bench_plans "
+            "JOIN (SELECT id, row_number() OVER (ORDER BY id) AS slot FROM users "
+            "WHERE email LIKE :prefix) AS users ON users.slot = bench_plans.slot"
+        ),
+        {"active_every": ACTIVE_EVERY, "prefix": f"bench-{run_id}-user-%"},
+    )
+    connection.execute(
+        text(
+            "ANALYZE users, workouts, workout_plans, plan_days, plan_day_workouts, plan_assignments"
+        )
+    )
+    return workout_ids[:CHECKED_WORKOUTS]
+
+
+def _check_ms(session: Session, workout_ids: list[UUID], blocking_counts: list[int]) -> float:
+    started = time.perf_counter()
+    blocking = _blocking_plans(session, workout_ids)
+    elapsed = (time.perf_counter() - started) * 1000
+    blocking_counts.append(sum(len(plans) for plans in blocking.values()))
+    return elapsed
+
+
+def test_archive_dependency_check_uses_workout_side_indexes() -> None:
+    engine = create_engine(PERF_DATABASE_URL)
+    indexed_blocking: list[int] = []
+    scan_blocking: list[int] = []
+    try:
+        with engine.connect() as connection:
+            with connection.begin() as transaction:
+                workout_ids = _seed(connection)
+                session = Session(bind=connection)
+
+                def without_indexes() -> float:
+                    # Baseline: the same check before migration 202602090013; the savepoint
+                    # brings the indexes back for the next indexed round.
+                    connection.execute(text("SAVEPOINT without_indexes"))
+                    connection.execute(text("DROP INDEX ix_plan_day_workouts_workout_id"))
+                    connection.execute(text("DROP INDEX ix_plan_assignments_active_plan_id"))
+                    elapsed = _check_ms(session, workout_ids, scan_blocking)
+                    connection.execute(text("ROLLBACK TO SAVEPOINT without_indexes"))
+                    return elapsed
+
+                scan_ms, indexed_ms = best_interleaved(
+                    without_indexes,
+                    lambda: _check_ms(session, workout_ids, indexed_blocking),
+                    rounds=ROUNDS,
+                )
+                session.close()
+                transaction.rollback()
+    finally:
+        engine.dispose()
+
+    assert set(indexed_blocking) == set(scan_blocking) and indexed_blocking[0] > 0
+    # Both indexes let the check start from the 50 workouts; locally the gap is ~4x.
+    assert indexed_ms * 2 <= scan_ms, (
+        f"Dependency check for {CHECKED_WORKOUTS} workouts over {PLANS * 12} plan slots: "
+        f"without indexes={scan_ms:.2f}ms with indexes={indexed_ms:.2f}ms"
+    )
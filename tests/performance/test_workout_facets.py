@@ -0,0 +1,227 @@
+"""Benchmark: faceted browse over 10k workouts, one query per facet vs cached bitmaps."""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from datetime import datetime, timezone
+from uuid import UUID, uuid4
+
+from models import Base
+from models.enums import WorkoutType
+from models.stats import WorkoutCatalogVersion
+from models.workout import CardioType, MuscleGroup, Workout, WorkoutMuscleGroup
+from perf_support import best_interleaved
+from schemas.workouts import WorkoutBrowseQuery, WorkoutBrowseResponse
+from services.workout_catalog import WorkoutCatalogCache, browse_workout_catalog
+from sqlalchemy import and_, create_engine, exists, func, insert, select
+from sqlalchemy.orm import Session, sessionmaker
+
+WORKOUTS = 10_000
+MUSCLE_GROUPS = 7
+CARDIO_TYPES = 4
+REQUESTS = 5
+ROUNDS = 3
+
+
+def _legacy_browse(db: Session, query: WorkoutBrowseQuery) -> WorkoutBrowseResponse:
+    """The naive browse: a page query, a count query and one grouped query per facet."""
+
+    archived = Workout.is_archived.is_(False)
+    by_type = Workout.type == query.type
+    by_muscle_group = exists().where(
+        WorkoutMuscleGroup.workout_id == Workout.id,
+        WorkoutMuscleGroup.muscle_group_id == query.muscle_group_id,
+    )
+    filters = (archived, by_type, by_muscle_group)
+
+    workouts = db.scalars(
+        select(Workout)
+        .where(*filters)
+        .order_by(Workout.name)
+        .limit(query.page_size)
+        .offset((query.page - 1) * query.page_size)
+    ).all()
+    links = db.execute(
+        select(WorkoutMuscleGroup.workout_id, WorkoutMuscleGroup.muscle_group_id).where(
+            WorkoutMuscleGroup.workout_id.in_([workout.id for workout in workouts])
+        )
+    ).all()
+    total = db.scalar(select(func.count(Workout.id)).where(*filters))
+    muscle_group_counts = dict(
+        db.execute(
+            select(MuscleGroup.id, func.count(Workout.id))
+            .outerjoin(WorkoutMuscleGroup, WorkoutMuscleGroup.muscle_group_id == MuscleGroup.id)
+            .outerjoin(
+                Workout, and_(Workout.id == WorkoutMuscleGroup.workout_id, archived, by_type)
+            )
+            .group_by(MuscleGroup.id)
+        ).all()
+    )
+    cardio_type_counts = dict(
+        db.execute(
+            select(CardioType.id, func.count(Workout.id))
+            .outerjoin(
+                Workout,
+                and_(Workout.cardio_type_id == CardioType.id, archived, by_type, by_muscle_group),
+            )
+            .group_by(CardioType.id)
+        ).all()
+    )
+    type_counts = dict(
+        db.execute(
+            select(Workout.type, func.count(Workout.id))
+            .where(archived, by_muscle_group)
+            .group_by(Workout.type)
+        ).all()
+    )
+    muscle_group_ids: dict[UUID, list[UUID]] = {}
+    for workout_id, muscle_group_id in links:
+        muscle_group_ids.setdefault(workout_id, []).append(muscle_group_id)
+    names = dict(db.execute(select(MuscleGroup.id, MuscleGroup.name)).all())
+    cardio_names = dict(db.execute(select(CardioType.id, CardioType.name)).all())
+
+    return WorkoutBrowseResponse.model_validate(
+        {
+            "version": 0,
+            "items": [
+                {
+                    **{
+                        column: getattr(workout, column)
+                        for column in (
+                            "id",
+                            "name",
+                            "description",
+                            "instructions",
+                            "type",
+                            "cardio_type_id",
+                            "is_archived",
+                            "created_at",
+                            "updated_at",
+                        )
+                    },
+                    "muscle_group_ids": muscle_group_ids.get(workout.id, []),
+                }
+                for workout in workouts
+            ],
+            "page": query.page,
+            "page_size": query.page_size,
+            "total": total,
+            "muscle_groups": [
+                {"id": key, "name": names[key], "count": count}
+                for key, count in muscle_group_counts.items()
+            ],
+            "cardio_types": [
+                {"id": key, "name": cardio_names[key], "count": count}
+                for key, count in cardio_type_counts.items()
+            ],
+            "types": [
+                {"type": workout_type, "count": type_counts.get(workout_type, 0)}
+                for workout_type in WorkoutType
+            ],
+        }
+    )
+
+
+def _seeded_sessions() -> tuple[sessionmaker[Session], UUID]:
+    engine = create_engine("sqlite+pysqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    muscle_group_ids = [uuid4() for _ in range(MUSCLE_GROUPS)]
+    cardio_type_ids = [uuid4() for _ in range(CARDIO_TYPES)]
+    workout_ids = [uuid4() for _ in range(WORKOUTS)]
+    now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    with engine.begin() as connection:
+        connection.execute(
+            insert(MuscleGroup),
+            [
+                {"id": key, "name": f"Group {index}", "icon": "icon", "is_default": True}
+                for index, key in enumerate(muscle_group_ids)
+            ],
+        )
+        connection.execute(
+            insert(CardioType),
+            [
+                {"id": key, "name": f"Cardio {index}", "description": "Bench cardio"}
+                for index, key in enumerate(cardio_type_ids)
+            ],
+        )
+        connection.execute(
+            insert(Workout),
+            [
+                {
+                    "id": key,
+                    "name": f"Bench Workout {index:05d}",
+                    "type": WorkoutType.CARDIO if index % 3 == 0 else WorkoutType.STRENGTH,
+                    "cardio_type_id": (
+                        cardio_type_ids[index % CARDIO_TYPES] if index % 3 == 0 else None
+                    ),
+                    "is_archived": index % 10 == 0,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for index, key in enumerate(workout_ids)
+            ],
+        )
+        connection.execute(
+            insert(WorkoutMuscleGroup),
+            [
+                {
+                    "workout_id": key,
+                    "muscle_group_id": muscle_group_ids[(index + offset) % MUSCLE_GROUPS],
+                }
+                for index, key in enumerate(workout_ids)
+                for offset in (0, 3)
+            ],
+        )
+        connection.execute(insert(WorkoutCatalogVersion), [{"id": 1, "version": 1}])
+    return sessionmaker(bind=engine, expire_on_commit=False), muscle_group_ids[0]
+
+
+def _ms_per_request(
+    sessions: sessionmaker[Session],
+    browse: Callable[[Session, WorkoutBrowseQuery], WorkoutBrowseResponse],
+    query: WorkoutBrowseQuery,
+) -> float:
+    started = time.perf_counter()
+    for _ in range(REQUESTS):
+        with sessions() as db:
+            page = browse(db, query)
+    elapsed = time.perf_counter() - started
+
+    assert len(page.items) == query.page_size
+    return elapsed * 1000 / REQUESTS
+
+
+def test_bitmap_facets_beat_per_facet_queries_10k() -> None:
+    sessions, muscle_group_id = _seeded_sessions()
+    query = WorkoutBrowseQuery(page=3, type=WorkoutType.STRENGTH, muscle_group_id=muscle_group_id)
+    # Probe the version on every request, as a zero probe interval would.
+    cache = WorkoutCatalogCache(probe_interval=0)
+
+    def cached_browse(db: Session, browse_query: WorkoutBrowseQuery) -> WorkoutBrowseResponse:
+        return browse_workout_catalog(cache.get(db), browse_query)
+
+    with sessions() as db:
+        legacy = _legacy_browse(db, query)
+        current = cached_browse(db, query)
+    # Same page, total and facet counts either way.
+    assert [(item.id, set(item.muscle_group_ids)) for item in legacy.items] == [
+        (item.id, set(item.muscle_group_ids)) for item in current.items
+    ]
+    assert legacy.total == current.total
+    assert sorted(legacy.muscle_groups, key=str) == sorted(current.muscle_groups, key=str)
+    assert sorted(legacy.cardio_types, key=str) == sorted(current.cardio_types, key=str)
+    assert legacy.types == current.types
+
+    before, after = best_interleaved(
+        lambda: _ms_per_request(sessions, _legacy_browse, query),
+        lambda: _ms_per_request(sessions, cached_browse, query),
+        rounds=ROUNDS,
+    )
+
+    assert cache.reloads == 1
+    # Bitmaps replace the count and per-facet queries; locally the gap is over 100x.
+    assert after * 20 <= before, (
+        f"Faceted browse over {WORKOUTS} workouts, ms/request: "
+        f"per-facet queries={before:.2f} cached bitmaps={after:.2f}"
+    )